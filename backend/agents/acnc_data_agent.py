@@ -11,6 +11,13 @@ import re
 from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 import time
+import os
+import sys
+
+# Add the backend directory to the Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.phone_normalizer import extract_phone
 
 class ACNCDataAgent:
     def __init__(self):
@@ -447,22 +454,7 @@ class ACNCDataAgent:
         phone_clean = str(phone_text).strip()
         phone_clean = re.sub(r'[^\d\s\(\)\+\-]', '', phone_clean)
         
-        # Australian phone number patterns
-        phone_patterns = [
-            r'(\+61\s*[2-8]\s*\d{4}\s*\d{4})',   # +61 X XXXX XXXX
-            r'(1800\s*\d{3}\s*\d{3})',           # 1800 XXX XXX
-            r'(1300\s*\d{3}\s*\d{3})',           # 1300 XXX XXX
-            r'(13\s*\d{2}\s*\d{2})',             # 13 XX XX
-            r'(\(0[2-8]\)\s*\d{4}\s*\d{4})',     # (0X) XXXX XXXX
-            r'(0[2-8]\s*\d{4}\s*\d{4})',         # 0X XXXX XXXX
-        ]
-        
-        for pattern in phone_patterns:
-            match = re.search(pattern, phone_clean)
-            if match:
-                return match.group().strip()
-        
-        return phone_clean.strip() if phone_clean.strip() else ""
+        return extract_phone(phone_clean) or phone_clean.strip()
     
     def clean_website(self, website_text):
         """Clean and standardize website URLs"""
@@ -5,229 +5,326 @@ Reviews standardized contact data for quality, completeness, and potential issue
 Uses AI-powered analysis to validate and score data quality
 """
 
+import argparse
 import pandas as pd
+import numpy as np
 import json
-import re
+import hashlib
+import time
 from datetime import datetime
-from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+import os
+import sys
+
+# Add the backend directory to the Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.phone_normalizer import normalize_phone_series
+from utils.standardized_store import load_standardized_contacts
+from utils.name_clusterer import cluster_names, cluster_summary
+from utils.rule_engine import RuleSet
+from utils.sampling import stratified_sample, StratifiedEstimator
+from utils.website_checker import WebsiteChecker
+from utils.lookalike_index import LookalikeIndex
+
+# Declarative rule specification (rules, score components, weights)
+RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'critic_rules.json')
+
+# Columns the per-record rules read; a record's verdicts are cached by their hash
+RULE_COLUMNS = ['contact_type', 'contact_value', 'organization_name', 'organization_type', 'source_agent',
+                'address', 'suburb', 'state', 'services', 'confidence_score']
+VERDICT_CACHE_VERSION = 1
+
+# Uncached records are split by source across worker processes above this size
+PARALLEL_MIN_RECORDS = 200000
+
+# Stages comparing records with each other (shared contacts, name variants,
+# imitated domains) would miss most pairs in a sample, so they always scan every record
+FULL_SCAN_STAGES = ['inconsistency_detection', 'lookalike_domains']
+
+
+def evaluate_partition(records, rule_spec):
+    """Worker entry point: per-record verdicts and rule timings for one partition of records"""
+    rules = RuleSet(rule_spec)
+    checks = rules.evaluate(records)
+    verdicts = checks.assign(source_agent=records['source_agent'], confidence_score=records['confidence_score'])
+    return verdicts, rules.timings
+
+
+def empty_aggregates():
+    return {'records': 0, 'rules': {}, 'sources': {}, 'confidence': {}}
+
+
+def merge_aggregates(base, delta, sign=1):
+    """Add (sign=1) or remove (sign=-1) partial aggregates; counts and sums merge by addition"""
+    merged = {
+        'records': base['records'] + sign * delta['records'],
+        'rules': dict(base['rules']),
+        'sources': {source: dict(stats) for source, stats in base['sources'].items()},
+        'confidence': dict(base['confidence'])
+    }
+    for rule, count in delta['rules'].items():
+        merged['rules'][rule] = merged['rules'].get(rule, 0) + sign * count
+    for source, stats in delta['sources'].items():
+        totals = merged['sources'].setdefault(source, {'record_count': 0, 'confidence_sum': 0.0, 'confidence_count': 0})
+        for key, value in stats.items():
+            totals[key] += sign * value
+    for bucket, count in delta['confidence'].items():
+        merged['confidence'][bucket] = merged['confidence'].get(bucket, 0) + sign * count
+    
+    merged['sources'] = {source: stats for source, stats in merged['sources'].items() if stats['record_count']}
+    merged['confidence'] = {bucket: count for bucket, count in merged['confidence'].items() if count}
+    return merged
 
 class CriticAgent:
-    def __init__(self):
+    def __init__(self, rules_file=RULES_FILE, sample=False, check_websites=False):
         self.input_file = 'data/standardized_contacts.csv'
         self.output_file = 'data/reports/critic_report.json'
-        
-        self.quality_rules = {
-            'phone_validation': {
-                'australian_format': r'^(\+61|0)[2-9]\d{8}$|^(1800|1300|13)\d{6}$|^13\d{4}$',
-                'international_format': r'^\+\d{1,3}\d{4,14}$'
-            },
-            'email_validation': {
-                'basic_format': r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            },
-            'website_validation': {
-                'url_format': r'^https?://.+\..+$',
-                'gov_domain': r'\.gov\.au$',
-                'org_domain': r'\.(org|com|net)\.au$'
-            }
-        }
-        
-        self.quality_weights = {
-            'format_compliance': 0.3,
-            'completeness': 0.25,
-            'source_reliability': 0.2,
-            'consistency': 0.15,
-            'freshness': 0.1
-        }
+        self.verdict_cache_file = 'data/reports/critic_verdicts.pkl'
+        
+        # Rules, score components and weights come from the rule specification
+        self.rules = RuleSet.from_file(rules_file)
+        self.quality_weights = self.rules.weights
+        self.required_fields = self.rules.fields['required']
+        self.optional_fields = self.rules.fields['optional']
+        self.rule_timings = defaultdict(float)
+        
+        # Sampling mode: per-record checks on a stratified sample of large datasets
+        self.sample = sample
+        self.sampling = self.rules.spec.get('sampling', {})
+        self.escalations = []
+        
+        # Optional network stage: liveness, redirects and TLS of website contacts
+        self.website_checker = WebsiteChecker() if check_websites else None
     
     def load_standardized_data(self):
         """Load the standardized contact dataset"""
-        filepath = Path(self.input_file)
-        if not filepath.exists():
+        df = load_standardized_contacts(self.input_file)
+        if df is None:
             print(f"Error: {self.input_file} not found")
             print("Run data_standardizer.py first to create standardized dataset")
             return None
         
-        df = pd.read_csv(filepath)
         print(f"Loaded {len(df)} standardized contact records")
         return df
     
-    def validate_phone_numbers(self, df):
+    def _text(self, values):
+        """Column as strings the way str() renders each cell ('nan' for missing values)"""
+        return values.astype(str).fillna('nan')
+    
+    def _per_value(self, values, rule):
+        """Apply a Series -> Series rule once per distinct value and broadcast it back"""
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        verdicts = rule(pd.Series(uniques, dtype=object))
+        return pd.Series(verdicts.to_numpy()[codes], index=values.index)
+    
+    def _issue_records(self, df, mask, fields, issue):
+        """Issue dicts for the masked rows: {output key: column} plus a fixed issue text"""
+        issues = df.loc[mask, list(fields.values())].rename(columns={col: key for key, col in fields.items()})
+        issues['issue'] = issue
+        return issues.to_dict('records')
+    
+    def evaluate_record_rules(self, df):
+        """Evaluate every per-record rule of the specification in one pass
+        
+        Returns a DataFrame aligned with df holding the cleaned values and one
+        boolean verdict column per rule; the validate_* and analyze_* methods
+        aggregate these columns instead of re-scanning the records. Each rule's
+        time is added to self.rule_timings.
+        """
+        checks = self.rules.evaluate(df)
+        for rule, seconds in self.rules.timings.items():
+            self.rule_timings[rule] += seconds
+        return checks
+    
+    def validate_phone_numbers(self, df, checks=None, aggregates=None):
         """Validate phone number formats and patterns"""
-        phone_records = df[df['contact_type'] == 'phone'].copy()
-        if len(phone_records) == 0:
+        checks = self.evaluate_record_rules(df) if checks is None else checks
+        counts = self._rule_counts(df, checks, aggregates)
+        total = counts['is_phone']
+        if total == 0:
             return {}
         
-        print(f"  Validating {len(phone_records)} phone numbers...")
+        print(f"  Validating {total} phone numbers...")
         
+        records = df.assign(phone=checks['phone'])
+        invalid = checks['is_phone'] & ~checks['phone_australian'] & ~checks['phone_international']
         validation_results = {
-            'total_phones': len(phone_records),
-            'valid_australian': 0,
-            'valid_international': 0,
-            'invalid_format': 0,
-            'suspicious_patterns': [],
-            'quality_issues': []
+            'total_phones': total,
+            'valid_australian': counts['phone_australian'],
+            'valid_international': counts['phone_international'],
+            'invalid_format': total - counts['phone_australian'] - counts['phone_international'],
+            'suspicious_patterns': self._issue_records(
+                records, checks['phone_suspicious'],
+                {'contact_id': 'contact_id', 'phone': 'phone'}, 'Suspicious pattern detected'),
+            'quality_issues': self._issue_records(
+                records, invalid,
+                {'contact_id': 'contact_id', 'phone': 'phone', 'organization': 'organization_name'},
+                'Invalid phone format')
         }
         
-        aus_pattern = re.compile(self.quality_rules['phone_validation']['australian_format'])
-        intl_pattern = re.compile(self.quality_rules['phone_validation']['international_format'])
-        
-        for idx, row in phone_records.iterrows():
-            phone = str(row['contact_value']).strip()
-            
-            # Clean phone for validation
-            clean_phone = re.sub(r'[^\d+()]', '', phone)
-            
-            if aus_pattern.match(clean_phone):
-                validation_results['valid_australian'] += 1
-            elif intl_pattern.match(clean_phone):
-                validation_results['valid_international'] += 1
-            else:
-                validation_results['invalid_format'] += 1
-                validation_results['quality_issues'].append({
-                    'contact_id': row['contact_id'],
-                    'phone': phone,
-                    'organization': row['organization_name'],
-                    'issue': 'Invalid phone format'
-                })
-            
-            # Check for suspicious patterns
-            if '0000' in clean_phone or len(set(clean_phone.replace('+', ''))) <= 2:
-                validation_results['suspicious_patterns'].append({
-                    'contact_id': row['contact_id'],
-                    'phone': phone,
-                    'issue': 'Suspicious pattern detected'
-                })
-        
         validation_results['format_compliance_rate'] = (
             (validation_results['valid_australian'] + validation_results['valid_international']) 
             / validation_results['total_phones']
-        ) if validation_results['total_phones'] > 0 else 0
+        )
         
         return validation_results
     
-    def validate_emails(self, df):
+    def validate_emails(self, df, checks=None, aggregates=None):
         """Validate email address formats"""
-        email_records = df[df['contact_type'] == 'email'].copy()
-        if len(email_records) == 0:
+        checks = self.evaluate_record_rules(df) if checks is None else checks
+        counts = self._rule_counts(df, checks, aggregates)
+        total = counts['is_email']
+        if total == 0:
             return {}
         
-        print(f"  Validating {len(email_records)} email addresses...")
+        print(f"  Validating {total} email addresses...")
         
+        invalid = checks['is_email'] & ~checks['email_valid']
         validation_results = {
-            'total_emails': len(email_records),
-            'valid_format': 0,
-            'invalid_format': 0,
-            'gov_domains': 0,
-            'quality_issues': []
+            'total_emails': total,
+            'valid_format': counts['email_valid'],
+            'invalid_format': total - counts['email_valid'],
+            'gov_domains': counts['email_gov'],
+            'quality_issues': self._issue_records(
+                df.assign(email=checks['email']), invalid,
+                {'contact_id': 'contact_id', 'email': 'email', 'organization': 'organization_name'},
+                'Invalid email format')
         }
         
-        email_pattern = re.compile(self.quality_rules['email_validation']['basic_format'])
-        
-        for idx, row in email_records.iterrows():
-            email = str(row['contact_value']).strip().lower()
-            
-            if email_pattern.match(email):
-                validation_results['valid_format'] += 1
-                
-                if '.gov.au' in email:
-                    validation_results['gov_domains'] += 1
-            else:
-                validation_results['invalid_format'] += 1
-                validation_results['quality_issues'].append({
-                    'contact_id': row['contact_id'],
-                    'email': email,
-                    'organization': row['organization_name'],
-                    'issue': 'Invalid email format'
-                })
-        
         validation_results['format_compliance_rate'] = (
             validation_results['valid_format'] / validation_results['total_emails']
-        ) if validation_results['total_emails'] > 0 else 0
+        )
         
         return validation_results
     
-    def validate_websites(self, df):
+    def validate_websites(self, df, checks=None, aggregates=None):
         """Validate website URLs"""
-        website_records = df[df['contact_type'] == 'website'].copy()
-        if len(website_records) == 0:
+        checks = self.evaluate_record_rules(df) if checks is None else checks
+        counts = self._rule_counts(df, checks, aggregates)
+        total = counts['is_website']
+        if total == 0:
             return {}
         
-        print(f"  Validating {len(website_records)} websites...")
+        print(f"  Validating {total} websites...")
         
         validation_results = {
-            'total_websites': len(website_records),
-            'valid_format': 0,
-            'gov_domains': 0,
-            'https_secured': 0,
-            'quality_issues': []
+            'total_websites': total,
+            'valid_format': counts['website_valid'],
+            'gov_domains': counts['website_gov'],
+            'https_secured': counts['website_https'],
+            'quality_issues': self._issue_records(
+                df.assign(website=checks['website']), checks['is_website'] & ~checks['website_valid'],
+                {'contact_id': 'contact_id', 'website': 'website', 'organization': 'organization_name'},
+                'Invalid URL format')
         }
         
-        url_pattern = re.compile(self.quality_rules['website_validation']['url_format'])
-        
-        for idx, row in website_records.iterrows():
-            website = str(row['contact_value']).strip().lower()
-            
-            if url_pattern.match(website):
-                validation_results['valid_format'] += 1
-                
-                if '.gov.au' in website:
-                    validation_results['gov_domains'] += 1
-                
-                if website.startswith('https://'):
-                    validation_results['https_secured'] += 1
-            else:
-                validation_results['quality_issues'].append({
-                    'contact_id': row['contact_id'],
-                    'website': website,
-                    'organization': row['organization_name'],
-                    'issue': 'Invalid URL format'
-                })
-        
         validation_results['format_compliance_rate'] = (
             validation_results['valid_format'] / validation_results['total_websites']
-        ) if validation_results['total_websites'] > 0 else 0
+        )
         
         return validation_results
     
-    def analyze_completeness(self, df):
+    def verify_websites(self, df, checks):
+        """Liveness, redirect and TLS verification of every well-formed website
+        
+        Each distinct URL is requested at most once per cache interval; URLs
+        left when the time budget runs out are counted as unchecked.
+        """
+        urls = self._text(df.loc[checks['website_valid'], 'contact_value']).str.strip()
+        print(f"  Verifying {urls.nunique()} websites (budget {self.website_checker.budget}s)...")
+        results, stats = self.website_checker.check(urls.tolist())
+        
+        verification = dict(stats)
+        checked = list(results.values())
+        verification['alive'] = sum(result['alive'] for result in checked)
+        verification['dead'] = sum(not result['alive'] for result in checked)
+        verification['redirected_offsite'] = sum(result['redirect_offsite'] for result in checked)
+        verification['tls_invalid'] = sum(result['tls_valid'] is False for result in checked)
+        latencies = [result['latency_ms'] for result in checked if result['alive']]
+        verification['avg_latency_ms'] = sum(latencies) / len(latencies) if latencies else None
+        
+        def issue(result):
+            if result is None:
+                return None
+            if not result['alive']:
+                return f"Website unreachable ({result['status'] or result['error']})"
+            if result['redirect_offsite']:
+                return f"Website redirects to another site ({result['final_url']})"
+            if result['tls_valid'] is False:
+                return 'Website has an invalid TLS certificate'
+            return None
+        
+        url_issues = {url: issue(result) for url, result in results.items()}
+        records = df.loc[urls.index].assign(website=urls, issue=urls.map(url_issues))
+        for field in ('status', 'final_url'):
+            records[field] = pd.Series([results[url][field] if url in results else None for url in urls],
+                                       index=urls.index, dtype=object)
+        flagged = records[records['issue'].notna()]
+        verification['quality_issues'] = flagged[['contact_id', 'website', 'organization_name', 'status',
+                                                  'final_url', 'issue']].rename(
+            columns={'organization_name': 'organization'}).to_dict('records')
+        return verification
+    
+    def detect_lookalike_domains(self, df):
+        """Website and email domains that imitate a legitimate contact's domain
+        
+        Legitimate domains are those of every non-threat contact, so only
+        threat or unrelated domains can be reported.
+        """
+        index = LookalikeIndex.from_contacts(df)
+        candidates = df[df['contact_type'].isin(['website', 'email'])]
+        values = self._text(candidates['contact_value'])
+        started = time.perf_counter()
+        matches = index.screen(values.unique())
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        flagged = candidates[values.isin(list(matches))]
+        issues = []
+        for record, value in zip(flagged.to_dict('records'), values[flagged.index]):
+            closest = matches[value][0]
+            issues.append({
+                'contact_id': record['contact_id'],
+                'value': value,
+                'organization': record['organization_name'],
+                'lookalike_of': closest['domain'],
+                'match': closest['match'],
+                'issue': f"Domain imitates {closest['domain']} ({closest['match']})"
+            })
+        
+        return {
+            'legitimate_domains': len(index),
+            'screened_values': int(values.nunique()),
+            'lookalike_values': len(matches),
+            'screening_ms': round(elapsed_ms, 2),
+            'issues': issues
+        }
+    
+    def analyze_completeness(self, df, checks=None, aggregates=None):
         """Analyze data completeness across records"""
         print(f"  Analyzing data completeness...")
+        checks = self.evaluate_record_rules(df) if checks is None else checks
+        counts = self._rule_counts(df, checks, aggregates)
+        
+        # One issue per missing required field, ordered by record then field
+        missing = checks[[f'missing_{field}' for field in self.required_fields]].to_numpy()
+        rows, fields = missing.nonzero()
+        missing_data_issues = pd.DataFrame({
+            'contact_id': df['contact_id'].to_numpy()[rows],
+            'missing_field': pd.Series(self.required_fields, dtype=object).to_numpy()[fields],
+            'organization': df['organization_name'].to_numpy()[rows]
+        }).to_dict('records')
         
         completeness_analysis = {
-            'total_records': len(df),
-            'required_fields_complete': 0,
-            'optional_fields_complete': 0,
-            'missing_data_issues': []
+            'total_records': aggregates['records'] if aggregates else len(df),
+            'required_fields_complete': counts['required_complete'],
+            'optional_fields_complete': counts['optional_complete'],
+            'missing_data_issues': missing_data_issues
         }
         
-        required_fields = ['contact_value', 'organization_name', 'organization_type', 'source_agent']
-        optional_fields = ['address', 'suburb', 'state', 'services']
-        
-        for idx, row in df.iterrows():
-            # Check required fields
-            required_complete = True
-            for field in required_fields:
-                if pd.isna(row[field]) or str(row[field]).strip() == '':
-                    required_complete = False
-                    completeness_analysis['missing_data_issues'].append({
-                        'contact_id': row['contact_id'],
-                        'missing_field': field,
-                        'organization': row['organization_name']
-                    })
-            
-            if required_complete:
-                completeness_analysis['required_fields_complete'] += 1
-            
-            # Check optional fields
-            optional_count = 0
-            for field in optional_fields:
-                if pd.notna(row[field]) and str(row[field]).strip() != '':
-                    optional_count += 1
-            
-            if optional_count >= len(optional_fields) * 0.5:  # At least 50% complete
-                completeness_analysis['optional_fields_complete'] += 1
-        
         completeness_analysis['required_completeness_rate'] = (
             completeness_analysis['required_fields_complete'] / completeness_analysis['total_records']
         )
@@ -238,7 +335,7 @@ class CriticAgent:
         
         return completeness_analysis
     
-    def analyze_source_reliability(self, df):
+    def analyze_source_reliability(self, df, aggregates=None):
         """Analyze reliability of data sources"""
         print(f"  Analyzing source reliability...")
         
@@ -248,63 +345,337 @@ class CriticAgent:
             'total_by_confidence': defaultdict(int)
         }
         
-        # Define source reliability scores
-        source_reliability = {
-            'nsw_hospitals_agent': 0.95,       # Official API
-            'government_services_scraper': 0.90, # Official gov directory
-            'scamwatch_threat_agent': 0.85,   # Official scam reporting
-            'acnc_data_agent': 0.80,          # Official charity register
-            'website_contact_scraper': 0.70,  # Secondary scraping
-        }
+        # Source reliability scores from the rule specification
+        source_reliability = self.rules.source_reliability
+        
+        if aggregates is None:
+            aggregates = self.aggregate_verdicts(df[['source_agent', 'confidence_score']])
         
-        for source in df['source_agent'].unique():
-            source_data = df[df['source_agent'] == source]
+        for source, stats in aggregates['sources'].items():
             source_analysis['sources'][source] = {
-                'record_count': len(source_data),
-                'avg_confidence': source_data['confidence_score'].mean(),
+                'record_count': stats['record_count'],
+                'avg_confidence': (stats['confidence_sum'] / stats['confidence_count']
+                                   if stats['confidence_count'] else float('nan')),
                 'reliability_score': source_reliability.get(source, 0.5)
             }
         
-        # Analyze confidence score distribution
-        for idx, row in df.iterrows():
-            confidence_bucket = f"{row['confidence_score']:.1f}"
-            source_analysis['total_by_confidence'][confidence_bucket] += 1
+        # Confidence score distribution
+        for bucket, count in aggregates['confidence'].items():
+            source_analysis['total_by_confidence'][bucket] += count
         
         return source_analysis
     
+    def record_verdicts(self, df, checks):
+        """Per-record verdicts plus the fields aggregated per source"""
+        return checks.assign(source_agent=df['source_agent'], confidence_score=df['confidence_score'])
+    
+    def aggregate_verdicts(self, verdicts, weights=None):
+        """Mergeable partial aggregates (counts and sums) over record verdicts
+        
+        weights gives how many records share each verdict row (default one each);
+        sampling weights give estimated counts, rounded to whole records.
+        """
+        weights = pd.Series(1 if weights is None else weights, index=verdicts.index)
+        aggregates = empty_aggregates()
+        aggregates['records'] = int(round(weights.sum()))
+        
+        rule_columns = [column for column in verdicts.columns if verdicts[column].dtype == bool]
+        aggregates['rules'] = {column: int(round(count)) for column, count in
+                               verdicts[rule_columns].mul(weights, axis=0).sum().items()}
+        
+        confidence = verdicts['confidence_score']
+        frame = pd.DataFrame({
+            'source_agent': verdicts['source_agent'],
+            'records': weights,
+            'confidence_sum': confidence.fillna(0) * weights,
+            'confidence_count': confidence.notna() * weights
+        })
+        for source, stats in frame.groupby('source_agent', sort=False).sum().iterrows():
+            aggregates['sources'][source] = {
+                'record_count': int(round(stats['records'])),
+                'confidence_sum': float(stats['confidence_sum']),
+                'confidence_count': int(round(stats['confidence_count']))
+            }
+        
+        buckets = frame.groupby(confidence.to_numpy(), sort=False, dropna=False)['records'].sum()
+        for value, count in buckets.items():
+            bucket = f"{value:.1f}"
+            aggregates['confidence'][bucket] = aggregates['confidence'].get(bucket, 0) + int(round(count))
+        return aggregates
+    
+    def _rule_counts(self, df, checks, aggregates):
+        """Rule counts from the aggregates, or summed from the checks"""
+        if aggregates is None:
+            return {column: int(checks[column].sum()) for column in checks.columns if checks[column].dtype == bool}
+        return aggregates['rules']
+    
+    def _rules_version(self):
+        """Fingerprint of the rule configuration; cached verdicts are only valid under it"""
+        config = {
+            'version': VERDICT_CACHE_VERSION,
+            'rules': self.rules.spec['rules'],
+            'outputs': self.rules.spec.get('outputs', {}),
+            'columns': RULE_COLUMNS
+        }
+        encoded = json.dumps(config, sort_keys=True)
+        return hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+    
+    def _evaluate_records(self, records):
+        """Verdicts for uncached records, split by source across workers when large"""
+        if len(records) < PARALLEL_MIN_RECORDS or (os.cpu_count() or 1) < 2:
+            return self.record_verdicts(records, self.evaluate_record_rules(records))
+        
+        partitions = [group for _, group in records.groupby('source_agent', sort=False, dropna=False)]
+        try:
+            with ProcessPoolExecutor(max_workers=min(len(partitions), os.cpu_count())) as executor:
+                results = list(executor.map(evaluate_partition, partitions, repeat(self.rules.spec)))
+        except (OSError, RuntimeError) as e:
+            print(f"  Worker processes unavailable ({e}), validating sequentially")
+            return self.record_verdicts(records, self.evaluate_record_rules(records))
+        
+        for _, timings in results:
+            for rule, seconds in timings.items():
+                self.rule_timings[rule] += seconds
+        return pd.concat([verdicts for verdicts, _ in results])
+    
+    def evaluate_with_cache(self, df):
+        """Per-record rule verdicts and aggregates, re-validating only changed records
+        
+        Verdicts are cached by the hash of each record's rule columns. Aggregates
+        are updated by adding records that appeared and removing records that
+        disappeared since the last run, so the rule work follows the size of the
+        change. Only this rule-verdict stage is incremental: inconsistency,
+        clustering and lookalike detection and the issue listings still scan
+        every record.
+        """
+        hashes = pd.util.hash_pandas_object(df[RULE_COLUMNS], index=False).to_numpy()
+        current = pd.Series(hashes).value_counts(sort=False)
+        
+        cache = self.load_verdict_cache()
+        verdicts, previous, aggregates = cache['verdicts'], cache['hash_counts'], cache['aggregates']
+        
+        # Validate records whose content has not been seen before
+        hash_series = pd.Series(hashes)
+        unseen = ~hash_series.isin(verdicts.index).to_numpy()
+        first_seen = unseen & ~hash_series.duplicated().to_numpy()
+        if first_seen.any():
+            fresh = self._evaluate_records(df[first_seen].set_axis(hashes[first_seen]))
+            verdicts = pd.concat([verdicts, fresh]) if len(verdicts) else fresh
+        print(f"  Re-validated {int(first_seen.sum())} changed records ({int((~unseen).sum())} cached verdicts reused)")
+        
+        # Delta update of the aggregates
+        change = current.sub(previous, fill_value=0).astype(np.int64)
+        added, removed = change[change > 0], -change[change < 0]
+        if len(added):
+            aggregates = merge_aggregates(aggregates, self.aggregate_verdicts(verdicts.loc[added.index], added))
+        if len(removed):
+            aggregates = merge_aggregates(aggregates, self.aggregate_verdicts(verdicts.loc[removed.index], removed), -1)
+        
+        verdicts = verdicts.loc[current.index]
+        self.save_verdict_cache(verdicts, current, aggregates)
+        
+        checks = verdicts.reindex(hashes).set_axis(df.index)
+        return checks, aggregates
+    
+    def load_verdict_cache(self):
+        """Cached verdicts from the last run, or an empty cache if rules changed"""
+        path = Path(self.verdict_cache_file)
+        if path.exists():
+            cache = pd.read_pickle(path)
+            if cache.get('rules_version') == self._rules_version():
+                return cache
+        return {'verdicts': pd.DataFrame(), 'hash_counts': pd.Series(dtype=np.int64), 'aggregates': empty_aggregates()}
+    
+    def save_verdict_cache(self, verdicts, hash_counts, aggregates):
+        Path(self.verdict_cache_file).parent.mkdir(parents=True, exist_ok=True)
+        pd.to_pickle({
+            'rules_version': self._rules_version(),
+            'verdicts': verdicts,
+            'hash_counts': hash_counts,
+            'aggregates': aggregates
+        }, self.verdict_cache_file)
+    
+    def estimate_quality(self, checks, design):
+        """Rate and score estimates with confidence intervals from a stratified sample
+        
+        Component scores follow the rule specification; their intervals come
+        from the linearized ratio estimates, so correlated rates are handled.
+        """
+        estimator = StratifiedEstimator(design, self.sampling.get('confidence_level', 0.95))
+        
+        def ratio(rule, of=None):
+            return estimator.ratio(checks[rule], checks[of] if of else None)
+        
+        # Rates that trigger a full scan when they fall below their threshold
+        rates = {}
+        escalations = []
+        for check in self.sampling.get('escalate_below', []):
+            of = check.get('of')
+            interval = estimator.ratio_interval(checks[check['rule']], checks[of] if of else None)
+            if interval is None:
+                continue
+            rates[check['rule']] = interval
+            if interval['estimate'] < check['min_rate']:
+                escalations.append(f"{check['rule']} estimated at {interval['estimate']:.1%} "
+                                   f"(threshold {check['min_rate']:.0%})")
+        
+        # Score components as linear combinations of ratio estimates
+        components = {}
+        for component, definition in self.rules.components.items():
+            parts = [(ratio(item['rule'], item.get('of')), item.get('weight', 1)) for item in definition['rates']]
+            parts = [(estimate, linearized, weight) for (estimate, linearized), weight in parts if estimate is not None]
+            if not parts:
+                continue
+            if definition.get('combine', 'mean') == 'weighted':
+                coefficients = [weight for _, _, weight in parts]
+            else:
+                coefficients = [1 / len(parts)] * len(parts)
+            estimate = sum(c * e for c, (e, _, _) in zip(coefficients, parts))
+            linearized = sum(c * z for c, (_, z, _) in zip(coefficients, parts))
+            components[component] = (estimate, linearized)
+        
+        overall = sum(self.quality_weights[component] * linearized for component, (_, linearized) in components.items())
+        
+        return {
+            'mode': 'sample',
+            'population': int(design['weight'].sum().round()),
+            'sample_size': len(design),
+            'strata': int(design['stratum'].nunique()),
+            'confidence_level': self.sampling.get('confidence_level', 0.95),
+            'rates': rates,
+            'components': {component: estimator.interval(estimate, linearized)
+                           for component, (estimate, linearized) in components.items()},
+            'overall_margin': float(estimator.z * np.sqrt(estimator.variance_of_total(overall))),
+            'escalations': escalations
+        }
+    
+    def review_sample(self, df):
+        """Run per-record checks on a stratified sample, or return None to scan everything
+        
+        Returns (sample, checks, aggregates, sampling report). Falls back to a
+        full scan when the dataset is small or a sampled rate crosses its threshold.
+        Only the per-record checks are sampled; FULL_SCAN_STAGES still run on df.
+        """
+        if len(df) < self.sampling.get('min_records', 0):
+            print(f"  {len(df)} records is below the sampling minimum, running a full scan")
+            return None
+        
+        sample, design = stratified_sample(
+            df, self.sampling['strata'], self.sampling['sample_size'], self.sampling.get('min_per_stratum', 30))
+        print(f"  Sampled {len(sample)} of {len(df)} records across {design['stratum'].nunique()} strata")
+        
+        checks = self.evaluate_record_rules(sample)
+        sampling_report = self.estimate_quality(checks, design)
+        if sampling_report['escalations']:
+            self.escalations = sampling_report['escalations']
+            for escalation in sampling_report['escalations']:
+                print(f"  ⚠️  {escalation}")
+            print(f"  Escalating to a full scan")
+            return None
+        
+        aggregates = self.aggregate_verdicts(self.record_verdicts(sample, checks), design['weight'])
+        sampling_report['full_scan_stages'] = FULL_SCAN_STAGES
+        print(f"  Inconsistency and lookalike detection still scan all {len(df)} records")
+        return sample, checks, aggregates, sampling_report
+    
+    def _normalized_text(self, values):
+        """Case, punctuation and whitespace folded text for grouping ('' for missing)"""
+        return self._per_value(values, lambda v: v.fillna('').astype(str).str.lower()
+                               .str.replace(r'[^\w]+', ' ', regex=True).str.strip())
+    
+    def normalize_contact_values(self, df):
+        """Normalized contact key per record, so differently written contacts group together
+        
+        Phones use the canonical phone key, emails are case-folded and websites
+        lose their scheme, 'www.' and trailing slash. Missing values stay missing.
+        """
+        value = self._per_value(df['contact_value'], lambda v: v.where(v.isna(), self._text(v).str.strip()))
+        keys = value.where(df['contact_type'] == 'phone', value.str.lower())
+        
+        is_phone = df['contact_type'] == 'phone'
+        phone_keys = normalize_phone_series(df.loc[is_phone, 'contact_value'])
+        keys[is_phone] = phone_keys.where(phone_keys != '', value[is_phone])
+        
+        is_website = df['contact_type'] == 'website'
+        keys[is_website] = keys[is_website].str.replace(r'^(?:https?://)?(?:www\.)?', '', regex=True).str.rstrip('/')
+        return keys.where(value.notna() & (value != ''))
+    
     def detect_inconsistencies(self, df):
-        """Detect data inconsistencies and duplicates"""
+        """Detect data inconsistencies and duplicates in grouped passes over the dataset"""
         print(f"  Detecting inconsistencies...")
         
         inconsistency_analysis = {
             'duplicate_contacts': [],
             'organization_name_variations': [],
-            'address_inconsistencies': []
+            'address_inconsistencies': [],
+            'organization_clusters': []
         }
         
-        # Find duplicate contact values
-        contact_counts = df['contact_value'].value_counts()
-        duplicates = contact_counts[contact_counts > 1]
-        
-        for contact_value, count in duplicates.items():
-            duplicate_records = df[df['contact_value'] == contact_value]
+        # Near-duplicate organization names share a cluster and canonical name
+        clusters = cluster_names(df['organization_name'])
+        inconsistency_analysis['organization_clusters'] = cluster_summary(clusters)
+        
+        records = pd.DataFrame({
+            'contact_key': self.normalize_contact_values(df),
+            'contact_value': df['contact_value'],
+            'organization_name': df['organization_name'],
+            'organization_key': clusters['cluster_id'].to_numpy(),
+            'canonical_name': clusters['canonical_name'].to_numpy(),
+            'address': df['address'],
+            'address_key': self._normalized_text(df['address'])
+        }, index=df.index)
+        
+        # Contacts shared by several records, most used first
+        contacts = records.dropna(subset=['contact_key'])
+        by_contact = contacts.groupby('contact_key', sort=False)
+        counts = by_contact.size()
+        first_values = by_contact['contact_value'].first()
+        names = contacts.drop_duplicates(['contact_key', 'organization_name']).groupby(
+            'contact_key', sort=False)['organization_name'].agg(list)
+        organizations = contacts.drop_duplicates(['contact_key', 'organization_key']).groupby(
+            'contact_key', sort=False)['organization_key'].size()
+        
+        for contact_key, count in counts[counts > 1].sort_values(ascending=False, kind='stable').items():
+            # Same organization listed under several names
+            if organizations[contact_key] < len(names[contact_key]):
+                inconsistency_analysis['organization_name_variations'].append({
+                    'contact_value': first_values[contact_key],
+                    'name_variants': names[contact_key],
+                    'issue': 'Organization name written differently for the same contact'
+                })
             
             # Check if it's legitimate duplicates (same org) or problematic
-            org_names = duplicate_records['organization_name'].unique()
-            if len(org_names) > 1:
+            if organizations[contact_key] > 1:
                 inconsistency_analysis['duplicate_contacts'].append({
-                    'contact_value': contact_value,
-                    'count': count,
-                    'organizations': list(org_names),
+                    'contact_value': first_values[contact_key],
+                    'normalized_value': contact_key,
+                    'count': int(count),
+                    'organizations': names[contact_key],
                     'issue': 'Same contact used by multiple organizations'
                 })
         
+        # Organizations listed with more than one address
+        addressed = records[records['address_key'] != '']
+        addresses = addressed.drop_duplicates(['organization_key', 'address_key']).groupby(
+            'organization_key', sort=False).agg(organization=('canonical_name', 'first'), addresses=('address', list))
+        conflicting = addresses[addresses['addresses'].str.len() > 1]
+        for _, row in conflicting.iterrows():
+            inconsistency_analysis['address_inconsistencies'].append({
+                'organization': row['organization'],
+                'addresses': row['addresses'],
+                'issue': 'Conflicting addresses for the same organization'
+            })
+        
+        # Share of records with a canonical organization name and a single address
+        named = records['canonical_name'].notna()
+        inconsistent = (named & (records['organization_name'] != records['canonical_name'])) | \
+            records['organization_key'].isin(conflicting.index)
+        inconsistency_analysis['consistency_score'] = 1 - inconsistent.mean() if len(records) else 1.0
+        
         return inconsistency_analysis
     
-    def calculate_overall_quality_score(self, phone_validation, email_validation, 
-                                       website_validation, completeness, source_analysis):
-        """Calculate overall data quality score"""
-        
+    def _validation_scores(self, phone_validation, email_validation, website_validation, completeness):
+        """Format and completeness scores from the validation results"""
         # Format compliance score
         format_scores = []
         if phone_validation:
@@ -322,6 +693,24 @@ class CriticAgent:
             completeness['optional_completeness_rate'] * 0.2
         )
         
+        return format_score, completeness_score
+    
+    def calculate_overall_quality_score(self, phone_validation, email_validation, 
+                                       website_validation, completeness, source_analysis,
+                                       inconsistencies=None, rule_counts=None):
+        """Calculate overall data quality score
+        
+        With rule_counts (aggregated verdict counts) the format and completeness
+        scores come from the components of the rule specification.
+        """
+        if rule_counts is not None:
+            components = self.rules.component_scores(rule_counts, completeness['total_records'])
+            format_score = components['format_compliance']
+            completeness_score = components['completeness']
+        else:
+            format_score, completeness_score = self._validation_scores(
+                phone_validation, email_validation, website_validation, completeness)
+        
         # Source reliability score
         total_records = sum(source['record_count'] for source in source_analysis['sources'].values())
         weighted_reliability = 0
@@ -330,12 +719,15 @@ class CriticAgent:
             weight = data['record_count'] / total_records
             weighted_reliability += data['reliability_score'] * weight
         
+        # Consistency score from organization name clusters and address conflicts
+        consistency_score = inconsistencies['consistency_score'] if inconsistencies else 0.9
+        
         # Calculate final quality score
         quality_score = (
             format_score * self.quality_weights['format_compliance'] +
             completeness_score * self.quality_weights['completeness'] +
             weighted_reliability * self.quality_weights['source_reliability'] +
-            0.9 * self.quality_weights['consistency'] +  # Assume good consistency for now
+            consistency_score * self.quality_weights['consistency'] +
             0.95 * self.quality_weights['freshness']     # Data is fresh
         )
         
@@ -344,6 +736,7 @@ class CriticAgent:
             'format_score': format_score,
             'completeness_score': completeness_score,
             'source_reliability_score': weighted_reliability,
+            'consistency_score': consistency_score,
             'quality_grade': self.get_quality_grade(quality_score)
         }
     
@@ -372,19 +765,35 @@ class CriticAgent:
         
         print(f"Starting quality review of {len(df)} records...")
         
-        # Run all validation checks
-        phone_validation = self.validate_phone_numbers(df)
-        email_validation = self.validate_emails(df)
-        website_validation = self.validate_websites(df)
-        completeness = self.analyze_completeness(df)
-        source_analysis = self.analyze_source_reliability(df)
+        # Per-record rule verdicts: estimated from a sample, or cached by content over every record
+        sampled = self.review_sample(df) if self.sample else None
+        if sampled:
+            records, checks, aggregates, sampling_report = sampled
+        else:
+            records = df
+            checks, aggregates = self.evaluate_with_cache(df)
+            sampling_report = {'mode': 'full', 'population': len(df), 'sample_size': len(df),
+                               'escalations': self.escalations}
+        
+        phone_validation = self.validate_phone_numbers(records, checks, aggregates)
+        email_validation = self.validate_emails(records, checks, aggregates)
+        website_validation = self.validate_websites(records, checks, aggregates)
+        if self.website_checker and website_validation:
+            website_validation['liveness'] = self.verify_websites(records, checks)
+        lookalikes = self.detect_lookalike_domains(df)
+        completeness = self.analyze_completeness(records, checks, aggregates)
+        source_analysis = self.analyze_source_reliability(records, aggregates)
         inconsistencies = self.detect_inconsistencies(df)
         
         # Calculate overall quality score
         quality_score = self.calculate_overall_quality_score(
             phone_validation, email_validation, website_validation,
-            completeness, source_analysis
+            completeness, source_analysis, inconsistencies, aggregates['rules']
         )
+        if sampled:
+            margin = sampling_report['overall_margin']
+            score = float(quality_score['overall_quality_score'])
+            quality_score['overall_quality_score_ci'] = [score - margin, score + margin]
         
         # Compile final report
         critic_report = {
@@ -399,14 +808,17 @@ class CriticAgent:
             'validation_results': {
                 'phone_validation': phone_validation,
                 'email_validation': email_validation,
-                'website_validation': website_validation
+                'website_validation': website_validation,
+                'lookalike_domains': lookalikes
             },
             'completeness_analysis': completeness,
             'source_reliability': source_analysis,
             'inconsistency_detection': inconsistencies,
+            'sampling': sampling_report,
+            'rule_timings': {rule: round(seconds, 6) for rule, seconds in self.rule_timings.items()},
             'recommendations': self.generate_recommendations(
                 phone_validation, email_validation, website_validation,
-                completeness, inconsistencies
+                completeness, inconsistencies, lookalikes
             )
         }
         
@@ -419,10 +831,19 @@ class CriticAgent:
         print(f"=" * 50)
         print(f"Overall Quality Score: {quality_score['overall_quality_score']:.2f}")
         print(f"Quality Grade: {quality_score['quality_grade']}")
+        if sampled:
+            low, high = quality_score['overall_quality_score_ci']
+            print(f"  {sampling_report['confidence_level']:.0%} interval: {low:.3f} - {high:.3f} "
+                  f"(sample of {sampling_report['sample_size']} records)")
         print(f"\nComponent Scores:")
         print(f"  Format Compliance: {quality_score['format_score']:.2f}")
         print(f"  Data Completeness: {quality_score['completeness_score']:.2f}")
         print(f"  Source Reliability: {quality_score['source_reliability_score']:.2f}")
+        print(f"  Consistency: {quality_score['consistency_score']:.2f}")
+        
+        if self.rule_timings:
+            slowest = sorted(self.rule_timings.items(), key=lambda item: item[1], reverse=True)[:3]
+            print(f"\nSlowest rules: " + ', '.join(f"{rule} ({seconds * 1000:.1f} ms)" for rule, seconds in slowest))
         
         if phone_validation:
             print(f"\nPhone Validation: {phone_validation['format_compliance_rate']:.1%} valid")
@@ -430,12 +851,19 @@ class CriticAgent:
             print(f"Email Validation: {email_validation['format_compliance_rate']:.1%} valid")
         if website_validation:
             print(f"Website Validation: {website_validation['format_compliance_rate']:.1%} valid")
+        if website_validation.get('liveness'):
+            liveness = website_validation['liveness']
+            print(f"Website Liveness: {liveness['alive']} alive, {liveness['dead']} dead, "
+                  f"{liveness['redirected_offsite']} redirected off-site, {liveness['unchecked']} unchecked")
+        print(f"Lookalike Domains: {lookalikes['lookalike_values']} of {lookalikes['screened_values']} "
+              f"imitate {lookalikes['legitimate_domains']} legitimate domains")
         
         print(f"\nReport saved to: {self.output_file}")
         
         return critic_report
     
-    def generate_recommendations(self, phone_val, email_val, website_val, completeness, inconsistencies):
+    def generate_recommendations(self, phone_val, email_val, website_val, completeness, inconsistencies,
+                                 lookalikes=None):
         """Generate improvement recommendations"""
         recommendations = []
         
@@ -448,6 +876,26 @@ class CriticAgent:
                 'recommendation': 'Implement stricter phone number validation in collector agents'
             })
         
+        # Website liveness recommendations
+        liveness = website_val.get('liveness') if website_val else None
+        if liveness and (liveness['dead'] or liveness['redirected_offsite']):
+            recommendations.append({
+                'category': 'website_liveness',
+                'priority': 'high',
+                'issue': f"{liveness['dead']} unreachable and {liveness['redirected_offsite']} "
+                         f"off-site redirecting websites",
+                'recommendation': 'Review these websites before listing them as safe contacts'
+            })
+        
+        # Lookalike domain recommendations
+        if lookalikes and lookalikes['issues']:
+            recommendations.append({
+                'category': 'lookalike_domains',
+                'priority': 'high',
+                'issue': f"{lookalikes['lookalike_values']} domains imitate legitimate contact domains",
+                'recommendation': 'Flag these domains as impersonation threats in the published contacts'
+            })
+        
         # Completeness recommendations
         if completeness['required_completeness_rate'] < 0.95:
             recommendations.append({
@@ -470,7 +918,15 @@ class CriticAgent:
 
 def main():
     """Main execution function"""
-    critic = CriticAgent()
+    parser = argparse.ArgumentParser(description='Review standardized contact data quality')
+    parser.add_argument('--sample', action='store_true',
+                        help='check a stratified sample of large datasets and report confidence intervals '
+                             '(inconsistency and lookalike detection still scan every record)')
+    parser.add_argument('--check-websites', action='store_true',
+                        help='verify website liveness, redirects and TLS (network access)')
+    args = parser.parse_args()
+    
+    critic = CriticAgent(sample=args.sample, check_websites=args.check_websites)
     report = critic.run_quality_review()
     
     if report:
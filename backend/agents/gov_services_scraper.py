@@ -10,8 +10,15 @@ from bs4 import BeautifulSoup
 import csv
 import re
 import time
+import os
+import sys
 from urllib.parse import urljoin
 
+# Add the backend directory to the Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.phone_normalizer import extract_phone
+
 class GovServicesAgent:
     def __init__(self):
         self.base_url = "https://www.directory.gov.au"
@@ -100,22 +107,8 @@ class GovServicesAgent:
         phone_clean = re.sub(r'Phone:\s*', '', phone_text, flags=re.IGNORECASE)
         phone_clean = re.sub(r'<br\s*/?>.*$', '', phone_clean, flags=re.IGNORECASE)
         
-        # Extract phone numbers using regex
-        phone_patterns = [
-            r'1800\s*\d{3}\s*\d{3}',  # 1800 numbers
-            r'1300\s*\d{3}\s*\d{3}',  # 1300 numbers
-            r'13\s*\d{2}\s*\d{2}',    # 13 numbers
-            r'131\s*\d{3}',           # 131 numbers
-            r'\(0[2-8]\)\s*\d{4}\s*\d{4}',  # (0X) XXXX XXXX
-            r'0[2-8]\s*\d{4}\s*\d{4}',      # 0X XXXX XXXX
-        ]
-        
-        for pattern in phone_patterns:
-            match = re.search(pattern, phone_clean)
-            if match:
-                return match.group().strip()
-                
-        return phone_clean.strip()
+        # First phone number in the text, using the shared phone formats
+        return extract_phone(phone_clean) or phone_clean.strip()
     
     def scrape_all_services(self):
         """Scrape services from all letter pages"""
@@ -9,8 +9,15 @@ import requests
 import pandas as pd
 import csv
 import re
+import os
+import sys
 from io import StringIO
 
+# Add the backend directory to the Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.phone_normalizer import extract_phone
+
 class NSWHospitalsAgent:
     def __init__(self):
         # Official NSW Health API endpoint from data.gov.au
@@ -175,22 +182,7 @@ class NSWHospitalsAgent:
         
         phone_clean = str(phone_text).strip()
         
-        # Australian phone number patterns
-        phone_patterns = [
-            r'(\+61\s*[2-8]\s*\d{4}\s*\d{4})',   # +61 X XXXX XXXX
-            r'(\(0[2-8]\)\s*\d{4}\s*\d{4})',     # (0X) XXXX XXXX
-            r'(0[2-8]\s*\d{4}\s*\d{4})',         # 0X XXXX XXXX
-            r'(1800\s*\d{3}\s*\d{3})',           # 1800 XXX XXX
-            r'(1300\s*\d{3}\s*\d{3})',           # 1300 XXX XXX
-            r'(13\s*\d{2}\s*\d{2})',             # 13 XX XX
-        ]
-        
-        for pattern in phone_patterns:
-            match = re.search(pattern, phone_clean)
-            if match:
-                return match.group().strip()
-        
-        return phone_clean
+        return extract_phone(phone_clean) or phone_clean
     
     def clean_email(self, email_text):
         """Clean email addresses"""
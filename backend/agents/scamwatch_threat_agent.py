@@ -9,13 +9,76 @@ import requests
 from bs4 import BeautifulSoup
 import time
 import csv
-import re
+import os
+import sys
+import hashlib
+from pathlib import Path
 from urllib.parse import urljoin
 
+# Add the backend directory to the Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.entity_scanner import EntityScanner
+
+# Identify scam type from title and content (first matching category wins)
+SCAM_TYPES = {
+    'phone_spoofing': ['phone', 'number', 'spoofed', 'caller id'],
+    'email_phishing': ['email', 'phishing', 'inbox', 'message'],
+    'job_scam': ['job', 'employment', 'recruitment', 'work'],
+    'romance_scam': ['dating', 'romance', 'relationship'],
+    'investment_scam': ['investment', 'crypto', 'trading', 'bitcoin'],
+    'government_impersonation': ['government', 'ato', 'centrelink', 'medicare'],
+    'business_impersonation': ['bank', 'telstra', 'energy', 'utility'],
+    'fake_charity': ['charity', 'donation', 'fundraising']
+}
+
+# Common scam tactics
+SCAM_TACTICS = {
+    'urgency': ['urgent', 'immediate', 'act now', 'expires'],
+    'fear': ['suspended', 'blocked', 'arrest', 'penalty'],
+    'authority': ['government', 'official', 'authority', 'legal'],
+    'greed': ['money', 'profit', 'investment', 'opportunity'],
+    'curiosity': ['click here', 'verify', 'confirm', 'update']
+}
+
+# Organizations commonly impersonated by scammers
+IMPERSONATED_ORGANIZATIONS = [
+    'ACCC', 'ATO', 'Centrelink', 'Medicare', 'Police', 'Bank',
+    'Telstra', 'Optus', 'Energy Australia', 'Origin', 'Netflix',
+    'Amazon', 'eBay', 'PayPal', 'Commonwealth Bank', 'ANZ',
+    'Westpac', 'NAB', 'Government', 'Tax Office'
+]
+
+# Phrases indicating an organization is mentioned in a scam context
+IMPERSONATION_CONTEXT = [
+    'impersonate', 'impersonating', 'pretend', 'pose as', 'claim to be',
+    'represent', 'from the', 'calling from'
+]
+
+# Legitimate domains that appear in articles but are not scam contacts
+EXCLUDED_EMAIL_DOMAINS = ['scamwatch.gov.au', 'accc.gov.au', 'example.com']
+EXCLUDED_WEBSITE_DOMAINS = ['scamwatch.gov.au', 'accc.gov.au', 'gov.au']
+
+# Date formats in order of preference
+DATE_LABEL_ORDER = ['date_dmy', 'date_mdy', 'date_iso']
+
+
+def build_threat_scanner():
+    """Compile the shared entity scanner with scam keyword groups"""
+    return EntityScanner({
+        'scam_type': SCAM_TYPES,
+        'tactic': SCAM_TACTICS,
+        'organization': {org: [org] for org in IMPERSONATED_ORGANIZATIONS},
+        'impersonation_context': {'context': IMPERSONATION_CONTEXT}
+    })
+
+
 class ScamwatchThreatAgent:
     def __init__(self):
         self.base_url = "https://www.scamwatch.gov.au"
         self.news_alerts_url = f"{self.base_url}/about-us/news-and-alerts"
+        self.article_dir = Path('data/raw/scamwatch_articles')
+        self.scanner = build_threat_scanner()
         
         self.session = requests.Session()
         self.session.headers.update({
@@ -108,107 +171,8 @@ class ScamwatchThreatAgent:
             soup = BeautifulSoup(response.content, 'html.parser')
             page_text = soup.get_text()
             
-            # Identify scam type from title and content
-            scam_types = {
-                'phone_spoofing': ['phone', 'number', 'spoofed', 'caller id'],
-                'email_phishing': ['email', 'phishing', 'inbox', 'message'],
-                'job_scam': ['job', 'employment', 'recruitment', 'work'],
-                'romance_scam': ['dating', 'romance', 'relationship'],
-                'investment_scam': ['investment', 'crypto', 'trading', 'bitcoin'],
-                'government_impersonation': ['government', 'ato', 'centrelink', 'medicare'],
-                'business_impersonation': ['bank', 'telstra', 'energy', 'utility'],
-                'fake_charity': ['charity', 'donation', 'fundraising']
-            }
-            
-            for scam_category, keywords in scam_types.items():
-                if any(keyword in page_text.lower() for keyword in keywords):
-                    threat_info['scam_type'] = scam_category
-                    break
-            
-            # Extract phone numbers mentioned in scam context
-            phone_patterns = [
-                r'(\+61\s*[2-8]\s*\d{4}\s*\d{4})',   # +61 X XXXX XXXX
-                r'(\(0[2-8]\)\s*\d{4}\s*\d{4})',     # (0X) XXXX XXXX
-                r'(0[2-8]\s*\d{4}\s*\d{4})',         # 0X XXXX XXXX
-                r'(1800\s*\d{3}\s*\d{3})',           # 1800 XXX XXX
-                r'(1300\s*\d{3}\s*\d{3})',           # 1300 XXX XXX
-                r'(13\s*\d{2}\s*\d{2})',             # 13 XX XX
-            ]
-            
-            for pattern in phone_patterns:
-                matches = re.findall(pattern, page_text)
-                for match in matches:
-                    clean_number = match.strip()
-                    if clean_number not in threat_info['scam_phone_numbers']:
-                        threat_info['scam_phone_numbers'].append(clean_number)
-            
-            # Extract email addresses
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            emails = re.findall(email_pattern, page_text)
-            for email in emails:
-                # Filter out legitimate government/organization emails
-                if not any(domain in email.lower() for domain in 
-                          ['scamwatch.gov.au', 'accc.gov.au', 'example.com']):
-                    if email not in threat_info['scam_emails']:
-                        threat_info['scam_emails'].append(email)
-            
-            # Extract websites/domains mentioned as scam sites
-            url_pattern = r'https?://(?:www\.)?([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
-            urls = re.findall(url_pattern, page_text)
-            for url in urls:
-                # Filter out legitimate sites
-                if not any(domain in url.lower() for domain in 
-                          ['scamwatch.gov.au', 'accc.gov.au', 'gov.au']):
-                    if url not in threat_info['scam_websites']:
-                        threat_info['scam_websites'].append(url)
-            
-            # Extract impersonated organizations
-            org_keywords = [
-                'impersonate', 'impersonating', 'pretend', 'pose as', 'claim to be',
-                'represent', 'from the', 'calling from'
-            ]
-            
-            organizations = [
-                'ACCC', 'ATO', 'Centrelink', 'Medicare', 'Police', 'Bank',
-                'Telstra', 'Optus', 'Energy Australia', 'Origin', 'Netflix',
-                'Amazon', 'eBay', 'PayPal', 'Commonwealth Bank', 'ANZ',
-                'Westpac', 'NAB', 'Government', 'Tax Office'
-            ]
-            
-            for org in organizations:
-                if org.lower() in page_text.lower():
-                    # Check if mentioned in scam context
-                    for keyword in org_keywords:
-                        if keyword in page_text.lower() and org.lower() in page_text.lower():
-                            if org not in threat_info['impersonated_organizations']:
-                                threat_info['impersonated_organizations'].append(org)
-                            break
-            
-            # Extract date from article
-            date_patterns = [
-                r'(\d{1,2}\s+\w+\s+\d{4})',  # "29 August 2025"
-                r'(\w+\s+\d{1,2},?\s+\d{4})', # "August 29, 2025"
-                r'(\d{4}-\d{2}-\d{2})'        # "2025-08-29"
-            ]
-            
-            for pattern in date_patterns:
-                matches = re.findall(pattern, page_text)
-                if matches:
-                    threat_info['date_reported'] = matches[0]
-                    break
-            
-            # Extract common scam tactics
-            tactics = {
-                'urgency': ['urgent', 'immediate', 'act now', 'expires'],
-                'fear': ['suspended', 'blocked', 'arrest', 'penalty'],
-                'authority': ['government', 'official', 'authority', 'legal'],
-                'greed': ['money', 'profit', 'investment', 'opportunity'],
-                'curiosity': ['click here', 'verify', 'confirm', 'update']
-            }
-            
-            for tactic_name, keywords in tactics.items():
-                if any(keyword in page_text.lower() for keyword in keywords):
-                    threat_info['scam_tactics'].append(tactic_name)
+            self.save_article_text(article_url, page_text)
+            self.analyze_page_text(threat_info, page_text)
             
             print(f"    Scam Type: {threat_info['scam_type']}")
             print(f"    Phone Numbers: {len(threat_info['scam_phone_numbers'])}")
@@ -221,6 +185,51 @@ class ScamwatchThreatAgent:
         
         return threat_info
     
+    def analyze_page_text(self, threat_info, page_text):
+        """Fill threat fields from article text using one entity scan"""
+        result = self.scanner.scan(page_text)
+        
+        scam_types = result.labels('scam_type')
+        threat_info['scam_type'] = next((t for t in SCAM_TYPES if t in scam_types), '')
+        
+        for number in result.values('phone'):
+            if number not in threat_info['scam_phone_numbers']:
+                threat_info['scam_phone_numbers'].append(number)
+        
+        # Filter out legitimate government/organization emails and sites
+        for email in result.values('email'):
+            if not any(domain in email.lower() for domain in EXCLUDED_EMAIL_DOMAINS):
+                if email not in threat_info['scam_emails']:
+                    threat_info['scam_emails'].append(email)
+        
+        for url in result.values('url'):
+            if not any(domain in url.lower() for domain in EXCLUDED_WEBSITE_DOMAINS):
+                if url not in threat_info['scam_websites']:
+                    threat_info['scam_websites'].append(url)
+        
+        # Organizations only count when mentioned in a scam context
+        if result.labels('impersonation_context'):
+            organizations = result.labels('organization')
+            for org in IMPERSONATED_ORGANIZATIONS:
+                if org in organizations and org not in threat_info['impersonated_organizations']:
+                    threat_info['impersonated_organizations'].append(org)
+        
+        threat_info['date_reported'] = result.first_value('date', DATE_LABEL_ORDER)
+        
+        tactics = result.labels('tactic')
+        threat_info['scam_tactics'].extend(t for t in SCAM_TACTICS if t in tactics)
+        
+        return threat_info
+    
+    def save_article_text(self, article_url, page_text):
+        """Keep the article text so extraction can be re-run and benchmarked offline"""
+        try:
+            self.article_dir.mkdir(parents=True, exist_ok=True)
+            name = hashlib.sha1(article_url.encode('utf-8')).hexdigest()[:16]
+            (self.article_dir / f"{name}.txt").write_text(page_text, encoding='utf-8')
+        except OSError as e:
+            print(f"    Could not save article text: {e}")
+    
     def scrape_threat_intelligence(self, limit=10):
         """Complete threat intelligence scraping process"""
         # Stage 1: Get article links
@@ -5,18 +5,36 @@ Categorizes standardized contact data by organization type, risk level, and prio
 Part of the multi-agent framework with Google A2A protocol
 """
 
+import argparse
 import pandas as pd
+import numpy as np
 import json
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
 import asyncio
+import os
+import sys
+
+# Add the backend directory to the Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.phone_normalizer import parse_phone, classify_phone_series
+from utils.standardized_store import load_standardized_contacts
+from utils.partitioned_writer import PartitionedWriter
+from utils.keyword_automaton import KeywordClassifier
+from utils.verification_index import VerificationIndex
+from utils.lookup_artifact import ARTIFACT_FILE, write_artifact
+from utils.contact_store import SORTED_FIELDS, STANDARD_FIELDS, STORE_FILE, ContactStore
 
 class SorterAgent:
-    def __init__(self):
+    def __init__(self, output_format='csv'):
         self.agent_id = "sorter_agent"
+        self.output_format = output_format    # 'csv' or 'parquet' (needs pyarrow)
         self.input_file = 'data/standardized_contacts.csv'
         self.quality_report_file = 'data/reports/critic_report.json'
+        self.artifact_file = ARTIFACT_FILE    # binary lookup artifact for verification consumers
+        self.store_file = STORE_FILE          # SQLite contact store the standardizer fills
         
         # Risk assessment criteria
         self.risk_levels = {
@@ -33,20 +51,27 @@ class SorterAgent:
             'charity': {'priority': 3, 'category': 'Community Services'},
             'threat': {'priority': 4, 'category': 'Security Threats'}
         }
+        
+        # Organization name words that mark emergency services
+        self.emergency_keywords = ['emergency', 'police', 'ambulance', 'fire', 'rescue', '000']
+        self.emergency_classifier = KeywordClassifier({'emergency': self.emergency_keywords})
     
     def load_data_and_quality_report(self):
         """Load standardized data and quality assessment"""
         print("Sorter Agent - Data Categorization System")
         print("=" * 50)
         
-        # Load standardized contacts
-        contacts_path = Path(self.input_file)
-        if not contacts_path.exists():
-            print(f"Error: {self.input_file} not found")
-            return None, None
-        
-        df = pd.read_csv(contacts_path)
-        print(f"Loaded {len(df)} standardized contact records")
+        # Load standardized contacts from the contact store; the merged CSV is
+        # the fallback until the standardizer has filled the store
+        df = self.load_standardized_from_store()
+        if df is not None:
+            print(f"Loaded {len(df)} standardized contact records from {self.store_file}")
+        else:
+            df = load_standardized_contacts(self.input_file)
+            if df is None:
+                print(f"Error: {self.input_file} not found")
+                return None, None
+            print(f"Loaded {len(df)} standardized contact records")
         
         # Load quality report
         quality_path = Path(self.quality_report_file)
@@ -60,88 +85,110 @@ class SorterAgent:
         
         return df, quality_report
     
-    def assess_risk_level(self, row):
-        """Assess risk level for each contact record"""
-        org_type = row['organization_type'].lower()
-        confidence = row['confidence_score']
-        contact_value = str(row['contact_value']).strip()
-        
-        # Threat indicators are high risk
-        if org_type == 'threat':
-            return 'threat'
-        
-        # Government and hospitals are generally safe if high confidence
-        if org_type in ['government', 'hospital'] and confidence >= 0.8:
-            return 'safe'
-        
-        # Charities with good confidence are safe
-        if org_type == 'charity' and confidence >= 0.7:
-            return 'safe'
-        
-        # Low confidence requires manual verification
-        if confidence < 0.6:
-            return 'suspicious'
-        
-        # Check for suspicious patterns in phone numbers
-        if row['contact_type'] == 'phone':
-            # Very short numbers might be suspicious
-            clean_number = ''.join(c for c in contact_value if c.isdigit())
-            if len(clean_number) < 8:
-                return 'suspicious'
-            
-            # Repeated digits pattern
-            if len(set(clean_number)) <= 2:
-                return 'suspicious'
-        
-        return 'safe'
+    def load_standardized_from_store(self):
+        """Standardized records of every partition in the contact store, None when it has none"""
+        if not Path(self.store_file).exists():
+            return None
+        with ContactStore(self.store_file) as contacts:
+            partitions = contacts.partitions()
+            if not partitions:
+                return None
+            df = contacts.query(STANDARD_FIELDS, order_by='rowid', partition_name=sorted(partitions))
+        # The standardizer writes missing text as 'nan', which its CSV reads back as missing
+        text = df.columns.difference(['confidence_score'])
+        df[text] = df[text].mask(df[text].isin(['nan', '']))
+        return df
+    
+    def _per_value(self, values, rule):
+        """Apply a Series -> Series rule once per distinct value and broadcast it back"""
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        return rule(pd.Series(uniques, dtype=object)).to_numpy()[codes]
+    
+    def _text_contains(self, values, pattern):
+        """Whether the lower-cased str() of each value ('nan' when missing) contains a pattern"""
+        return self._per_value(values, lambda v: v.astype(str).fillna('nan').str.lower()
+                               .str.contains(pattern, regex=False)).astype(bool)
     
-    def calculate_priority_score(self, row, quality_metrics=None):
-        """Calculate priority score for contact sorting"""
-        org_type = row['organization_type'].lower()
-        base_priority = self.priority_mapping.get(org_type, {}).get('priority', 5)
+    def _suspicious_phone(self, value):
+        """Numbers that do not normalize to a real phone number, or repeat one or two digits"""
+        phone = parse_phone(str(value).strip())
+        return phone.number_type == 'invalid' or len(set(phone.digits)) <= 2
+    
+    def assess_risk_level(self, df):
+        """Assess risk level for every contact record"""
+        org_type = pd.Series(self._per_value(df['organization_type'], lambda v: v.str.lower()), index=df.index)
+        confidence = df['confidence_score'].to_numpy(dtype=float)
+        is_phone = (df['contact_type'] == 'phone').to_numpy()
+        
+        # Phone patterns are checked once per distinct number
+        suspicious_phone = np.zeros(len(df), dtype=bool)
+        suspicious_phone[is_phone] = self._per_value(df.loc[is_phone, 'contact_value'],
+                                                     lambda v: v.map(self._suspicious_phone)).astype(bool)
+        
+        conditions = [
+            (org_type == 'threat').to_numpy(),                                            # Threat indicators
+            org_type.isin(['government', 'hospital']).to_numpy() & (confidence >= 0.8),   # Confident gov/hospital
+            (org_type == 'charity').to_numpy() & (confidence >= 0.7),                     # Confident charities
+            confidence < 0.6,                                                             # Low confidence
+            suspicious_phone                                                              # Invalid/repeated digits
+        ]
+        choices = ['threat', 'safe', 'safe', 'suspicious', 'suspicious']
+        return pd.Series(np.select(conditions, choices, default='safe'), index=df.index, dtype=object)
+    
+    def calculate_priority_score(self, df, quality_metrics=None):
+        """Calculate priority scores for contact sorting (lower is higher priority)"""
+        org_type = pd.Series(self._per_value(df['organization_type'], lambda v: v.str.lower()), index=df.index)
+        priorities = {org: mapping['priority'] for org, mapping in self.priority_mapping.items()}
+        base_priority = org_type.map(priorities).fillna(5).to_numpy(dtype=float)
         
         # Adjust based on confidence score
-        confidence_bonus = row['confidence_score'] * 10  # 0-10 points
+        confidence_bonus = df['confidence_score'].to_numpy(dtype=float) * 10  # 0-10 points
         
         # Boost priority for emergency services
-        emergency_keywords = ['emergency', 'police', 'ambulance', 'fire', 'rescue', '000']
-        if any(keyword in str(row['organization_name']).lower() for keyword in emergency_keywords):
-            base_priority = 0  # Highest priority
+        emergency = self._per_value(df['organization_name'], lambda v: v.astype(str).fillna('nan')
+                                    .map(self.emergency_classifier.matches)).astype(bool)
+        base_priority = np.where(emergency, 0, base_priority)  # Highest priority
         
         # Boost for toll-free numbers (often important services)
-        if row['contact_type'] == 'phone' and str(row['contact_value']).strip().startswith(('1800', '1300')):
-            confidence_bonus += 2
+        is_phone = (df['contact_type'] == 'phone').to_numpy()
+        toll_free = np.zeros(len(df), dtype=bool)
+        toll_free[is_phone] = classify_phone_series(df.loc[is_phone, 'contact_value']).isin(['1800', '1300']).to_numpy()
+        confidence_bonus = confidence_bonus + np.where(toll_free, 2, 0)
         
         # Government domains get priority boost
-        if row['contact_type'] == 'email' and '.gov.au' in str(row['contact_value']).lower():
-            confidence_bonus += 3
+        is_email = (df['contact_type'] == 'email').to_numpy()
+        gov_email = np.zeros(len(df), dtype=bool)
+        gov_email[is_email] = self._text_contains(df.loc[is_email, 'contact_value'], '.gov.au')
+        confidence_bonus = confidence_bonus + np.where(gov_email, 3, 0)
         
-        # Final score (lower is higher priority)
+        # Final score, never negative (missing confidence scores count as 0)
         final_score = base_priority - (confidence_bonus / 10)
-        return max(0, final_score)  # Ensure non-negative
+        return pd.Series(np.where(final_score > 0, final_score, 0.0), index=df.index)
     
-    def categorize_by_geography(self, row):
+    def categorize_by_geography(self, df):
         """Categorize contacts by geographic region"""
-        state = str(row.get('state', '')).upper()
-        org_name = str(row['organization_name']).lower()
-        
-        if state == 'FEDERAL' or 'federal' in org_name:
-            return 'Federal'
-        elif state == 'NSW':
-            return 'NSW'
-        elif state in ['VIC', 'QLD', 'SA', 'WA', 'TAS', 'NT', 'ACT']:
-            return state
+        if 'state' in df:
+            state = self._per_value(df['state'], lambda v: v.astype(str).fillna('nan').str.upper()).astype(object)
         else:
-            return 'Unknown'
+            state = np.full(len(df), '', dtype=object)
+        federal_name = self._text_contains(df['organization_name'], 'federal')
+        
+        conditions = [
+            (state == 'FEDERAL') | federal_name,
+            state == 'NSW',
+            pd.Series(state).isin(['VIC', 'QLD', 'SA', 'WA', 'TAS', 'NT', 'ACT']).to_numpy()
+        ]
+        return pd.Series(np.select(conditions, ['Federal', 'NSW', state], default='Unknown'),
+                         index=df.index, dtype=object)
     
     def sort_and_categorize_data(self, df, quality_report=None):
         """Main sorting and categorization logic"""
         print(f"\nSorting and categorizing {len(df)} contact records...")
         
         # Add computed fields
-        df['risk_level'] = df.apply(self.assess_risk_level, axis=1)
-        df['priority_score'] = df.apply(lambda row: self.calculate_priority_score(row, quality_report), axis=1)
-        df['geographic_region'] = df.apply(self.categorize_by_geography, axis=1)
+        df['risk_level'] = self.assess_risk_level(df)
+        df['priority_score'] = self.calculate_priority_score(df, quality_report)
+        df['geographic_region'] = self.categorize_by_geography(df)
         df['category'] = df['organization_type'].map(lambda x: self.priority_mapping.get(x, {}).get('category', 'Other'))
         
         # Sort by priority score (ascending - lower scores = higher priority)
@@ -169,44 +216,64 @@ class SorterAgent:
         return df_sorted, stats
     
     def generate_categorized_outputs(self, df_sorted, stats):
-        """Generate separate CSV files for each category"""
+        """Generate separate output files for each category in one pass over the sorted data"""
         print(f"\nGenerating categorized output files...")
         
-        output_files = {}
+        # Records are partitioned once; each file is a selection of partitions
+        keys = pd.DataFrame({
+            'organization_type': df_sorted['organization_type'],
+            'risk_level': df_sorted['risk_level'],
+            'high_priority': df_sorted['priority_score'] < 2
+        })
+        sinks = {}
+        labels = {}
         
         # 1. By Organization Type
         for org_type in df_sorted['organization_type'].unique():
-            org_data = df_sorted[df_sorted['organization_type'] == org_type]
             filename = f"data/verified/{org_type}_contacts.csv"
-            org_data.to_csv(filename, index=False)
-            output_files[filename] = len(org_data)
-            print(f"  📄 {filename}: {len(org_data)} records")
+            sinks[filename] = lambda groups, org_type=org_type: groups['organization_type'] == org_type
+            labels[filename] = '📄', ''
         
         # 2. By Risk Level
         for risk_level in ['safe', 'threat', 'suspicious']:
-            risk_data = df_sorted[df_sorted['risk_level'] == risk_level]
-            if len(risk_data) > 0:
+            if (keys['risk_level'] == risk_level).any():
                 if risk_level == "threat":
                     filename = f"data/threats/{risk_level}_contacts.csv"
                 else:
                     filename = f"data/verified/all_{risk_level}_contacts.csv"  # Avoid duplicate with org-type files
-                risk_data.to_csv(filename, index=False)
-                output_files[filename] = len(risk_data)
-                print(f"  🔒 {filename}: {len(risk_data)} records")
+                sinks[filename] = lambda groups, risk_level=risk_level: groups['risk_level'] == risk_level
+                labels[filename] = '🔒', ''
         
         # 3. High Priority Contacts (for emergency response)
-        high_priority = df_sorted[df_sorted['priority_score'] < 2]
-        if len(high_priority) > 0:
+        if keys['high_priority'].any():
             filename = "data/verified/high_priority_contacts.csv"
-            high_priority.to_csv(filename, index=False)
-            output_files[filename] = len(high_priority)
-            print(f"  ⚡ {filename}: {len(high_priority)} records")
+            sinks[filename] = lambda groups: groups['high_priority']
+            labels[filename] = '⚡', ''
         
         # 4. Master sorted file
         filename = "data/sorted_contacts_master.csv"
-        df_sorted.to_csv(filename, index=False)
-        output_files[filename] = len(df_sorted)
-        print(f"  📋 {filename}: {len(df_sorted)} records (complete sorted dataset)")
+        sinks[filename] = lambda groups: np.ones(len(groups), dtype=bool)
+        labels[filename] = '📋', ' (complete sorted dataset)'
+        
+        writer = PartitionedWriter(self.output_format)
+        written = writer.write(df_sorted, keys, sinks)
+        
+        output_files = {}
+        for filename in sinks:
+            path = str(writer.sink_path(filename))
+            output_files[path] = written[path]
+            icon, note = labels[filename]
+            print(f"  {icon} {path}: {written[path]} records{note}")
+        
+        # 5. Memory-mapped lookup artifact over the same records
+        keys_written = write_artifact(VerificationIndex(df_sorted), self.artifact_file)
+        output_files[self.artifact_file] = keys_written
+        print(f"  🗂️ {self.artifact_file}: {keys_written} lookup keys (binary, memory-mappable)")
+        
+        # 6. Risk levels and priorities into the contact store, by stable contact key
+        with ContactStore(self.store_file) as contacts:
+            upserted = contacts.upsert(df_sorted, update_fields=SORTED_FIELDS)
+        print(f"  🗄️ {self.store_file}: {upserted} records updated")
         
         return output_files
     
@@ -324,7 +391,12 @@ def main():
     """Main execution function"""
     import asyncio
     
-    sorter = SorterAgent()
+    parser = argparse.ArgumentParser(description='Categorize standardized contacts by type, risk and priority')
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv',
+                        help='format of the categorized output files (parquet needs pyarrow)')
+    args = parser.parse_args()
+    
+    sorter = SorterAgent(output_format=args.format)
     report = asyncio.run(sorter.run_sorting_pipeline())
     
     if report:
@@ -24,6 +24,8 @@ except ImportError:
 # Add the backend directory to the Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from utils.standardized_store import load_standardized_contacts
+
 class VisualizationAgent:
     def __init__(self, agent_id="visualization_agent"):
         self.agent_id = agent_id
@@ -40,12 +42,11 @@ class VisualizationAgent:
         """Load and analyze the standardized contacts CSV data"""
         csv_path = self.data_dir / "standardized_contacts.csv"
         
-        if not csv_path.exists():
-            print(f"❌ Standardized data file not found: {csv_path}")
-            return None
-            
         try:
-            df = pd.read_csv(csv_path)
+            df = load_standardized_contacts(csv_path, self.data_dir / "standardized")
+            if df is None:
+                print(f"❌ Standardized data file not found: {csv_path}")
+                return None
             print(f"📊 Loaded {len(df)} records from {csv_path}")
             
             # Basic data analysis for visualization
@@ -8,12 +8,22 @@ This is often more reliable than ACNC profiles and gives us real operational con
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
-import re
+import os
+import sys
 import time
 from urllib.parse import urljoin, urlparse
 
+# Add the backend directory to the Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.entity_scanner import EntityScanner
+
+# Phone formats in order of preference when a page lists several numbers
+PHONE_LABEL_ORDER = ['phone_area', 'phone_geo', 'phone_intl', 'phone_1800', 'phone_1300', 'phone_13']
+
 class WebsiteContactScraper:
     def __init__(self):
+        self.scanner = EntityScanner(include_dates=False)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (compatible; GovHack2025-ContactScraper/1.0)'
@@ -41,33 +51,17 @@ class WebsiteContactScraper:
             soup = BeautifulSoup(response.content, 'html.parser')
             page_text = soup.get_text()
             
-            # Extract email addresses
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            emails = re.findall(email_pattern, page_text)
+            result = self.scanner.scan(page_text)
             
-            if emails:
-                # Filter out common system emails
-                filtered_emails = [email for email in emails 
-                                 if not any(exclude in email.lower() for exclude in 
-                                          ['noreply', 'no-reply', 'postmaster', 'admin@', 'webmaster'])]
-                if filtered_emails:
-                    contact_info['email'] = filtered_emails[0]
+            # Extract email addresses, filtering out common system emails
+            filtered_emails = [email for email in result.values('email')
+                             if not any(exclude in email.lower() for exclude in 
+                                      ['noreply', 'no-reply', 'postmaster', 'admin@', 'webmaster'])]
+            if filtered_emails:
+                contact_info['email'] = filtered_emails[0]
             
             # Extract Australian phone numbers
-            phone_patterns = [
-                r'(\(0[2-8]\)\s*\d{4}\s*\d{4})',     # (0X) XXXX XXXX
-                r'(0[2-8]\s*\d{4}\s*\d{4})',         # 0X XXXX XXXX
-                r'(\+61\s*[2-8]\s*\d{4}\s*\d{4})',   # +61 X XXXX XXXX
-                r'(1800\s*\d{3}\s*\d{3})',           # 1800 XXX XXX
-                r'(1300\s*\d{3}\s*\d{3})',           # 1300 XXX XXX
-                r'(13\s*\d{2}\s*\d{2})',             # 13 XX XX
-            ]
-            
-            for pattern in phone_patterns:
-                matches = re.findall(pattern, page_text)
-                if matches:
-                    contact_info['phone'] = matches[0].strip()
-                    break
+            contact_info['phone'] = result.first_value('phone', PHONE_LABEL_ORDER)
             
             # Try to find a contact page for additional information
             contact_links = soup.find_all('a', href=True)
@@ -82,24 +76,18 @@ class WebsiteContactScraper:
                         
                         contact_response = self.session.get(contact_url, timeout=20)
                         contact_soup = BeautifulSoup(contact_response.content, 'html.parser')
-                        contact_text = contact_soup.get_text()
+                        contact_result = self.scanner.scan(contact_soup.get_text())
                         
                         # Extract additional contact info from contact page
                         if not contact_info['email']:
-                            contact_emails = re.findall(email_pattern, contact_text)
-                            if contact_emails:
-                                filtered = [email for email in contact_emails 
-                                          if not any(exclude in email.lower() for exclude in 
-                                                   ['noreply', 'no-reply', 'postmaster'])]
-                                if filtered:
-                                    contact_info['email'] = filtered[0]
+                            filtered = [email for email in contact_result.values('email')
+                                      if not any(exclude in email.lower() for exclude in 
+                                               ['noreply', 'no-reply', 'postmaster'])]
+                            if filtered:
+                                contact_info['email'] = filtered[0]
                         
                         if not contact_info['phone']:
-                            for pattern in phone_patterns:
-                                matches = re.findall(pattern, contact_text)
-                                if matches:
-                                    contact_info['phone'] = matches[0].strip()
-                                    break
+                            contact_info['phone'] = contact_result.first_value('phone', PHONE_LABEL_ORDER)
                         
                         contact_info['contact_page_found'] = True
                         break
@@ -0,0 +1,45 @@
+"""
+Shared fixtures for the backend tests
+Tests import backend modules the way the scripts do (utils.*, agents on the path)
+"""
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, 'agents'))
+
+CONTACT_COLUMNS = ['contact_id', 'contact_type', 'contact_value', 'organization_name', 'organization_type',
+                   'confidence_score', 'risk_level', 'priority_score', 'category']
+
+SORTED_CONTACTS = [
+    ('gov_phone_0', 'phone', '1800 228 333', 'Administrative Appeals Tribunal', 'government', 0.9, 'safe', 0.0,
+     'Official Services'),
+    ('gov_phone_1', 'phone', '1800 595 160', 'ACCC Infocentre', 'government', 0.9, 'safe', 0.0,
+     'Official Services'),
+    ('hospital_phone_0', 'phone', '(02) 9382 1111', 'Prince of Wales Hospital', 'hospital', 0.9, 'safe', 1.1,
+     'Medical Services'),
+    ('hospital_phone_1', 'phone', '02 6686 3000', 'Tweed Hospital', 'hospital', 0.5, 'suspicious', 2.5,
+     'Medical Services'),
+    ('nsw_gov_7_email', 'email', 'helpline@adc.nsw.gov.au', 'Ageing and Disability Commission, NSW', 'government',
+     0.85, 'safe', 0.0, 'Official Services'),
+    ('nsw_gov_4_website', 'website', 'https://www.aho.nsw.gov.au/', 'Aboriginal Housing Office', 'government',
+     0.85, 'safe', 0.15, 'Official Services'),
+    ('nsw_gov_8_website', 'website', 'https://www.aci.health.nsw.gov.au/', 'Agency for Clinical Innovation, NSW',
+     'government', 0.85, 'safe', 0.15, 'Official Services'),
+    ('threat_0', 'phone', '1800 595 160', 'SCAM: ACCC phone numbers spoofed by scammers', 'threat', 0.8,
+     'threat', 3.0, 'Security Threats'),
+    ('threat_1', 'website', 'http://mygov-refunds.com/login', 'SCAM: myGov refund phishing', 'threat', 0.8,
+     'threat', 3.0, 'Security Threats'),
+    ('threat_2', 'general', None, 'SCAM: Scam job networks', 'threat', 0.8, 'threat', 3.0, 'Security Threats'),
+]
+
+
+@pytest.fixture
+def sorted_contacts():
+    """A small sorted-master frame: legitimate, suspicious and threat contacts of every type"""
+    return pd.DataFrame(SORTED_CONTACTS, columns=CONTACT_COLUMNS)
@@ -0,0 +1,27 @@
+"""Synthetic data and query mix of the verification benchmark"""
+
+from utils.benchmark_verification import ENGINES, benchmark_size, query_mix, synthetic_contacts
+
+
+def test_synthetic_contacts_are_distinct():
+    contacts = synthetic_contacts(5000)
+    assert len(contacts) > 4900
+    assert set(contacts['contact_type']) == {'phone', 'email', 'website'}
+    assert set(contacts['risk_level']) == {'safe', 'threat'}
+
+
+def test_query_mix_proportions():
+    queries = query_mix(synthetic_contacts(2000), 4000)
+    expected = [verdict for _, _, verdict in queries]
+    assert 0.45 < expected.count('legitimate') / len(queries) < 0.55
+    assert 0.30 < expected.count('unknown') / len(queries) < 0.40
+    assert len({value for _, value, _ in queries}) > len(queries) / 2
+
+
+def test_every_engine_runs_and_verdicts_match():
+    info = benchmark_size(500, ENGINES, 300, concurrency=2)
+    assert info['wrong_verdicts'] == 0
+    assert [result['engine'] for result in info['results']] == ['index', 'batch', 'artifact', 'http x2']
+    for result in info['results']:
+        assert result['qps'] > 0 and result['p50_us'] <= result['p99_us'] <= result['p999_us']
+    assert info['results'][-1]['errors'] == 0
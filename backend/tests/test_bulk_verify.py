@@ -0,0 +1,54 @@
+"""Streaming bulk verification of CSV and JSONL files"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from utils.bulk_verify import verify_file
+from utils.verification_index import VerificationIndex
+
+
+@pytest.fixture
+def index(sorted_contacts):
+    return VerificationIndex(sorted_contacts)
+
+
+def test_csv_of_one_type(index, tmp_path):
+    (tmp_path / 'calls.csv').write_text('call_id,caller\n1,02 9382 1111\n2,0412 345 678\n3,\n4,1800595160\n')
+    stats = verify_file(index, tmp_path / 'calls.csv', tmp_path / 'out' / 'verdicts.csv', kind='phone',
+                        column='caller', chunk_size=2)
+    assert stats['rows'] == 4
+    assert stats['verdicts'] == {'legitimate': 1, 'unknown': 1, 'invalid': 1, 'threat': 1}
+
+    out = pd.read_csv(tmp_path / 'out' / 'verdicts.csv', dtype=str)
+    assert out['caller'].tolist()[:2] == ['02 9382 1111', '0412 345 678']      # input kept as text
+    assert out['verify_verdict'].tolist() == ['legitimate', 'unknown', 'invalid', 'threat']
+    assert out['verify_key'].tolist()[:2] == ['+61293821111', '+61412345678']
+    assert out['verify_organization'][0] == 'Prince of Wales Hospital'
+    assert not list((tmp_path / 'out').glob('.tmp-*'))
+
+
+def test_jsonl_with_a_type_per_row(index, tmp_path):
+    queries = [{'type': 'website', 'value': 'http://aho-nsw.gov.au.com/'},
+               {'type': 'phone', 'value': '02 6686 3000'},
+               {'type': 'Email', 'value': 'helpline@adc.nsw.gov.au'},
+               {'type': 'fax', 'value': '02 9382 1111'},
+               {'type': 'phone', 'value': 1800228333}]
+    (tmp_path / 'queries.jsonl').write_text(''.join(json.dumps(query) + '\n' for query in queries))
+    verify_file(index, tmp_path / 'queries.jsonl', tmp_path / 'verdicts.jsonl', chunk_size=3)
+
+    rows = [json.loads(line) for line in (tmp_path / 'verdicts.jsonl').read_text().splitlines()]
+    assert [row['value'] for row in rows] == [str(query['value']) for query in queries]
+    assert [row['verify_verdict'] for row in rows] == ['suspicious', 'suspicious', 'legitimate', 'invalid',
+                                                       'legitimate']
+    assert rows[0]['verify_imitates'] == 'aho.nsw.gov.au'
+    assert rows[4]['verify_organization'] == 'Administrative Appeals Tribunal'
+
+
+def test_missing_columns(index, tmp_path):
+    (tmp_path / 'calls.csv').write_text('caller\n1800 228 333\n')
+    with pytest.raises(KeyError, match="'value'"):
+        verify_file(index, tmp_path / 'calls.csv', tmp_path / 'out.csv', kind='phone')
+    with pytest.raises(KeyError, match="'type'"):
+        verify_file(index, tmp_path / 'calls.csv', tmp_path / 'out.csv', column='caller')
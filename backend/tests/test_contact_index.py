@@ -0,0 +1,41 @@
+"""Saved contact indexes: round trip, and rebuilds for other layouts or sources"""
+
+import numpy as np
+import pytest
+
+import utils.contact_index as contact_index
+from utils.contact_index import ContactIndex, email_keys, phone_keys
+
+
+@pytest.fixture
+def index():
+    return ContactIndex.from_contacts(phones=['1800 228 333', '(02) 9382 1111'], emails=['Help@ADC.nsw.gov.au'],
+                                      websites=['https://www.aho.nsw.gov.au/'], fingerprint='sources-1',
+                                      names=[' Lifeline '])
+
+
+def test_saved_index_reads_back(index, tmp_path):
+    index.save(tmp_path / 'index.npz')
+    loaded = ContactIndex.load(tmp_path / 'index.npz', fingerprint='sources-1')
+    assert loaded.fingerprint == 'sources-1'
+    assert loaded.contains('phones', phone_keys(['+61 1800 228 333'])).tolist() == [True]
+    assert loaded.contains('phones', phone_keys(['1300 000 000'])).tolist() == [False]
+    assert loaded.contains('emails', email_keys(['mailto:help@adc.nsw.gov.au'])).tolist() == [True]
+    assert loaded.contains('names', np.array(['Lifeline'], dtype=object)).tolist() == [True]
+    assert not loaded['unknown'].contains(np.array(['x'], dtype=object)).any()
+
+
+def test_index_from_other_sources_is_rebuilt(index, tmp_path):
+    index.save(tmp_path / 'index.npz')
+    assert ContactIndex.load(tmp_path / 'index.npz', fingerprint='sources-2') is None
+    assert ContactIndex.load(tmp_path / 'missing.npz') is None
+
+
+def test_index_of_another_layout_is_rebuilt(index, tmp_path, monkeypatch):
+    index.save(tmp_path / 'index.npz')
+    monkeypatch.setattr(contact_index, 'INDEX_VERSION', contact_index.INDEX_VERSION + 1)
+    assert ContactIndex.load(tmp_path / 'index.npz') is None
+
+    # Archives from before the layout was versioned
+    np.savez(tmp_path / 'unversioned.npz', fingerprint=np.array(''), kinds=np.array([], dtype=str))
+    assert ContactIndex.load(tmp_path / 'unversioned.npz') is None
@@ -0,0 +1,101 @@
+"""SQLite contact store: stable keys, per-stage upserts, partition replacement and exports"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from utils.contact_store import CONTACT_FIELDS, STANDARD_FIELDS, ContactStore, stable_keys
+
+
+@pytest.fixture
+def contacts(sorted_contacts):
+    contacts = sorted_contacts.copy()
+    contacts['source_agent'] = contacts['organization_type'] + '_agent'
+    return contacts
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ContactStore(tmp_path / 'contacts.db') as store:
+        yield store
+
+
+def standardized(contacts):
+    return contacts[[column for column in STANDARD_FIELDS if column in contacts.columns]]
+
+
+def test_store_uses_write_ahead_logging(store):
+    assert store.connection.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+
+def test_keys_survive_renumbering_and_reformatting(contacts):
+    rescraped = contacts.copy()
+    rescraped['contact_id'] = [f'row_{number}' for number in range(len(rescraped))]
+    rescraped.loc[0, 'contact_value'] = '+61 1800 228 333'
+    rescraped.loc[4, 'contact_value'] = 'HELPLINE@adc.nsw.gov.au'
+    assert stable_keys(rescraped).tolist() == stable_keys(contacts).tolist()
+    assert stable_keys(contacts).is_unique
+
+
+def test_stages_only_write_the_columns_they_provide(store, contacts):
+    assert store.upsert(standardized(contacts), partition='sources') == len(contacts)
+    assert store.query()['risk_level'].isna().all()
+
+    assert store.upsert(contacts) == len(contacts)
+    store.upsert(standardized(contacts), partition='sources')
+    assert len(store) == len(contacts)
+    assert store.find('phone', '1800228333')['risk_level'].tolist() == ['safe']
+    assert store.partitions() == {'sources'}
+
+
+def test_update_fields_leave_other_stages_columns_alone(store, contacts):
+    stage = standardized(contacts).assign(notes='nan')
+    store.upsert(stage, partition='sources')
+    sorted_stage = contacts.assign(notes=None, risk_level='suspicious')
+    assert store.upsert(sorted_stage, update_fields=['risk_level', 'priority_score']) == len(contacts)
+
+    stored = store.query()
+    assert (stored['notes'] == 'nan').all()
+    assert (stored['risk_level'] == 'suspicious').all()
+
+
+def test_find_matches_any_format(store, contacts):
+    store.upsert(contacts)
+    assert set(store.find('phone', '+61 1800 595 160')['contact_id']) == {'gov_phone_1', 'threat_0'}
+    assert store.find('email', 'mailto:Helpline@ADC.nsw.gov.au')['contact_id'].tolist() == ['nsw_gov_7_email']
+    assert store.find('website', 'aho.nsw.gov.au')['contact_id'].tolist() == ['nsw_gov_4_website']
+    assert store.find('phone', 'not a number').empty
+
+
+def test_replace_partition_removes_records_gone_from_the_source(store, contacts):
+    store.replace_partition('government', contacts[contacts['organization_type'] == 'government'])
+    store.replace_partition('threat', contacts[contacts['organization_type'] == 'threat'])
+
+    government = contacts[contacts['organization_type'] == 'government']
+    assert store.replace_partition('government', government.iloc[1:]) == (len(government) - 1, 1)
+    assert store.find('phone', '1800 228 333').empty
+    assert len(store.query(partition_name='threat')) == 3
+    assert store.replace_partition('threat', contacts.iloc[:0]) == (0, 3)
+
+
+def test_query_filters_on_indexed_columns_in_priority_order(store, contacts):
+    store.upsert(contacts)
+    threats = store.query(risk_level='threat', contact_type=['phone', 'website'])
+    assert threats['contact_id'].tolist() == ['threat_0', 'threat_1']
+    assert store.query()['priority_score'].is_monotonic_increasing
+    with pytest.raises(ValueError):
+        store.query(organization_name='ACCC Infocentre')
+
+
+def test_exports_are_generated_on_demand(store, contacts, tmp_path):
+    store.upsert(contacts)
+    assert store.export(tmp_path / 'threats.csv', risk_level='threat') == 3
+    exported = pd.read_csv(tmp_path / 'threats.csv', dtype={'contact_value': str})
+    assert exported.columns.tolist() == CONTACT_FIELDS
+    assert exported['contact_id'].tolist() == ['threat_0', 'threat_1', 'threat_2']
+
+    assert store.export(tmp_path / 'hospitals.json', STANDARD_FIELDS, organization_type='hospital') == 2
+    records = json.loads((tmp_path / 'hospitals.json').read_text())
+    assert [record['contact_value'] for record in records] == ['(02) 9382 1111', '02 6686 3000']
+    assert set(records[0]) == set(STANDARD_FIELDS)
@@ -0,0 +1,197 @@
+"""Critic: per-record rule verdicts, the validation results aggregated from them and grouped inconsistencies"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from critic_agent import CriticAgent
+
+COLUMNS = ['contact_id', 'contact_type', 'contact_value', 'organization_name', 'organization_type', 'source_agent',
+           'address', 'suburb', 'state', 'services', 'confidence_score']
+
+RECORDS = [
+    ('p1', 'phone', '1800 228 333', 'ACCC', 'government', 'gov_agent', '1 St', 'Sydney', 'NSW', 'x', 0.9),
+    ('p2', 'phone', '+44 20 7946 0958', 'Overseas', 'charity', 'charity_agent', None, None, None, None, 0.7),
+    ('p3', 'phone', '0000 000 000', 'Fake', 'threat', 'threat_agent', '', '', '', ' ', 0.8),
+    ('p4', 'phone', 'call us', 'Nobody', 'charity', 'charity_agent', '2 St', 'Picton', None, None, 0.7),
+    ('e1', 'email', ' Help@ADC.nsw.gov.au ', 'ADC', 'government', 'gov_agent', '3 St', None, 'NSW', None, 0.85),
+    ('e2', 'email', 'bad-address', 'Nobody', 'charity', 'charity_agent', None, None, None, None, 0.7),
+    ('w1', 'website', 'HTTPS://www.aho.nsw.gov.au/', 'AHO', 'government', 'gov_agent', None, None, None, None, 0.85),
+    ('w2', 'website', 'http://mygov-refunds.com', 'SCAM', 'threat', 'threat_agent', None, None, None, None, 0.8),
+    ('w3', 'website', 'not a url', 'Nobody', None, None, None, None, None, None, 0.5),
+    ('g1', 'general', np.nan, 'SCAM: jobs', 'threat', 'threat_agent', None, None, None, None, 0.8),
+]
+
+# Differently written contacts of the same and of different organizations
+SHARED_CONTACTS = [
+    ('phone', '1800 228 333', 'Services Australia - Centrelink', '1 Main St, Sydney'),
+    ('phone', '+61 1800 228 333', 'Services Australia \u2013 Centrelink', '1 Main St Sydney'),
+    ('phone', '1800228333', 'Centrelink', '1 Main St, Sydney'),
+    ('phone', '1800 595 160', 'ACCC Infocentre', '23 Marcus Clarke St'),
+    ('phone', '1800-595-160', 'SCAM: ACCC phone numbers spoofed', None),
+    ('email', 'Help@ADC.nsw.gov.au', 'Ageing and Disability Commission', ''),
+    ('email', 'help@adc.nsw.gov.au', 'Ageing and Disability Commission', 'Level 1, 2 Park St'),
+    ('website', 'https://www.aho.nsw.gov.au/', 'Aboriginal Housing Office', '4 Parramatta Sq'),
+    ('website', 'aho.nsw.gov.au', 'Aboriginal Housing Office', '10 Smith St'),
+    ('general', np.nan, 'SCAM: jobs', None),
+    ('general', np.nan, 'SCAM: refunds', None),
+]
+
+
+@pytest.fixture(scope='module')
+def critic():
+    return CriticAgent()
+
+
+@pytest.fixture
+def records():
+    return pd.DataFrame(RECORDS, columns=COLUMNS)
+
+
+def flagged(checks, records, rule):
+    return records.loc[checks[rule], 'contact_id'].tolist()
+
+
+def test_record_rules_flag_each_record(critic, records):
+    checks = critic.evaluate_record_rules(records)
+    assert checks.index.equals(records.index)
+    assert flagged(checks, records, 'phone_australian') == ['p1']
+    assert flagged(checks, records, 'phone_international') == ['p2']
+    # A run of zeros, or no more than two distinct dialled characters
+    assert flagged(checks, records, 'phone_suspicious') == ['p3', 'p4']
+    assert flagged(checks, records, 'email_valid') == ['e1']
+    assert flagged(checks, records, 'email_gov') == ['e1']
+    assert flagged(checks, records, 'website_valid') == ['w1', 'w2']
+    assert flagged(checks, records, 'website_https') == ['w1']
+    assert flagged(checks, records, 'required_complete') == ['p1', 'p2', 'p3', 'p4', 'e1', 'e2', 'w1', 'w2']
+    assert flagged(checks, records, 'optional_complete') == ['p1', 'p4', 'e1']
+    assert set(critic.rule_timings) >= set(critic.rules.rule_names)
+
+
+def test_cleaned_values_are_kept_for_their_contact_type(critic, records):
+    checks = critic.evaluate_record_rules(records)
+    assert checks['phone'].tolist()[:5] == ['1800 228 333', '+44 20 7946 0958', '0000 000 000', 'call us', '']
+    assert checks.loc[4, 'email'] == 'help@adc.nsw.gov.au'
+    assert checks.loc[6, 'website'] == 'https://www.aho.nsw.gov.au/'
+    assert checks.loc[9, ['phone', 'email', 'website']].tolist() == ['', '', '']
+
+
+def test_validation_results(critic, records):
+    checks = critic.evaluate_record_rules(records)
+    phones = critic.validate_phone_numbers(records, checks)
+    assert (phones['total_phones'], phones['valid_australian'], phones['valid_international'],
+            phones['invalid_format']) == (4, 1, 1, 2)
+    assert phones['format_compliance_rate'] == 0.5
+    assert phones['quality_issues'] == [
+        {'contact_id': 'p3', 'phone': '0000 000 000', 'organization': 'Fake', 'issue': 'Invalid phone format'},
+        {'contact_id': 'p4', 'phone': 'call us', 'organization': 'Nobody', 'issue': 'Invalid phone format'},
+    ]
+    assert [issue['contact_id'] for issue in phones['suspicious_patterns']] == ['p3', 'p4']
+
+    emails = critic.validate_emails(records, checks)
+    assert (emails['valid_format'], emails['invalid_format'], emails['gov_domains']) == (1, 1, 1)
+    assert emails['quality_issues'] == [
+        {'contact_id': 'e2', 'email': 'bad-address', 'organization': 'Nobody', 'issue': 'Invalid email format'}]
+
+    websites = critic.validate_websites(records, checks)
+    assert (websites['total_websites'], websites['valid_format'], websites['gov_domains'],
+            websites['https_secured']) == (3, 2, 1, 1)
+    assert [issue['contact_id'] for issue in websites['quality_issues']] == ['w3']
+
+
+def test_completeness_lists_every_missing_required_field(critic, records):
+    completeness = critic.analyze_completeness(records, critic.evaluate_record_rules(records))
+    assert completeness['required_fields_complete'] == 8
+    assert completeness['optional_fields_complete'] == 3
+    assert completeness['missing_data_issues'] == [
+        {'contact_id': 'w3', 'missing_field': 'organization_type', 'organization': 'Nobody'},
+        {'contact_id': 'w3', 'missing_field': 'source_agent', 'organization': 'Nobody'},
+        {'contact_id': 'g1', 'missing_field': 'contact_value', 'organization': 'SCAM: jobs'},
+    ]
+
+
+def test_aggregated_counts_give_the_same_results(critic, records):
+    checks = critic.evaluate_record_rules(records)
+    aggregates = critic.aggregate_verdicts(critic.record_verdicts(records, checks))
+    assert aggregates['records'] == len(records)
+    for validate in (critic.validate_phone_numbers, critic.validate_emails, critic.validate_websites,
+                     critic.analyze_completeness):
+        assert validate(records, checks, aggregates) == validate(records, checks)
+
+
+def test_no_records_of_a_type_gives_no_results(critic, records):
+    phones_only = records[records['contact_type'] == 'phone']
+    checks = critic.evaluate_record_rules(phones_only)
+    assert critic.validate_emails(phones_only, checks) == {}
+    assert critic.validate_websites(phones_only, checks) == {}
+
+
+@pytest.fixture
+def shared_contacts():
+    return pd.DataFrame(SHARED_CONTACTS, columns=['contact_type', 'contact_value', 'organization_name', 'address'])
+
+
+def test_contact_values_normalize_per_type(critic, shared_contacts):
+    keys = critic.normalize_contact_values(shared_contacts)
+    assert keys.iloc[:9].tolist() == [
+        '+611800228333', '+611800228333', '+611800228333', '+611800595160', '+611800595160',
+        'help@adc.nsw.gov.au', 'help@adc.nsw.gov.au', 'aho.nsw.gov.au', 'aho.nsw.gov.au']
+    assert keys.iloc[9:].isna().all()
+
+
+def test_inconsistencies_group_normalized_contacts_and_clustered_names(critic, shared_contacts):
+    analysis = critic.detect_inconsistencies(shared_contacts)
+    # Missing contact values are never duplicates of each other
+    assert analysis['duplicate_contacts'] == [{
+        'contact_value': '1800 595 160',
+        'normalized_value': '+611800595160',
+        'count': 2,
+        'organizations': ['ACCC Infocentre', 'SCAM: ACCC phone numbers spoofed'],
+        'issue': 'Same contact used by multiple organizations'
+    }]
+    assert analysis['organization_name_variations'] == [{
+        'contact_value': '1800 228 333',
+        'name_variants': ['Services Australia - Centrelink', 'Services Australia \u2013 Centrelink', 'Centrelink'],
+        'issue': 'Organization name written differently for the same contact'
+    }]
+    assert [cluster['canonical_name'] for cluster in analysis['organization_clusters']] == ['Centrelink']
+    # Addresses differing only in punctuation, or missing, do not conflict
+    assert analysis['address_inconsistencies'] == [{
+        'organization': 'Aboriginal Housing Office',
+        'addresses': ['4 Parramatta Sq', '10 Smith St'],
+        'issue': 'Conflicting addresses for the same organization'
+    }]
+    # Two non-canonical Centrelink spellings and both conflicting AHO records
+    assert analysis['consistency_score'] == pytest.approx(7 / 11)
+
+
+def test_no_shared_contacts_is_fully_consistent(critic, shared_contacts):
+    analysis = critic.detect_inconsistencies(shared_contacts.iloc[[3, 5, 9]])
+    assert analysis['duplicate_contacts'] == analysis['organization_name_variations'] == []
+    assert analysis['consistency_score'] == 1.0
+
+
+def test_sampling_mode_still_compares_every_record(tmp_path, monkeypatch):
+    # 200 complete phone records; the two sharing a number are found whichever records are sampled
+    df = pd.DataFrame({
+        'contact_id': [f'phone_{i}' for i in range(200)],
+        'contact_type': 'phone',
+        'contact_value': [f'02 9{i:03d} 1234' for i in range(199)] + ['02 9000 1234'],
+        'organization_name': [f'Organization {i}' for i in range(199)] + ['Imitator'],
+        'organization_type': 'government',
+        'source_agent': ['agent_a', 'agent_b'] * 100,
+        'address': '1 Main St', 'suburb': 'Sydney', 'state': 'NSW', 'services': 'Help',
+        'confidence_score': 0.9,
+    })
+    critic = CriticAgent(sample=True)
+    critic.sampling = dict(critic.sampling, min_records=0, sample_size=20, min_per_stratum=5)
+    critic.output_file = str(tmp_path / 'critic_report.json')
+    critic.verdict_cache_file = str(tmp_path / 'critic_verdicts.pkl')
+    monkeypatch.setattr(critic, 'load_standardized_data', lambda: df)
+
+    report = critic.run_quality_review()
+    assert report['sampling']['mode'] == 'sample'
+    assert report['sampling']['sample_size'] == 20
+    assert report['sampling']['full_scan_stages'] == ['inconsistency_detection', 'lookalike_domains']
+    duplicates = report['inconsistency_detection']['duplicate_contacts']
+    assert [duplicate['organizations'] for duplicate in duplicates] == [['Organization 0', 'Imitator']]
@@ -0,0 +1,37 @@
+"""LLM JSON export: search terms from organization names and service descriptions"""
+
+import json
+
+import pytest
+
+from utility.csv_to_llm_json import csv_to_llm_json, search_terms_for
+
+
+@pytest.mark.parametrize('organization, services, expected', [
+    ('Australian Taxation Office', 'General enquiries', ['ato', 'tax', 'taxation']),
+    ('Prince of Wales Hospital', 'Tax help', ['hospital', 'health', 'medical']),
+    # Medicare and Centrelink are also recognised from the services
+    ('Services Australia', 'Medicare and Centrelink payments',
+     ['medicare', 'health', 'centrelink', 'welfare', 'benefits']),
+    ('NSW HEALTH', 'centrelink', ['hospital', 'health', 'medical', 'centrelink', 'welfare', 'benefits']),
+    # A description alone no longer adds the Medicare and Centrelink terms
+    ('Lifeline', 'Crisis support line', []),
+    ('Lifeline', '', []),
+])
+def test_search_terms(organization, services, expected):
+    assert search_terms_for(organization, services) == expected
+
+
+def test_exported_keywords_include_the_search_terms_once(tmp_path):
+    csv_file = tmp_path / 'sorted.csv'
+    csv_file.write_text(
+        'contact_id,contact_type,contact_value,organization_name,services,risk_level,confidence_score\n'
+        'gov_phone_0,phone,132861,Australian Taxation Office,Tax enquiries,safe,0.9\n'
+        'gov_phone_1,phone,1800 000 000,Scam Office,Tax enquiries,threat,0.9\n'
+        'gov_email_0,email,help@ato.gov.au,Australian Taxation Office,,safe,0.9\n', encoding='utf-8')
+    json_file = tmp_path / 'services.json'
+    csv_to_llm_json(str(csv_file), str(json_file))
+
+    services = json.loads(json_file.read_text(encoding='utf-8'))['services']
+    assert [service['id'] for service in services] == ['gov_phone_0']
+    assert services[0]['keywords'] == ['tax', 'australian', 'taxation', 'office', 'ato']
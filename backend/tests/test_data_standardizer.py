@@ -0,0 +1,126 @@
+"""DataStandardizer source conversions against hand-written standardized rows"""
+
+import pandas as pd
+import pytest
+
+from utils.data_standardizer import DataStandardizer
+
+# verified_date is the time of the run; every other column is checked
+CHECKED = ['contact_id', 'contact_type', 'contact_value', 'organization_name', 'organization_type', 'source_agent',
+           'source_url', 'address', 'suburb', 'state', 'postcode', 'services', 'confidence_score', 'notes']
+
+
+@pytest.fixture
+def standardizer(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'data' / 'raw').mkdir(parents=True)
+    return DataStandardizer()
+
+
+def write_raw(name, text):
+    with open(f'data/raw/{name}', 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def rows(df):
+    assert df.columns.tolist() == DataStandardizer().standard_columns
+    return df[CHECKED].to_dict('records')
+
+
+def test_government_services(standardizer):
+    write_raw('government_services.csv',
+              'service_name,phone_number,hours_of_operation,description,source_url\n'
+              ' Tax Office ,13 28 61,Business Hours, General enquiries ,https://directory.gov.au/t\n'
+              'No Phone Agency,,Business Hours,Nothing,https://directory.gov.au/n\n'
+              'Medicare,132 011,,,https://directory.gov.au/m\n')
+    common = dict(contact_type='phone', organization_type='government', source_agent='government_services_scraper',
+                  address='', suburb='', state='Federal', postcode='', confidence_score=0.9)
+    assert rows(standardizer.standardize_government_services()) == [
+        dict(common, contact_id='gov_phone_0', contact_value='13 28 61', organization_name='Tax Office',
+             source_url='https://directory.gov.au/t', services='General enquiries',
+             notes='Federal government directory - Business Hours'),
+        dict(common, contact_id='gov_phone_2', contact_value='132 011', organization_name='Medicare',
+             source_url='https://directory.gov.au/m', services='nan', notes='Federal government directory - nan'),
+    ]
+
+
+def test_nsw_services_skip_the_listen_row_and_keep_phone_email_website_order(standardizer):
+    write_raw('nsw_correct_directory.csv',
+              'agency_name,website,email,phone,street_address,postal_address,source_url,source\n'
+              'Listen,,,,,,https://readspeaker,Service NSW Directory\n'
+              'Aboriginal Affairs,https://aa.nsw.gov.au,enquiries@aa.nsw.gov.au,1800 019 998,'
+              'Level 6 Mascot,PO Box 207,https://service.nsw.gov.au/aa,Service NSW Directory\n'
+              'Arts NSW,https://arts.nsw.gov.au,,,,,https://service.nsw.gov.au/arts,Service NSW Directory\n')
+    common = dict(organization_type='government', source_agent='nsw_correct_scraper', suburb='', state='NSW',
+                  postcode='', services='', confidence_score=0.85)
+    aboriginal = dict(common, organization_name='Aboriginal Affairs', source_url='https://service.nsw.gov.au/aa',
+                      address='Level 6 Mascot', notes='NSW Government Directory - Postal: PO Box 207')
+    assert rows(standardizer.standardize_nsw_services()) == [
+        dict(aboriginal, contact_id='nsw_gov_1_phone', contact_type='phone', contact_value='1800 019 998'),
+        dict(aboriginal, contact_id='nsw_gov_1_email', contact_type='email', contact_value='enquiries@aa.nsw.gov.au'),
+        dict(aboriginal, contact_id='nsw_gov_1_website', contact_type='website', contact_value='https://aa.nsw.gov.au'),
+        dict(common, contact_id='nsw_gov_2_website', contact_type='website', contact_value='https://arts.nsw.gov.au',
+             organization_name='Arts NSW', source_url='https://service.nsw.gov.au/arts', address='nan',
+             notes='NSW Government Directory - Postal: nan'),
+    ]
+
+
+def test_nsw_hospitals(standardizer):
+    write_raw('nsw_hospitals.csv',
+              'hospital_name,hospital_type,phone,email,website,street_address,suburb,postcode,state,'
+              'full_address,local_health_district,services,source\n'
+              'Albury Wodonga Health,No ED,02 6058 4444,,https://awh.org.au,201 Borella Road,Albury,2640,NSW,,'
+              'Albury Wodonga Health,No emergency department,NSW Health API\n')
+    common = dict(contact_id='hospital_0_phone', organization_name='Albury Wodonga Health',
+                  organization_type='hospital', source_agent='nsw_hospitals_agent', source_url='NSW Health API',
+                  address='201 Borella Road', suburb='Albury', state='NSW', postcode='2640',
+                  services='No emergency department', confidence_score=0.95, notes='LHD: Albury Wodonga Health')
+    assert rows(standardizer.standardize_nsw_hospitals()) == [
+        dict(common, contact_type='phone', contact_value='02 6058 4444'),
+        dict(common, contact_id='hospital_0_website', contact_type='website', contact_value='https://awh.org.au'),
+    ]
+
+
+def test_scam_threats_keep_the_threat_type(standardizer):
+    write_raw('scamwatch_threats.csv',
+              'article_title,scam_type,threat_type,threat_value,date_reported,scam_tactics,'
+              'impersonated_organizations,article_url,source\n'
+              'ACCC numbers spoofed,phone_spoofing,phone, 1800 595 160 ,23 Jun 2025,"urgency, authority",'
+              '"ACCC, Bank",https://scamwatch.gov.au/a,Scamwatch\n'
+              'Job scams,job,general,,30 May 2025,greed,NAB,https://scamwatch.gov.au/b,Scamwatch\n')
+    common = dict(organization_type='threat', source_agent='scamwatch_threat_agent', address='', suburb='',
+                  state='', postcode='', confidence_score=0.8)
+    assert rows(standardizer.standardize_scam_threats()) == [
+        dict(common, contact_id='threat_0', contact_type='phone', contact_value='1800 595 160',
+             organization_name='SCAM: ACCC numbers spoofed', source_url='https://scamwatch.gov.au/a',
+             services='urgency, authority', notes='Scam type: phone_spoofing, Impersonates: ACCC, Bank'),
+        # A missing threat value renders as 'nan', as str() did in the row-wise conversion
+        dict(common, contact_id='threat_1', contact_type='general', contact_value='nan',
+             organization_name='SCAM: Job scams', source_url='https://scamwatch.gov.au/b', services='greed',
+             notes='Scam type: job, Impersonates: NAB'),
+    ]
+
+
+def test_charities_without_contacts_get_an_organization_record(standardizer):
+    write_raw('verified_charity_contacts.csv',
+              'charity_name,phone,email,address,suburb,postcode,activities,ABN,website\n'
+              'Picton Food Bank,02 4677 1234,help@pfb.org.au,1 Argyle St,Picton,2571,Food relief,11 222 333 444,'
+              'https://pfb.org.au\n'
+              'Quiet Charity,,,2 Menangle St,Picton,2571,Support,55 666 777 888,\n')
+    common = dict(organization_type='charity', source_agent='acnc_data_agent', state='NSW', suburb='Picton',
+                  postcode='2571', confidence_score=0.7)
+    prefix = 'charity_data/raw/verified_charity_contacts.csv_'
+    food_bank = dict(common, organization_name='Picton Food Bank', source_url='https://pfb.org.au',
+                     address='1 Argyle St', services='Food relief', notes='ABN: 11 222 333 444')
+    assert rows(standardizer.standardize_charity_data()) == [
+        dict(food_bank, contact_id=prefix + '0_phone', contact_type='phone', contact_value='02 4677 1234'),
+        dict(food_bank, contact_id=prefix + '0_email', contact_type='email', contact_value='help@pfb.org.au'),
+        dict(common, contact_id=prefix + '1_org', contact_type='organization', contact_value='ABN: 55 666 777 888',
+             organization_name='Quiet Charity', source_url='nan', address='2 Menangle St', services='Support',
+             notes='ABN: 55 666 777 888'),
+    ]
+
+
+def test_missing_source_file_gives_an_empty_frame(standardizer):
+    df = standardizer.standardize_nsw_hospitals()
+    assert df.empty and df.columns.tolist() == standardizer.standard_columns
@@ -0,0 +1,15 @@
+"""Contact column detection of the data validator"""
+
+import pandas as pd
+
+from utils.data_validator import DataValidator
+
+
+def test_contact_columns_found_by_name():
+    df = pd.DataFrame(columns=['name', 'phone_number', 'Mobile', 'fax', 'contact_id', 'contact_email',
+                               'abn_number', 'website', 'source_url'])
+    assert DataValidator().contact_columns(df) == {
+        'phones': ['phone_number', 'Mobile', 'fax'],
+        'emails': ['contact_email'],
+        'websites': ['website'],
+    }
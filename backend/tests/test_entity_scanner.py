@@ -0,0 +1,53 @@
+"""Entity scanner spans against whole-text pattern matching, and keyword span offsets"""
+
+import pytest
+
+from utils.entity_scanner import EntityScanner, PATTERN_KINDS, compile_entity_pattern
+
+TEXTS = [
+    'Call 1800 595 160 or (02) 9382 1111 today.',
+    'Scam alert issued 29 August 2025: callers claim to be from the ATO (+61 2 9999 8888).',
+    'Email help@agency.gov.au or visit https://www.agency.gov.au/contact before August 29, 2025.',
+    'Ring 13 28 61, 131 450 or 0412 345 678\xa0for help; updated 2025-08-29.',
+    'No contacts here, just prose about refunds and deadlines.',
+    'Reference 12345678901234567890 and time 10:30 are not contacts; mailto:someone@example.org.au',
+    '   1800595160\n\t1300 555 123\r\nend',
+    '',
+]
+
+
+def full_text_spans(text, include_dates=True):
+    """Reference: the combined pattern matched over the whole text"""
+    spans = []
+    for match in compile_entity_pattern(include_dates).finditer(text):
+        name = match.lastgroup
+        matched = match.group(name)
+        value = match.group('url_host') if name == 'url' else matched.strip()
+        spans.append((PATTERN_KINDS[name], name, match.start(), match.end(), matched, value))
+    return spans
+
+
+@pytest.mark.parametrize('text', TEXTS)
+@pytest.mark.parametrize('include_dates', [True, False])
+def test_region_scan_matches_full_text_scan(text, include_dates):
+    scanner = EntityScanner(include_dates=include_dates)
+    spans = [(span.kind, span.label, span.start, span.end, span.text, span.value)
+             for span in scanner.scan_patterns(text)]
+    assert spans == full_text_spans(text, include_dates)
+
+
+def test_scan_orders_pattern_and_keyword_spans():
+    scanner = EntityScanner({'scam_type': {'refund': ['tax refund']}, 'tactic': {'urgency': ['today']}})
+    result = scanner.scan('Your TAX REFUND expires today - call 1800 595 160')
+    assert [(span.kind, span.text) for span in result.spans] == [
+        ('scam_type', 'TAX REFUND'), ('tactic', 'today'), ('phone', '1800 595 160')]
+    assert result.values('phone') == ['1800 595 160']
+    assert result.labels('scam_type') == {'refund'}
+
+
+def test_keyword_spans_slice_the_original_text():
+    scanner = EntityScanner({'scam': {'refund': ['tax refund'], 'city': ['İstanbul']}})
+    text = 'İİİ Your tax refund is ready in İSTANBUL'
+    spans = scanner.scan_keywords(text)
+    assert [(span.label, span.text) for span in spans] == [('refund', 'tax refund'), ('city', 'İSTANBUL')]
+    assert all(text[span.start:span.end] == span.text for span in spans)
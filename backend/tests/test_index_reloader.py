@@ -0,0 +1,81 @@
+"""Background rebuild and swap of the verification index"""
+
+import os
+
+import pytest
+
+from utils.index_reloader import IndexReloader
+from utils.verification_index import VerificationIndex
+
+
+@pytest.fixture
+def files(tmp_path, sorted_contacts):
+    master, threats = tmp_path / 'master.csv', tmp_path / 'threats.csv'
+    sorted_contacts[sorted_contacts['risk_level'] != 'threat'].to_csv(master, index=False)
+    sorted_contacts[sorted_contacts['risk_level'] == 'threat'].head(0).to_csv(threats, index=False)
+    return master, threats, sorted_contacts
+
+
+def publish(path, df):
+    """Rewrite a pipeline output with a new modification time"""
+    df.to_csv(path, index=False)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+@pytest.fixture
+def reloader(files):
+    master, threats, _ = files
+    reloader = IndexReloader([master, threats], lambda: VerificationIndex.from_files(master, threats))
+    assert reloader.reload()
+    return reloader
+
+
+def test_new_threats_go_live_once_written(files, reloader):
+    master, threats, contacts = files
+    old_index = reloader.index
+    assert old_index.verify('phone', '1800 595 160')['verdict'] == 'legitimate'
+
+    publish(threats, contacts[contacts['risk_level'] == 'threat'])
+    assert not reloader.poll()                  # changed since the last check: wait for the writer
+    assert reloader.poll()
+    assert reloader.index is not old_index
+    assert reloader.index.verify('phone', '1800 595 160')['verdict'] == 'threat'
+    assert old_index.verify('phone', '1800 595 160')['verdict'] == 'legitimate'     # in-flight readers
+    assert reloader.metrics()['reloads'] == 2
+    assert not reloader.poll()
+
+
+def test_unchanged_content_is_not_rebuilt(files, reloader):
+    master, _, contacts = files
+    version, index = reloader.version, reloader.index
+    publish(master, contacts[contacts['risk_level'] != 'threat'])
+    assert not reloader.poll() and not reloader.poll()
+    assert reloader.index is index and reloader.version == version
+
+
+def test_failed_rebuild_keeps_the_current_index(files, reloader):
+    master, _, contacts = files
+    index = reloader.index
+    master.write_text('not,a\nsorted,master\n')
+    os.utime(master, ns=(0, os.stat(master).st_mtime_ns + 10 ** 9))
+    assert not reloader.poll() and not reloader.poll()
+    assert reloader.index is index
+    metrics = reloader.metrics()
+    assert metrics['reload_errors'] == 1 and metrics['last_error'].startswith('ValueError')
+    assert not reloader.poll()                  # not retried until the files change again
+
+    publish(master, contacts)
+    reloader.poll()
+    assert reloader.poll()
+    assert reloader.index.verify('phone', '1800 595 160')['verdict'] == 'threat'
+
+
+def test_swap_callback(files, reloader):
+    master, threats, contacts = files
+    swapped = []
+    reloader.on_swap = swapped.append
+    publish(threats, contacts[contacts['risk_level'] == 'threat'])
+    reloader.poll()
+    reloader.poll()
+    assert swapped == [reloader.index]
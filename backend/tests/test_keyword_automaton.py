@@ -0,0 +1,111 @@
+"""Aho-Corasick keyword automaton (native and pure Python) against plain substring search, and the classifier on it"""
+
+import pytest
+
+import utils.keyword_automaton as keyword_automaton
+from utils.keyword_automaton import KeywordAutomaton, KeywordClassifier, fold_case
+
+KEYWORDS = ['he', 'she', 'his', 'hers', 'tax refund', 'refund', 'government', 'gov', 'İstanbul', 'a']
+
+TEXTS = [
+    'ushers',
+    'She said HIS tax refund from the Government was a refund scam',
+    'İİİ hers İSTANBUL istanbul',
+    'govgovernment',
+    '',
+    'no keywords here? just bbb',
+]
+
+# 'emergency' is listed after 'police' although 'ambulance' and 'fire' overlap both
+CATEGORIES = {
+    'police': ['police', 'crime stoppers'],
+    'emergency': ['ambulance', 'fire', '000', 'police'],
+    'health': ['hospital', 'health', 'ambulance'],
+}
+
+
+@pytest.fixture(params=['python', 'native'])
+def engine(request, monkeypatch):
+    if request.param == 'native':
+        if keyword_automaton.ahocorasick is None:
+            pytest.skip('pyahocorasick not installed')
+    else:
+        monkeypatch.setattr(keyword_automaton, 'ahocorasick', None)
+    return request.param
+
+
+def substring_matches(keywords, text):
+    """Reference: every (overlapping) occurrence of every keyword"""
+    haystack = fold_case(text)
+    found = []
+    for key in {fold_case(keyword) for keyword in keywords}:
+        start = haystack.find(key)
+        while start >= 0:
+            found.append((start, start + len(key), key))
+            start = haystack.find(key, start + 1)
+    return sorted(found)
+
+
+@pytest.mark.parametrize('text', TEXTS)
+def test_matches_equal_substring_search(engine, text):
+    automaton = KeywordAutomaton((keyword, keyword) for keyword in KEYWORDS).build()
+    assert sorted(automaton.iter_matches(text)) == substring_matches(KEYWORDS, text)
+
+
+def test_payloads_and_case_sensitivity(engine):
+    automaton = KeywordAutomaton([('government', 'scam_type'), ('Government', 'tactic')]).build()
+    assert automaton.payloads == {'government': ['scam_type', 'tactic']}
+    assert automaton.find_keywords('GOVERNMENT') == {'government'}
+
+    sensitive = KeywordAutomaton([('ATO', 'org')], case_sensitive=True).build()
+    assert sensitive.find_keywords('the ATO and the ato') == {'ATO'}
+
+
+def test_empty_automaton_matches_nothing(engine):
+    assert list(KeywordAutomaton().build().iter_matches('anything')) == []
+
+
+def test_fold_case_keeps_offsets():
+    assert fold_case('İSTANBUL') == 'istanbul'
+    assert len(fold_case('İİİ x')) == 5
+    assert fold_case('Plain Text') == 'plain text'
+
+
+def test_classifier_labels_follow_definition_order(engine):
+    classifier = KeywordClassifier(CATEGORIES)
+    assert classifier.labels('Ambulance Service of NSW') == ['emergency', 'health']
+    assert classifier.labels('NSW Health - Police liaison') == ['police', 'emergency', 'health']
+    assert classifier.labels('HOSPITAL at the Fire station') == ['emergency', 'health']
+    assert classifier.labels('Lifeline') == []
+    assert classifier.labels('') == classifier.labels(None) == []
+
+
+def test_classifier_first_and_matches(engine):
+    classifier = KeywordClassifier(CATEGORIES)
+    assert classifier.first('Dial 000 or visit the hospital') == 'emergency'
+    assert classifier.first('Crime Stoppers NSW') == 'police'
+    assert classifier.first('Lifeline', default='other') == 'other'
+    assert classifier.matches('Fire and Rescue NSW')
+    assert not classifier.matches('Lifeline')
+    assert not classifier.matches('')
+
+
+def test_classifier_batches_scan_each_distinct_text_once(engine, monkeypatch):
+    classifier = KeywordClassifier(CATEGORIES)
+    texts = ['NSW Police Force', 'Lifeline', 'NSW Police Force', '', 'Tweed Hospital', 'Lifeline']
+    expected_labels = [classifier.labels(text) for text in texts]
+    expected_matches = [classifier.matches(text) for text in texts]
+
+    scanned = []
+    iter_matches = classifier.automaton.iter_matches
+
+    def counting(text, prepared=False):
+        scanned.append(text)
+        return iter_matches(text, prepared)
+
+    monkeypatch.setattr(classifier.automaton, 'iter_matches', counting)
+    assert classifier.labels_many(texts) == expected_labels
+    assert sorted(scanned) == ['Lifeline', 'NSW Police Force', 'Tweed Hospital']
+    scanned.clear()
+    assert classifier.matches_many(texts) == expected_matches
+    assert sorted(scanned) == ['Lifeline', 'NSW Police Force', 'Tweed Hospital']
@@ -0,0 +1,120 @@
+"""Lookalike domain index: each match class, the length-based edit limits and owned hosts"""
+
+import pytest
+
+from utils.lookalike_index import LookalikeIndex, allowed_distance, edit_distance, skeleton
+
+LEGITIMATE = [
+    'https://www.servicesaustralia.gov.au/',
+    'https://www.ato.gov.au',
+    'https://www.aho.nsw.gov.au/',
+    'help@humanservices.gov.au',
+    'https://www.service.nsw.gov.au',
+    'https://www.medicare.gov.au',
+    'https://www.lifeline.org.au',
+    'https://www.commbank.com.au',
+    'https://acnc.gov.au',
+]
+
+# 'ѕ' is the Cyrillic dze
+PUNYCODE = 'ѕervicesaustralia.gov.au'.encode('idna').decode('ascii')
+
+
+@pytest.fixture(scope='module')
+def index():
+    return LookalikeIndex(LEGITIMATE)
+
+
+def only_match(index, candidate):
+    matches = index.lookup(candidate)
+    assert len(matches) == 1, matches
+    return matches[0]['domain'], matches[0]['match'], matches[0]['distance']
+
+
+def test_punycode_and_homoglyph_hosts_are_decoded(index):
+    assert PUNYCODE.startswith('xn--')
+    for candidate in (PUNYCODE, f'https://{PUNYCODE}/login', 'ѕervicesaustralia.gov.au'):
+        assert only_match(index, candidate) == ('servicesaustralia.gov.au', 'homoglyph', 0)
+
+
+@pytest.mark.parametrize('candidate, domain', [
+    ('servicesaustra1ia.gov.au', 'servicesaustralia.gov.au'),     # 1 for l
+    ('medlcare.gov.au', 'medicare.gov.au'),                       # l for i
+    ('cornmbank.com.au', 'commbank.com.au'),                      # rn for m
+    ('c0mmbank.com.au', 'commbank.com.au'),                       # 0 for o
+])
+def test_confusable_characters(index, candidate, domain):
+    assert only_match(index, candidate) == (domain, 'confusable', 0)
+
+
+@pytest.mark.parametrize('candidate, domain', [
+    ('ato.gov.au.refund-portal.com', 'ato.gov.au'),
+    ('servicesaustralia.gov.au.com', 'servicesaustralia.gov.au'),
+    ('ato-gov-au.com', 'ato.gov.au'),
+    ('service-nsw.gov.au.com', 'service.nsw.gov.au'),
+])
+def test_embedded_hosts(index, candidate, domain):
+    assert only_match(index, candidate) == (domain, 'embedded', 0)
+
+
+@pytest.mark.parametrize('candidate, domain', [
+    ('lifeline.com', 'lifeline.org.au'),
+    ('medicare.gov', 'medicare.gov.au'),
+    ('acnc.com', 'acnc.gov.au'),
+    # Another state's umbrella is another owner
+    ('aho.vic.gov.au', 'aho.nsw.gov.au'),
+])
+def test_suffix_swaps(index, candidate, domain):
+    assert only_match(index, candidate) == (domain, 'suffix_swap', 0)
+
+
+@pytest.mark.parametrize('candidate, domain, distance', [
+    ('servicesaustrlia.gov.au', 'servicesaustralia.gov.au', 1),
+    ('servisesaustrailia.gov.au', 'servicesaustralia.gov.au', 2),
+    ('lifelne.org.au', 'lifeline.org.au', 1),
+    ('comnbank.com.au', 'commbank.com.au', 1),
+    ('humanservics.gov.au', 'humanservices.gov.au', 1),
+])
+def test_typos_within_the_allowed_distance(index, candidate, domain, distance):
+    assert only_match(index, candidate) == (domain, 'typo', distance)
+
+
+def test_allowed_distance_grows_with_name_length():
+    assert [allowed_distance('x' * length) for length in (1, 4, 5, 8, 9, 20)] == [0, 0, 1, 1, 2, 2]
+
+
+@pytest.mark.parametrize('candidate', [
+    'acnx.gov.au',                  # 4 letters: exact only
+    'cmmbnk.com.au',                # 8 letters: one edit
+    'xervicexaustralix.gov.au',     # 17 letters: two edits
+    'example.com',
+])
+def test_edits_beyond_the_limit_are_not_reported(index, candidate):
+    assert index.lookup(candidate) == []
+
+
+@pytest.mark.parametrize('candidate', [
+    'ato.gov.au',
+    'https://www.ato.gov.au/individuals',
+    'my.ato.gov.au',
+    'aho.nsw.gov.au',
+    # Under the NSW umbrella, so owned by the same government as aho.nsw.gov.au
+    'transport.nsw.gov.au',
+    'https://www.medicare.gov.au',
+])
+def test_hosts_of_the_legitimate_owners_are_not_reported(index, candidate):
+    assert index.lookup(candidate) == []
+
+
+def test_from_contacts_indexes_non_threat_websites_and_email_domains(sorted_contacts):
+    index = LookalikeIndex.from_contacts(sorted_contacts)
+    assert sorted(index.hosts) == ['aci.health.nsw.gov.au', 'adc.nsw.gov.au', 'aho.nsw.gov.au']
+    assert index.screen(['http://mygov-refunds.com/login', 'aho.qld.gov.au', 'aho.qld.gov.au']) == {
+        'aho.qld.gov.au': [{'domain': 'aho.nsw.gov.au', 'distance': 0, 'match': 'suffix_swap'}]}
+
+
+def test_edit_distance_counts_transpositions_once():
+    assert edit_distance('lifeline', 'lifeilne', 2) == 1
+    assert edit_distance('commbank', 'cmmbnk', 1) == 2
+    assert edit_distance('abc', 'abcdef', 2) == 3
+    assert skeleton('rn-0') == 'mo'
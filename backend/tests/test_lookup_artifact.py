@@ -0,0 +1,67 @@
+"""Memory-mapped binary lookup artifact written from the verification index"""
+
+import pytest
+
+import utils.lookup_artifact as lookup_artifact
+from utils.lookup_artifact import LookupArtifact, write_artifact
+from utils.verification_index import VerificationIndex
+
+
+@pytest.fixture
+def index(sorted_contacts):
+    return VerificationIndex(sorted_contacts)
+
+
+def every_key(index):
+    return [(kind, entry['key']) for kind, entries in index.entries.items() for entry in entries.values()]
+
+
+def test_exact_matches_agree_with_the_index(index, tmp_path):
+    assert write_artifact(index, tmp_path / 'contacts.lookup') == len(index)
+    with LookupArtifact(tmp_path / 'contacts.lookup') as artifact:
+        assert len(artifact) == len(index)
+        for kind, key in every_key(index):
+            assert artifact.lookup(kind, key) == index.verify(kind, key)
+        assert artifact.lookup('phone', '1800595160')['verdict'] == 'threat'
+        assert artifact.lookup('email', 'mailto:HELPLINE@adc.nsw.gov.au')['organization'] == \
+            'Ageing and Disability Commission, NSW'
+
+
+@pytest.mark.parametrize('kind, value, verdict', [
+    ('phone', '0412 345 678', 'unknown'),
+    ('phone', 'call us', 'invalid'),
+    ('email', 'someone@example.org', 'unknown'),
+    ('website', 'localhost', 'invalid'),
+])
+def test_values_not_listed(index, tmp_path, kind, value, verdict):
+    write_artifact(index, tmp_path / 'contacts.lookup')
+    with LookupArtifact(tmp_path / 'contacts.lookup') as artifact:
+        assert artifact.lookup(kind, value) == index.verify(kind, value)
+        assert artifact.lookup(kind, value)['verdict'] == verdict
+
+
+def test_hash_collisions_are_confirmed_against_the_key(index, tmp_path, monkeypatch):
+    monkeypatch.setattr(lookup_artifact, 'key_hash', lambda key: 42)
+    write_artifact(index, tmp_path / 'contacts.lookup')
+    with LookupArtifact(tmp_path / 'contacts.lookup') as artifact:
+        for kind, key in every_key(index):
+            assert artifact.lookup(kind, key) == index.verify(kind, key)
+        assert artifact.lookup('website', 'example.org')['verdict'] == 'unknown'
+
+
+def test_empty_index(tmp_path):
+    write_artifact(VerificationIndex(), tmp_path / 'empty.lookup')
+    with LookupArtifact(tmp_path / 'empty.lookup') as artifact:
+        assert len(artifact) == 0
+        assert artifact.lookup('phone', '1800 228 333')['verdict'] == 'unknown'
+
+
+def test_other_files_are_rejected(index, tmp_path):
+    write_artifact(index, tmp_path / 'contacts.lookup')
+    data = bytearray((tmp_path / 'contacts.lookup').read_bytes())
+    data[8] = lookup_artifact.FORMAT_VERSION + 1
+    (tmp_path / 'future.lookup').write_bytes(bytes(data))
+    (tmp_path / 'contacts.csv').write_text('contact_id,contact_type\n' * 10)
+    for name in ('future.lookup', 'contacts.csv'):
+        with pytest.raises(ValueError):
+            LookupArtifact(tmp_path / name)
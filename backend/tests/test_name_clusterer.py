@@ -0,0 +1,77 @@
+"""Near-duplicate organization name clustering"""
+
+import pytest
+
+from utils.name_clusterer import NameClusterer, cluster_names, cluster_summary, normalize_name
+
+CENTRELINK = ['Services Australia – Centrelink', 'CENTRELINK', 'Centrelink', 'Centrelink', 'Centrelink Services',
+              'Services Australia - Centrelink']
+
+NAMES = CENTRELINK + [
+    'Medicare', 'Services Australia - Medicare',
+    'Lifeline Australia', 'Life Line Australia',
+    'Prince of Wales Hospital', 'Prince of Wales Private Hospital',
+    'Australian Taxation Office', 'Australian Tax Office',
+    None, '',
+]
+
+
+@pytest.fixture(scope='module')
+def clusters():
+    return cluster_names(NAMES)
+
+
+def cluster_of(clusters, name):
+    return clusters.loc[clusters['name'] == name, 'cluster_id'].iloc[0]
+
+
+def test_normalize_name_folds_case_punctuation_and_ampersands():
+    assert normalize_name('Services Australia – Centrelink') == 'services australia centrelink'
+    assert normalize_name("St Vincent's  Health & Aged Care") == 'st vincents health and aged care'
+    assert normalize_name(None) == normalize_name(float('nan')) == ''
+
+
+def test_centrelink_variants_share_one_cluster(clusters):
+    centrelink = clusters[clusters['name'].isin(CENTRELINK)]
+    assert centrelink['cluster_id'].nunique() == 1
+    # The most frequent spelling names the cluster
+    assert set(centrelink['canonical_name']) == {'Centrelink'}
+
+
+def test_spacing_variants_share_a_cluster(clusters):
+    assert cluster_of(clusters, 'Lifeline Australia') == cluster_of(clusters, 'Life Line Australia')
+
+
+@pytest.mark.parametrize('first, second', [
+    ('Centrelink', 'Medicare'),
+    ('Services Australia - Centrelink', 'Services Australia - Medicare'),
+    ('Prince of Wales Hospital', 'Prince of Wales Private Hospital'),
+    ('Australian Taxation Office', 'Australian Tax Office'),
+])
+def test_distinct_organizations_stay_apart(clusters, first, second):
+    assert cluster_of(clusters, first) != cluster_of(clusters, second)
+
+
+def test_missing_names_have_no_canonical_name(clusters):
+    missing = clusters.iloc[-2:]
+    assert (missing['normalized_name'] == '').all()
+    assert missing['canonical_name'].isna().all()
+
+
+def test_summary_lists_clusters_with_several_spellings(clusters):
+    summary = cluster_summary(clusters)
+    assert summary[0] == {'canonical_name': 'Centrelink', 'records': 6,
+                          'variants': ['Services Australia – Centrelink', 'CENTRELINK', 'Centrelink',
+                                       'Centrelink Services', 'Services Australia - Centrelink']}
+    assert [cluster['canonical_name'] for cluster in summary] == ['Centrelink', 'Medicare', 'Lifeline Australia']
+
+
+def test_result_is_aligned_with_the_input():
+    clusters = cluster_names(NAMES[::-1])
+    assert clusters['name'].tolist() == NAMES[::-1]
+    assert cluster_names([]).empty
+
+
+def test_bands_must_divide_the_permutations():
+    with pytest.raises(ValueError):
+        NameClusterer(num_perm=10, bands=3)
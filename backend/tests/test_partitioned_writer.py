@@ -0,0 +1,43 @@
+"""Single-pass routing of records to overlapping CSV and Parquet sinks"""
+
+import pandas as pd
+import pytest
+
+from utils.partitioned_writer import PartitionedWriter
+
+
+@pytest.fixture
+def frame():
+    df = pd.DataFrame({
+        'name': ['Lifeline', 'Beyond Blue', 'Scam Hotline', 'Kids Helpline'],
+        'risk_level': ['safe', 'safe', 'threat', 'safe'],
+        'email': [None, None, 'refunds@mygov-refunds.com', 'counsellor@kidshelpline.com.au'],
+        'priority': [1.5, 1.2, 0.1, 1.4],
+    })
+    sinks = {
+        'all.csv': lambda groups: groups['risk_level'].notna(),
+        'safe.csv': lambda groups: groups['risk_level'] == 'safe',
+        'threat.csv': lambda groups: groups['risk_level'] == 'threat',
+    }
+    return df, df[['risk_level']], sinks
+
+
+def test_csv_records_routed_to_every_matching_sink(tmp_path, frame):
+    df, keys, sinks = frame
+    writer = PartitionedWriter('csv', chunk_size=3)
+    counts = writer.write(df, keys, {str(tmp_path / name): select for name, select in sinks.items()})
+    assert counts == {str(tmp_path / 'all.csv'): 4, str(tmp_path / 'safe.csv'): 3, str(tmp_path / 'threat.csv'): 1}
+    safe = pd.read_csv(tmp_path / 'safe.csv')
+    assert safe['name'].tolist() == ['Lifeline', 'Beyond Blue', 'Kids Helpline']
+
+
+def test_parquet_chunk_with_an_all_null_column(tmp_path, frame):
+    pytest.importorskip('pyarrow')
+    df, keys, sinks = frame
+    writer = PartitionedWriter('parquet', chunk_size=2)       # first chunk has no emails
+    counts = writer.write(df, keys, {str(tmp_path / name): select for name, select in sinks.items()})
+    assert counts[str(tmp_path / 'all.parquet')] == 4
+
+    written = pd.read_parquet(tmp_path / 'all.parquet')
+    assert written['email'].isna().tolist() == [True, True, False, False]
+    assert written['priority'].tolist() == df['priority'].tolist()
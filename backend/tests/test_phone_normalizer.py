@@ -0,0 +1,42 @@
+"""Phone extraction and normalization shared by the scrapers"""
+
+import pytest
+
+from gov_services_scraper import GovServicesAgent
+from utils.entity_scanner import EntityScanner
+from utils.phone_normalizer import classify_phone, extract_phone, normalize_phone
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Phone: 131 450', '131 450'),
+    ('Phone: 132011', '132011'),
+    ('Call 13 14 50 (TIS National)', '13 14 50'),
+    ('Phone: 1300 555 727<br/>Fax: 02 9999 9999', '1300 555 727'),
+    ('Phone: 1800 228 333', '1800 228 333'),
+    ('(02) 9382 1111', '(02) 9382 1111'),
+    ('no number here', ''),
+])
+def test_extract_phone(text, expected):
+    assert extract_phone(text) == expected
+
+
+@pytest.mark.parametrize('text', ['131 450', '131450', '13 14 50'])
+def test_thirteen_numbers_normalize_to_one_key(text):
+    assert normalize_phone(text) == '+61131450'
+    assert classify_phone(text) == '13'
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Phone: 131 450', '131 450'),
+    ('Phone: 132 011<br/>Mon-Fri', '132 011'),
+    ('Phone: 132011', '132011'),
+    ('Phone: Not listed', 'Not listed'),
+])
+def test_gov_services_clean_phone_number(text, expected):
+    assert GovServicesAgent().clean_phone_number(text) == expected
+
+
+def test_entity_scanner_finds_thirteen_numbers():
+    phones = [entity for entity in EntityScanner().scan_patterns('Interpreters on 131 450 or 132011.')
+              if entity.kind == 'phone']
+    assert [phone.text for phone in phones] == ['131 450', '132011']
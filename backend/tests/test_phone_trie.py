@@ -0,0 +1,45 @@
+"""Digit trie queries over canonical phone keys"""
+
+import pytest
+
+from utils.phone_normalizer import phone_key
+from utils.phone_trie import PhoneTrie, key_digits
+
+NUMBERS = ['02 9382 1111', '02 9382 1150', '02 9382 2000', '1800 228 333', '131 450', '000']
+
+
+@pytest.fixture
+def trie():
+    return PhoneTrie.from_entries({phone_key(number): number for number in NUMBERS})
+
+
+def test_exact(trie):
+    assert len(trie) == len(NUMBERS)
+    assert trie.exact(phone_key('+61 2 9382 1111')) == '02 9382 1111'
+    assert trie.exact(phone_key('000')) == '000'
+    assert trie.exact(612938211) is None                                 # prefix of a listed number only
+    assert trie.exact(phone_key('02 9382 1112')) is None
+
+
+def test_longest_prefix(trie):
+    assert trie.longest_prefix(phone_key('02 9382 1199')) == ('612938211', 2)
+    assert trie.longest_prefix(phone_key('02 9382 7777')) == ('6129382', 3)
+    assert trie.longest_prefix(phone_key('03 9000 0000')) == ('61', 5)
+    assert trie.longest_prefix(phone_key('1800 228 333')) == ('611800228333', 1)
+
+
+def test_neighbours_nearest_first(trie):
+    assert trie.neighbours(phone_key('02 9382 1140')) == [
+        (phone_key('02 9382 1150'), '02 9382 1150'), (phone_key('02 9382 1111'), '02 9382 1111')]
+    assert trie.neighbours(phone_key('02 9382 1111')) == [(phone_key('02 9382 1150'), '02 9382 1150')]
+    assert trie.neighbours(phone_key('02 9382 1111'), digits=3) == [(phone_key('02 9382 1150'), '02 9382 1150')]
+    assert trie.neighbours(phone_key('02 9382 1111'), digits=4) == [
+        (phone_key('02 9382 1150'), '02 9382 1150'), (phone_key('02 9382 2000'), '02 9382 2000')]
+    assert trie.neighbours(phone_key('1800 228 301')) == [(phone_key('1800 228 333'), '1800 228 333')]
+    assert trie.neighbours(phone_key('1300 228 333')) == []
+
+
+def test_key_digits():
+    assert key_digits(0) == '000'
+    assert key_digits(112) == '112'
+    assert key_digits(61131450) == '61131450'
@@ -0,0 +1,102 @@
+"""Result cache hits, negative caching, TinyLFU admission and invalidation on index swaps"""
+
+import threading
+
+import pytest
+
+from utils.result_cache import ResultCache
+from utils.verification_index import VerificationIndex
+from utils.verification_server import VerificationServer
+from test_verification import request
+
+
+class CountingIndex(VerificationIndex):
+    """Verification index counting the queries that reach it"""
+
+    def __init__(self, contacts):
+        super().__init__(contacts)
+        self.probes = 0
+
+    def verify(self, kind, value):
+        self.probes += 1
+        return super().verify(kind, value)
+
+
+@pytest.fixture
+def index(sorted_contacts):
+    return CountingIndex(sorted_contacts)
+
+
+def test_repeated_query_is_answered_from_the_cache(index):
+    cache = ResultCache(index, capacity=10)
+    first = cache.verify(index, 'phone', '1800 595 160')
+    assert cache.verify(index, 'phone', '1800 595 160') == first == index.verify('phone', '1800 595 160')
+    assert index.probes == 2
+    assert cache.metrics()['hits'] == 1 and cache.metrics()['misses'] == 1
+
+
+def test_unknown_and_invalid_verdicts_are_cached(index):
+    cache = ResultCache(index, capacity=10)
+    for _ in range(3):
+        assert cache.verify(index, 'phone', '0400 000 000')['verdict'] == 'unknown'
+        assert cache.verify(index, 'email', 'not an email')['verdict'] == 'invalid'
+    assert index.probes == 2
+
+    uncached = ResultCache(index, capacity=10, negative=False)
+    uncached.verify(index, 'phone', '0400 000 000')
+    uncached.verify(index, 'phone', '0400 000 000')
+    assert index.probes == 4 and len(uncached) == 0
+
+
+def test_scan_of_one_off_queries_keeps_frequent_entries(index):
+    cache = ResultCache(index, capacity=4)
+    hot = ['1800 595 160', '1800 228 334', '13 28 61', '000']
+    for _ in range(3):
+        for value in hot:
+            cache.verify(index, 'phone', value)
+    for number in range(200):
+        cache.verify(index, 'phone', f'0400 {number:06d}')
+
+    assert cache.metrics()['rejections'] > 0
+    assert {value for _, value in cache.entries} == set(hot)
+
+
+def test_full_cache_evicts_the_least_recently_used_entry(index):
+    cache = ResultCache(index, capacity=2)
+    cache.verify(index, 'phone', '0400 000 001')
+    cache.verify(index, 'phone', '0400 000 002')
+    for _ in range(2):
+        cache.verify(index, 'phone', '0400 000 003')
+    assert list(cache.entries) == [('phone', '0400 000 002'), ('phone', '0400 000 003')]
+    assert cache.metrics()['evictions'] == 1
+
+
+def test_swap_invalidates_and_stale_index_bypasses_the_cache(sorted_contacts, index):
+    cache = ResultCache(index, capacity=10)
+    assert cache.verify(index, 'phone', '1800 595 160')['verdict'] == 'threat'
+
+    replacement = VerificationIndex(sorted_contacts[sorted_contacts['risk_level'] != 'threat'])
+    cache.invalidate(replacement)
+    assert len(cache) == 0
+    assert cache.verify(replacement, 'phone', '1800 595 160')['verdict'] == 'legitimate'
+    # A request still running on the old index neither reads nor fills the cache
+    assert cache.verify(index, 'phone', '1800 595 160')['verdict'] == 'threat'
+    assert cache.verify(replacement, 'phone', '1800 595 160')['verdict'] == 'legitimate'
+    assert cache.metrics()['invalidations'] == 1
+
+
+def test_server_reports_cache_metrics_and_invalidates_on_swap(sorted_contacts, index):
+    server = VerificationServer(('127.0.0.1', 0), index, cache=ResultCache(index, capacity=10))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        for _ in range(3):
+            assert request(server, 'GET', '/verify/phone?value=1800595160')[1]['verdict'] == 'threat'
+        assert index.probes == 1
+        assert request(server, 'GET', '/health')[1]['cache']['hit_rate'] == pytest.approx(2 / 3, abs=1e-4)
+
+        server.swap_index(VerificationIndex(sorted_contacts[sorted_contacts['risk_level'] != 'threat']))
+        assert request(server, 'GET', '/verify/phone?value=1800595160')[1]['verdict'] == 'legitimate'
+    finally:
+        server.shutdown()
+        server.server_close()
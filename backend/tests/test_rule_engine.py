@@ -0,0 +1,166 @@
+"""Declarative rule engine: every operator, guards, negation, outputs and rule file loading"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import rule_engine
+from utils.rule_engine import COMBINING_OPERATORS, VALUE_OPERATORS, RuleSet, load_rule_spec
+from critic_agent import RULES_FILE
+
+SPEC = {
+    'rules': [
+        {'name': 'is_phone', 'op': 'equals', 'column': 'kind', 'value': 'phone'},
+        {'name': 'known_kind', 'op': 'isin', 'column': 'kind', 'values': ['phone', 'email']},
+        {'name': 'email_shaped', 'op': 'matches', 'column': 'value', 'transform': ['strip', 'lower'],
+         'pattern': r'^[a-z]+@[a-z.]+$'},
+        {'name': 'gov', 'op': 'contains', 'column': 'value', 'transform': ['lower'], 'value': '.gov.au'},
+        {'name': 'https', 'op': 'startswith', 'column': 'value', 'transform': ['strip', 'lower'],
+         'value': 'https://'},
+        {'name': 'missing_value', 'op': 'missing', 'column': 'value'},
+        {'name': 'freecall', 'op': 'phone_type_in', 'column': 'value', 'when': 'is_phone', 'values': ['1800', '1300']},
+        {'name': 'repeated', 'op': 'repeated_digits', 'column': 'value', 'when': ['is_phone', '!missing_value'],
+         'transform': ['strip'], 'run': '0000', 'max_distinct': 2},
+        {'name': 'all_phone_checks', 'op': 'all_of', 'rules': ['is_phone', 'freecall']},
+        {'name': 'any_flag', 'op': 'any_of', 'rules': ['gov', 'repeated']},
+        {'name': 'no_flag', 'op': 'none_of', 'rules': ['gov', 'repeated', 'missing_value']},
+        {'name': 'mostly_typed', 'op': 'min_fraction', 'fraction': 0.5,
+         'rules': ['known_kind', '!missing_value', 'https', 'gov']},
+        {'name': 'phone_not_freecall', 'op': 'all_of', 'when': 'is_phone', 'rules': ['!freecall']},
+    ],
+    'outputs': {
+        'phone': {'column': 'value', 'when': 'is_phone', 'transform': ['strip']},
+        'lowered': {'column': 'value', 'transform': ['lower']},
+    },
+    'components': {
+        'validity': {'rates': [{'rule': 'freecall', 'of': 'is_phone'}, {'rule': 'gov', 'of': 'is_website'}]},
+        'blend': {'combine': 'weighted', 'rates': [{'rule': 'no_flag', 'weight': 0.75},
+                                                   {'rule': 'known_kind', 'weight': 0.25}]},
+    },
+}
+
+RECORDS = pd.DataFrame({
+    'kind': ['phone', 'phone', 'phone', 'email', 'website', 'website', None],
+    'value': [' 1800 228 333 ', '0000 000 000', None, ' Help@ADC.nsw.gov.au', 'HTTPS://aho.nsw.gov.au',
+              'http://example.com', ''],
+}, index=[10, 11, 12, 13, 14, 15, 16])
+
+
+@pytest.fixture(scope='module')
+def checks():
+    return RuleSet(SPEC).evaluate(RECORDS)
+
+
+def verdict(checks, rule):
+    return checks[rule].tolist()
+
+
+def test_spec_covers_every_operator():
+    assert {rule['op'] for rule in SPEC['rules']} == set(VALUE_OPERATORS) | set(COMBINING_OPERATORS)
+
+
+@pytest.mark.parametrize('rule, expected', [
+    ('is_phone', [True, True, True, False, False, False, False]),
+    ('known_kind', [True, True, True, True, False, False, False]),
+    ('email_shaped', [False, False, False, True, False, False, False]),
+    # Without 'strip' the leading space stays, and missing values read as 'nan'
+    ('gov', [False, False, False, True, True, False, False]),
+    ('https', [False, False, False, False, True, False, False]),
+    ('missing_value', [False, False, True, False, False, False, True]),
+    ('freecall', [True, False, False, False, False, False, False]),
+    ('repeated', [False, True, False, False, False, False, False]),
+    ('all_phone_checks', [True, False, False, False, False, False, False]),
+    ('any_flag', [False, True, False, True, True, False, False]),
+    ('no_flag', [True, False, False, False, False, True, False]),
+    ('mostly_typed', [True, True, False, True, True, False, False]),
+    ('phone_not_freecall', [False, True, True, False, False, False, False]),
+])
+def test_rule_verdicts(checks, rule, expected):
+    assert verdict(checks, rule) == expected
+
+
+def test_verdicts_are_aligned_booleans(checks):
+    assert checks.index.equals(RECORDS.index)
+    assert all(checks[rule].dtype == bool for rule in RuleSet(SPEC).rule_names)
+
+
+def test_outputs_are_transformed_text_inside_their_guard(checks):
+    assert verdict(checks, 'phone') == ['1800 228 333', '0000 000 000', 'nan', '', '', '', '']
+    assert checks.loc[13, 'lowered'] == ' help@adc.nsw.gov.au'
+
+
+def test_each_distinct_value_is_evaluated_once(monkeypatch):
+    seen = []
+
+    def contains(values, rule):
+        seen.append(len(values))
+        return np.zeros(len(values), dtype=bool)
+
+    monkeypatch.setitem(VALUE_OPERATORS, 'contains', contains)
+    records = pd.DataFrame({'kind': ['phone'] * 6, 'value': ['a', 'b', 'a', None, None, 'b']})
+    RuleSet(SPEC).evaluate(records)
+    assert seen == [3]
+
+
+def test_timings_cover_every_rule():
+    rules = RuleSet(SPEC)
+    rules.evaluate(RECORDS)
+    assert list(rules.timings) == rules.rule_names
+
+
+def test_empty_guard_and_empty_frame():
+    rules = RuleSet(SPEC)
+    emails = rules.evaluate(RECORDS.iloc[[3]])
+    assert not emails[['freecall', 'repeated', 'phone_not_freecall']].any(axis=None)
+    assert rules.evaluate(RECORDS.iloc[:0]).empty
+
+
+def test_rates_and_components(checks):
+    rules = RuleSet(SPEC)
+    counts = {rule: int(checks[rule].sum()) for rule in rules.rule_names}
+    assert rules.rate(counts, 'freecall', of='is_phone') == pytest.approx(1 / 3)
+    assert rules.rate(counts, 'gov', of='is_website') is None
+    assert rules.rate(counts, 'no_flag', total=0) is None
+    scores = rules.component_scores(counts, len(RECORDS))
+    # Rates without records are left out of the mean
+    assert scores['validity'] == pytest.approx(1 / 3)
+    assert scores['blend'] == pytest.approx(0.75 * 2 / 7 + 0.25 * 4 / 7)
+
+
+@pytest.mark.parametrize('rule, message', [
+    ({'name': 'bad', 'op': 'between', 'column': 'value'}, "Unknown operator 'between'"),
+    ({'name': 'bad', 'op': 'contains', 'column': 'value', 'value': 'x', 'transform': ['upper']},
+     "Unknown transform 'upper'"),
+])
+def test_invalid_rules_are_rejected(rule, message):
+    with pytest.raises(ValueError, match=message):
+        RuleSet({'rules': [rule]})
+
+
+def test_rule_files_load_from_json_and_yaml(tmp_path):
+    json_file = tmp_path / 'rules.json'
+    json_file.write_text(json.dumps(SPEC))
+    assert load_rule_spec(json_file) == SPEC
+    rules = RuleSet.from_file(json_file)
+    assert rules.rule_names == [rule['name'] for rule in SPEC['rules']]
+    pd.testing.assert_frame_equal(rules.evaluate(RECORDS), RuleSet(SPEC).evaluate(RECORDS))
+
+    yaml = pytest.importorskip('yaml')
+    yaml_file = tmp_path / 'rules.yaml'
+    yaml_file.write_text(yaml.safe_dump(SPEC))
+    assert load_rule_spec(yaml_file) == SPEC
+
+
+def test_yaml_rules_need_pyyaml(tmp_path, monkeypatch):
+    monkeypatch.setattr(rule_engine, 'yaml', None)
+    yaml_file = tmp_path / 'rules.yml'
+    yaml_file.write_text('rules: []\n')
+    with pytest.raises(ImportError):
+        load_rule_spec(yaml_file)
+
+
+def test_critic_rule_file_compiles():
+    rules = RuleSet.from_file(RULES_FILE)
+    assert 'required_complete' in rules.rule_names
@@ -0,0 +1,40 @@
+"""Stratified sampling design and confidence levels of the estimator"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.sampling import StratifiedEstimator, stratified_sample, z_score
+
+
+@pytest.fixture
+def design():
+    df = pd.DataFrame({'source': ['a'] * 900 + ['b'] * 100, 'valid': [True, False] * 500})
+    sample, design = stratified_sample(df, ['source'], 200, min_per_stratum=30, seed=1)
+    return sample, design
+
+
+@pytest.mark.parametrize('level, expected', [(0.90, 1.645), (0.95, 1.960), (0.99, 2.576), (0.995, 2.807)])
+def test_z_score(level, expected):
+    assert z_score(level) == pytest.approx(expected, abs=1e-3)
+
+
+@pytest.mark.parametrize('level', [0, 1, 95, -0.5])
+def test_unsupported_confidence_level_is_rejected(design, level):
+    with pytest.raises(ValueError):
+        StratifiedEstimator(design[1], level)
+
+
+def test_wider_interval_for_higher_confidence(design):
+    sample, design = design
+    widths = []
+    for level in (0.95, 0.995):
+        interval = StratifiedEstimator(design, level).ratio_interval(sample['valid'].to_numpy(dtype=float))
+        widths.append(interval['ci_high'] - interval['ci_low'])
+    assert widths[1] > widths[0]
+
+
+def test_every_stratum_gets_its_minimum(design):
+    sample, design = design
+    assert sample['source'].value_counts()['b'] >= 30
+    assert np.isclose(design['weight'].sum(), 1000)
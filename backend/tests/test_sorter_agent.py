@@ -0,0 +1,150 @@
+"""Sorter: column-wise risk, priority and region against the original row-wise logic, and its store input"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.contact_store import ContactStore
+from utils.phone_normalizer import parse_phone
+from sorter_agent import SorterAgent
+
+# Values cycled through the synthetic frame to reach every branch
+ORG_TYPES = ['government', 'hospital', 'charity', 'threat', 'Government', 'THREAT', 'other']
+CONTACT_TYPES = ['phone', 'phone', 'email', 'website', 'phone']
+PHONE_VARIANTS = ['1800 000 000', '1300 123 456', '13 11 14', '02 9999 9999', '0411 111 111', '12345', '000',
+                  '+44 20 7946 0958', 'call us', ' 1800 22 8333 ', None, np.nan]
+EMAIL_VARIANTS = ['info@health.nsw.gov.au', 'help@charity.org.au', 'ADMIN@DSS.GOV.AU', 'bad-address', None]
+STATE_VARIANTS = ['NSW', 'nsw', 'Federal', 'FEDERAL', 'VIC', 'qld', 'SA', 'wa', 'TAS', 'NT', 'ACT', 'XX', '',
+                  None, np.nan]
+NAME_VARIANTS = ['Federal Court of Australia', 'NSW Police Force', 'Fire and Rescue NSW', 'Lifeline',
+                 'State Emergency Service', 'Ambulance Service of NSW', 'Dial 000 Info', None, np.nan]
+CONFIDENCE_VARIANTS = [0.5, 0.6, 0.65, 0.7, 0.75, 0.8, 0.9, 0.95, 1.0, np.nan]
+
+
+def legacy_assess_risk_level(row):
+    """Original row-wise assess_risk_level"""
+    org_type = row['organization_type'].lower()
+    confidence = row['confidence_score']
+    contact_value = str(row['contact_value']).strip()
+    if org_type == 'threat':
+        return 'threat'
+    if org_type in ['government', 'hospital'] and confidence >= 0.8:
+        return 'safe'
+    if org_type == 'charity' and confidence >= 0.7:
+        return 'safe'
+    if confidence < 0.6:
+        return 'suspicious'
+    if row['contact_type'] == 'phone':
+        phone = parse_phone(contact_value)
+        if phone.number_type == 'invalid':
+            return 'suspicious'
+        if len(set(phone.digits)) <= 2:
+            return 'suspicious'
+    return 'safe'
+
+
+def legacy_calculate_priority_score(row, priority_mapping):
+    """Original row-wise calculate_priority_score"""
+    org_type = row['organization_type'].lower()
+    base_priority = priority_mapping.get(org_type, {}).get('priority', 5)
+    confidence_bonus = row['confidence_score'] * 10
+    emergency_keywords = ['emergency', 'police', 'ambulance', 'fire', 'rescue', '000']
+    if any(keyword in str(row['organization_name']).lower() for keyword in emergency_keywords):
+        base_priority = 0
+    if row['contact_type'] == 'phone' and parse_phone(row['contact_value']).number_type in ('1800', '1300'):
+        confidence_bonus += 2
+    if row['contact_type'] == 'email' and '.gov.au' in str(row['contact_value']).lower():
+        confidence_bonus += 3
+    final_score = base_priority - (confidence_bonus / 10)
+    return max(0, final_score)
+
+
+def legacy_categorize_by_geography(row):
+    """Original row-wise categorize_by_geography"""
+    state = str(row.get('state', '')).upper()
+    org_name = str(row['organization_name']).lower()
+    if state == 'FEDERAL' or 'federal' in org_name:
+        return 'Federal'
+    elif state == 'NSW':
+        return 'NSW'
+    elif state in ['VIC', 'QLD', 'SA', 'WA', 'TAS', 'NT', 'ACT']:
+        return state
+    else:
+        return 'Unknown'
+
+
+def legacy_columns(df, sorter):
+    return {
+        'risk_level': df.apply(legacy_assess_risk_level, axis=1),
+        'priority_score': df.apply(lambda row: legacy_calculate_priority_score(row, sorter.priority_mapping), axis=1),
+        'geographic_region': df.apply(legacy_categorize_by_geography, axis=1)
+    }
+
+
+def vectorized_columns(df, sorter):
+    return {
+        'risk_level': sorter.assess_risk_level(df),
+        'priority_score': sorter.calculate_priority_score(df),
+        'geographic_region': sorter.categorize_by_geography(df)
+    }
+
+
+def synthetic_frame(rows=600):
+    """Standardized-looking records cycling every variant list (lengths differ, so combinations vary)"""
+    cycle = lambda values: list(itertools.islice(itertools.cycle(values), rows))
+    df = pd.DataFrame({
+        'organization_type': cycle(ORG_TYPES),
+        'contact_type': cycle(CONTACT_TYPES),
+        'organization_name': cycle(NAME_VARIANTS),
+        'state': cycle(STATE_VARIANTS),
+        'confidence_score': cycle(CONFIDENCE_VARIANTS),
+    })
+    phones = cycle(PHONE_VARIANTS)
+    emails = cycle(EMAIL_VARIANTS)
+    df['contact_value'] = [phones[i] if kind == 'phone' else emails[i] if kind == 'email'
+                           else 'https://www.example.gov.au' for i, kind in enumerate(df['contact_type'])]
+    return df
+
+
+@pytest.fixture(scope='module')
+def sorter():
+    return SorterAgent()
+
+
+def test_synthetic_frame_reaches_every_branch(sorter):
+    legacy = legacy_columns(synthetic_frame(), sorter)
+    assert set(legacy['risk_level']) == {'threat', 'safe', 'suspicious'}
+    assert set(legacy['geographic_region']) == {'Federal', 'NSW', 'VIC', 'QLD', 'SA', 'WA', 'TAS', 'NT', 'ACT',
+                                                'Unknown'}
+    assert (legacy['priority_score'] == 0).any() and (legacy['priority_score'] > 4).any()
+
+
+@pytest.mark.parametrize('column', ['risk_level', 'priority_score', 'geographic_region'])
+def test_column_wise_matches_row_wise(sorter, column):
+    df = synthetic_frame()
+    expected = legacy_columns(df, sorter)[column]
+    actual = vectorized_columns(df, sorter)[column]
+    pd.testing.assert_series_equal(actual.astype(object), expected.astype(object), check_names=False)
+
+
+def test_missing_state_column_is_unknown_unless_federal(sorter):
+    df = synthetic_frame().drop(columns='state')
+    expected = df.apply(legacy_categorize_by_geography, axis=1)
+    assert sorter.categorize_by_geography(df).tolist() == expected.tolist()
+
+
+def test_sorter_reads_standardized_partitions_from_the_store(sorted_contacts, tmp_path):
+    records = sorted_contacts.assign(source_agent='agent', state='nan')
+    sorter = SorterAgent()
+    sorter.store_file = str(tmp_path / 'contacts.db')
+    assert sorter.load_standardized_from_store() is None
+
+    with ContactStore(sorter.store_file) as contacts:
+        contacts.replace_partition('sources', records.drop(columns=['risk_level', 'priority_score', 'category']))
+        contacts.upsert(records.assign(organization_name='Loaded from elsewhere'))
+    df = sorter.load_standardized_from_store()
+    assert df['contact_id'].tolist() == records['contact_id'].tolist()
+    assert df['state'].isna().all()
+    assert 'risk_level' not in df
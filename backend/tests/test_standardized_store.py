@@ -0,0 +1,57 @@
+"""Partition staleness of the standardized store and the standardizer's --force flag"""
+
+import sys
+
+import pandas as pd
+
+import utils.data_standardizer as data_standardizer
+from utils.standardized_store import StandardizedStore, fingerprint_inputs
+
+
+def make_store(tmp_path, version=''):
+    return StandardizedStore([('source', [str(tmp_path / 'raw.csv')])], store_dir=tmp_path / 'standardized',
+                             merged_file=tmp_path / 'merged.csv', version=version)
+
+
+def build(tmp_path, version=''):
+    (tmp_path / 'raw.csv').write_text('name\nLifeline\n')
+    store = make_store(tmp_path, version)
+    store.write_partition('source', pd.DataFrame({'name': ['Lifeline']}))
+    return store
+
+
+def test_partition_up_to_date_until_its_input_changes(tmp_path):
+    build(tmp_path)
+    assert make_store(tmp_path).stale_partitions() == []
+    (tmp_path / 'raw.csv').write_text('name\nBeyond Blue\n')
+    assert make_store(tmp_path).stale_partitions() == ['source']
+
+
+def test_partition_stale_when_the_standardizer_version_changes(tmp_path):
+    build(tmp_path, version='v1')
+    assert make_store(tmp_path, version='v1').stale_partitions() == []
+    assert make_store(tmp_path, version='v2').stale_partitions() == ['source']
+
+
+def test_force_rebuilds_every_partition(tmp_path):
+    build(tmp_path)
+    assert make_store(tmp_path).stale_partitions(force=True) == ['source']
+
+
+def test_unversioned_fingerprint_is_unchanged(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'raw.csv').write_bytes(b'name\nLifeline\n')
+    files = ['raw.csv', 'missing.csv']
+    # The digest fingerprint_inputs gave before it took a version
+    assert fingerprint_inputs(files) == 'f403fca1c7e1793e44d58823b35a8814b2055915'
+    assert fingerprint_inputs(files, data_standardizer.STANDARDIZER_VERSION) != fingerprint_inputs(files)
+
+
+def test_force_flag(monkeypatch):
+    calls = []
+    monkeypatch.setattr(data_standardizer.DataStandardizer, 'generate_standardized_dataset',
+                        lambda self, max_workers=None, force=False: calls.append(force))
+    for argv, force in [([], False), (['--force'], True)]:
+        monkeypatch.setattr(sys, 'argv', ['data_standardizer.py'] + argv)
+        data_standardizer.main()
+        assert calls.pop() is force
@@ -0,0 +1,209 @@
+"""Verification index verdicts and the HTTP/JSON server's request handling"""
+
+import http.client
+import json
+import threading
+
+import pandas as pd
+import pytest
+
+from utils.index_reloader import IndexReloader
+from utils.verification_index import RESULT_FIELDS, VerificationIndex
+from utils.verification_server import VerificationServer
+
+
+@pytest.fixture
+def index(sorted_contacts):
+    return VerificationIndex(sorted_contacts)
+
+
+@pytest.fixture
+def server(index):
+    server = VerificationServer(('127.0.0.1', 0), index)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def request(server, method, path, body=None):
+    connection = http.client.HTTPConnection(*server.server_address, timeout=5)
+    try:
+        connection.request(method, path, body=body)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+def test_exact_phone_match_in_any_format(index):
+    result = index.verify('phone', '+61 2 9382 1111')
+    assert result['verdict'] == 'legitimate'
+    assert result['organization'] == 'Prince of Wales Hospital'
+    assert result['risk_level'] == 'safe'
+    assert result['priority'] == 1.1
+    assert result['match'] == 'exact'
+    assert result['key'] == '+61293821111'
+
+
+def test_threat_record_outranks_legitimate_record_for_the_same_number(index):
+    result = index.verify('phone', '1800595160')
+    assert result['verdict'] == 'threat'
+    assert result['organization_type'] == 'threat'
+    assert result['records'] == 2
+
+
+def test_suspicious_record(index):
+    assert index.verify('phone', '02 6686 3000')['verdict'] == 'suspicious'
+
+
+def test_exact_email_match_ignores_case_and_mailto(index):
+    result = index.verify('email', 'mailto:HELPLINE@adc.nsw.gov.au ')
+    assert result['verdict'] == 'legitimate'
+    assert result['organization'] == 'Ageing and Disability Commission, NSW'
+
+
+def test_website_matches_host_and_its_subdomains(index):
+    assert index.verify('website', 'aho.nsw.gov.au/contact')['match'] == 'exact'
+    result = index.verify('website', 'https://portal.aho.nsw.gov.au/')
+    assert result['verdict'] == 'legitimate'
+    assert result['organization'] == 'Aboriginal Housing Office'
+    assert result['match'] == 'domain'
+
+
+def test_email_domain_falls_back_to_the_organization_website(index):
+    result = index.verify('email', 'someone@aho.nsw.gov.au')
+    assert result['verdict'] == 'legitimate'
+    assert result['match'] == 'domain'
+
+
+def test_threat_website(index):
+    result = index.verify('website', 'https://www.mygov-refunds.com/')
+    assert result['verdict'] == 'threat'
+
+
+def test_lookalike_website_is_suspicious(index):
+    result = index.verify('website', 'http://aho-nsw.gov.au.com/')
+    assert result['verdict'] == 'suspicious'
+    assert result['match'] == 'lookalike'
+    assert result['imitates'] == 'aho.nsw.gov.au'
+    assert result['organization'] is None
+
+
+def test_unknown_values(index):
+    for kind, value in [('phone', '0412 345 678'), ('email', 'someone@example.org'), ('website', 'example.org')]:
+        result = index.verify(kind, value)
+        assert result['verdict'] == 'unknown'
+        assert result['organization'] is None
+        assert result['match'] is None
+
+
+def test_values_that_do_not_normalize_are_invalid(index):
+    assert index.verify('phone', 'call us')['verdict'] == 'invalid'
+    assert index.verify('email', 'not-an-address')['verdict'] == 'invalid'
+    assert index.verify('website', 'localhost')['verdict'] == 'invalid'
+
+
+def test_unknown_contact_type(index):
+    with pytest.raises(ValueError):
+        index.verify('fax', '02 9382 1111')
+
+
+def test_get_verify(server):
+    status, result = request(server, 'GET', '/verify/phone?value=1800%20228%20333')
+    assert status == 200
+    assert result['organization'] == 'Administrative Appeals Tribunal'
+
+
+def test_post_batch(server):
+    body = json.dumps({'queries': [{'type': 'phone', 'value': '1800 595 160'},
+                                   {'type': 'website', 'value': 'example.org'}]})
+    status, result = request(server, 'POST', '/verify', body)
+    assert status == 200
+    assert [r['verdict'] for r in result['results']] == ['threat', 'unknown']
+
+
+def test_health(server):
+    status, result = request(server, 'GET', '/health')
+    assert status == 200
+    assert result['status'] == 'ok'
+    assert result['keys']['phone'] == 4
+
+
+@pytest.mark.parametrize('method, path, body, status', [
+    ('POST', '/verify', '{"type": "phone", "value": ', 400),             # bad JSON
+    ('POST', '/verify', '{"type": "phone"}', 400),                       # missing value
+    ('POST', '/verify', '{"value": "1800 228 333"}', 400),               # missing type
+    ('POST', '/verify', '{"type": "phone", "value": 1800228333}', 400),  # value not a string
+    ('GET', '/verify/phone', None, 400),                                 # missing value parameter
+    ('GET', '/lookup/phone?value=1', None, 404),                         # unknown route
+    ('POST', '/lookup', '{}', 404),
+    ('GET', '/verify/fax?value=1', None, 404),                           # unknown contact type
+])
+def test_request_errors(server, method, path, body, status):
+    actual, result = request(server, method, path, body)
+    assert actual == status
+    assert 'error' in result
+
+
+def test_connection_kept_alive_between_queries(server):
+    connection = http.client.HTTPConnection(*server.server_address, timeout=5)
+    try:
+        for value in ['1800 228 333', '02 9382 1111']:
+            connection.request('GET', f'/verify/phone?value={value.replace(" ", "%20")}')
+            response = connection.getresponse()
+            assert response.status == 200
+            assert json.loads(response.read())['verdict'] == 'legitimate'
+            assert not response.will_close
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize('kind, values', [
+    ('phone', ['1800 228 333', '(02) 9382 1111', '1800228333', '0412 345 678', 'call us', None, '1800 595 160']),
+    ('email', ['HELPLINE@adc.nsw.gov.au', 'someone@aho.nsw.gov.au', 'x@example.org', 'not-an-address', None]),
+    ('website', ['aho.nsw.gov.au', 'https://portal.aho.nsw.gov.au/', 'http://aho-nsw.gov.au.com/', 'localhost']),
+])
+def test_batch_matches_single_queries(index, kind, values):
+    results = index.verify_batch(kind, pd.Series(values, index=range(10, 10 + len(values))))
+    assert list(results.index) == list(range(10, 10 + len(values)))
+    for value, (_, row) in zip(values, results.iterrows()):
+        expected = index.verify(kind, value)
+        assert row.to_dict() == {field: expected[field] for field in RESULT_FIELDS}
+
+
+def test_number_next_to_a_threat_number_is_suspicious(index):
+    result = index.verify('phone', '1800 595 161')
+    assert result['verdict'] == 'suspicious'
+    assert result['match'] == 'neighbour'
+    assert result['key'] == '+611800595161'
+    assert index.verify('phone', '1800 228 334')['verdict'] == 'unknown'     # next to a legitimate number only
+    assert index.verify('phone', '1800 595 260')['verdict'] == 'unknown'     # another block
+
+
+def test_batch_flags_threat_neighbours(index):
+    results = index.verify_batch('phone', ['1800 595 161', '1800 595 199', '1800 595 160', '1800 228 334'])
+    assert results['match'].tolist() == ['neighbour', 'neighbour', 'exact', None]
+
+
+def test_health_reports_the_reloaded_index_version(sorted_contacts, tmp_path):
+    master = tmp_path / 'master.csv'
+    sorted_contacts.to_csv(master, index=False)
+    reloader = IndexReloader([master], lambda: VerificationIndex.from_files(master, None))
+    reloader.reload()
+    server = VerificationServer(('127.0.0.1', 0), reloader.index, reloader=reloader)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        status, health = request(server, 'GET', '/health')
+        assert status == 200
+        assert health['index_version'] == reloader.version[:12]
+        assert health['reloads'] == 1
+
+        replacement = VerificationIndex(sorted_contacts[sorted_contacts['risk_level'] != 'threat'])
+        reloader.on_swap(replacement)
+        assert request(server, 'GET', '/verify/phone?value=1800595160')[1]['verdict'] == 'legitimate'
+    finally:
+        server.shutdown()
+        server.server_close()
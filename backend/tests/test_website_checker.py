@@ -0,0 +1,164 @@
+"""Website liveness checks against a local HTTP stand-in (no network access)"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+
+import utils.website_checker as website_checker
+from utils.website_checker import LivenessCache, WebsiteChecker, check_url
+
+SLOW_SECONDS = 1.0
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Live, HEAD-refusing, HEAD-dropping, missing, redirecting and slow pages"""
+
+    def do_HEAD(self):
+        if self.path == '/no-head':
+            self._reply(405)
+        elif self.path == '/slow-no-head':
+            time.sleep(SLOW_SECONDS * 0.6)
+            self._reply(405)
+        elif self.path == '/drop-head':
+            self.close_connection = True        # no response at all
+        else:
+            self._route()
+
+    def do_GET(self):
+        self._route()
+
+    def _route(self):
+        path = urlsplit(self.path).path
+        if path == '/slow':
+            time.sleep(SLOW_SECONDS)
+        elif path == '/slow-no-head':
+            time.sleep(SLOW_SECONDS * 0.6)
+        if path in ('/live', '/no-head', '/drop-head', '/slow', '/slow-no-head'):
+            self._reply(200)
+        elif path == '/moved':
+            self._reply(301, {'Location': '/live'})
+        else:
+            self._reply(404)
+
+    def _reply(self, status, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def site():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize('path, alive, status', [
+    ('/live', True, 200),
+    ('/no-head', True, 200),            # 405 on HEAD, GET fallback
+    ('/drop-head', True, 200),          # HEAD dropped at the socket, GET fallback
+    ('/missing', False, 404),
+])
+def test_liveness_verdicts(site, path, alive, status):
+    result = check_url(site + path, timeout=5)
+    assert result['alive'] is alive
+    assert result['status'] == status
+    assert result['tls_valid'] is None          # plain HTTP
+    assert result['latency_ms'] is not None
+
+
+def test_redirect_on_the_same_site(site):
+    result = check_url(site + '/moved', timeout=5)
+    assert result['alive'] and result['redirected']
+    assert result['final_url'] == site + '/live'
+    assert not result['redirect_offsite']
+
+
+def test_slow_site_times_out(site):
+    result = check_url(site + '/slow', timeout=SLOW_SECONDS / 4)
+    assert not result['alive']
+    assert result['status'] is None
+    assert 'Timeout' in result['error']
+
+
+def test_deadline_cuts_a_check_short(site):
+    started = time.monotonic()
+    assert check_url(site + '/slow', timeout=5, deadline=started + SLOW_SECONDS / 4) is None
+    assert time.monotonic() - started < SLOW_SECONDS / 2
+    assert check_url(site + '/live', timeout=5, deadline=started) is None
+
+
+def test_get_fallback_only_gets_the_time_left(site):
+    # HEAD and GET each fit the per-request timeout, but not both the deadline
+    assert check_url(site + '/slow-no-head', timeout=5)['alive']
+    started = time.monotonic()
+    assert check_url(site + '/slow-no-head', timeout=5, deadline=started + SLOW_SECONDS) is None
+    assert time.monotonic() - started < SLOW_SECONDS * 1.1
+
+
+def test_unreachable_site():
+    result = check_url('http://127.0.0.1:9/', timeout=1)
+    assert not result['alive']
+    assert result['error']
+
+
+def test_cache_entries_expire_after_the_ttl(tmp_path):
+    cache = LivenessCache(tmp_path / 'cache.json', ttl=60)
+    now = time.time()
+    cache.put({'url': 'http://example.test/', 'alive': True, 'checked_at': now - 30})
+    cache.put({'url': 'http://old.test/', 'alive': True, 'checked_at': now - 90})
+    assert cache.get('http://example.test/', now)['alive']
+    assert cache.get('http://example.test/', now + 31) is None
+    assert cache.get('http://old.test/', now) is None
+
+    cache.save()
+    reloaded = LivenessCache(tmp_path / 'cache.json', ttl=60)
+    assert list(reloaded.entries) == ['http://example.test/']
+
+
+def test_checker_reuses_fresh_results(site, tmp_path):
+    urls = [site + '/live', site + '/missing', site + '/live']
+    checker = WebsiteChecker(cache_file=tmp_path / 'cache.json', timeout=5, budget=30)
+    results, stats = checker.check(urls)
+    assert stats == dict(stats, urls=2, cached=0, checked=2, unchecked=0)
+    assert results[site + '/live']['alive'] and not results[site + '/missing']['alive']
+
+    _, stats = WebsiteChecker(cache_file=tmp_path / 'cache.json', timeout=5, budget=30).check(urls)
+    assert stats == dict(stats, cached=2, checked=0)
+
+    _, stats = WebsiteChecker(cache_file=tmp_path / 'cache.json', ttl=0, timeout=5, budget=30).check(urls)
+    assert stats == dict(stats, cached=0, checked=2)
+
+
+def test_time_budget_leaves_queued_urls_unchecked(site, tmp_path):
+    urls = [f"{site}/slow?{i}" for i in range(4)]
+    checker = WebsiteChecker(cache_file=tmp_path / 'cache.json', concurrency=1, timeout=5, budget=SLOW_SECONDS / 2)
+    started = time.perf_counter()
+    results, stats = checker.check(urls)
+    assert stats['unchecked'] >= 3
+    assert len(results) == stats['checked']
+    assert time.perf_counter() - started < SLOW_SECONDS * 3
+
+
+def test_checks_running_at_the_deadline_are_not_waited_for(tmp_path, monkeypatch):
+    # A check that overruns its timeout (e.g. a server trickling its response)
+    monkeypatch.setattr(website_checker, 'check_url', lambda url, *args: time.sleep(SLOW_SECONDS * 2))
+    checker = WebsiteChecker(cache_file=tmp_path / 'cache.json', concurrency=4, timeout=5, budget=SLOW_SECONDS / 4)
+    started = time.perf_counter()
+    results, stats = checker.check([f"http://example.test/{i}" for i in range(4)])
+    assert time.perf_counter() - started < SLOW_SECONDS
+    assert results == {}
+    assert stats == dict(stats, checked=0, unchecked=4)
+    assert LivenessCache(tmp_path / 'cache.json').entries == {}
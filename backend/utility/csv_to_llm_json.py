@@ -7,8 +7,28 @@ Converts the sorted_contacts_master.csv to a JSON format optimized for LLM RAG q
 import csv
 import json
 import re
+import os
+import sys
 from typing import List, Dict, Any
 
+# Add the backend directory to the Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.phone_normalizer import format_phone
+from utils.keyword_automaton import KeywordClassifier
+
+# Search terms added for common queries, keyed by the keywords that trigger them.
+# Some categories are also recognised from the service description.
+SEARCH_TERM_CATEGORIES = {
+    'tax': {'keywords': ['tax', 'ato'], 'terms': ['ato', 'tax', 'taxation'], 'in_services': False},
+    'health': {'keywords': ['hospital', 'health'], 'terms': ['hospital', 'health', 'medical'], 'in_services': False},
+    'medicare': {'keywords': ['medicare'], 'terms': ['medicare', 'health'], 'in_services': True},
+    'centrelink': {'keywords': ['centrelink'], 'terms': ['centrelink', 'welfare', 'benefits'], 'in_services': True}
+}
+
+SEARCH_TERM_CLASSIFIER = KeywordClassifier(
+    {label: category['keywords'] for label, category in SEARCH_TERM_CATEGORIES.items()})
+
 def extract_keywords(text: str) -> List[str]:
     """Extract relevant keywords from service descriptions for better LLM matching"""
     if not text or text == 'nan':
@@ -45,21 +65,16 @@ def standardize_phone(phone: str) -> str:
     if not phone:
         return ""
     
-    # Remove all non-numeric characters except +
-    cleaned = re.sub(r'[^\d+]', '', phone)
-    
-    # Format common Australian patterns
-    if cleaned.startswith('1800') or cleaned.startswith('1300') or cleaned.startswith('13'):
-        # Toll-free numbers - add spaces for readability
-        if len(cleaned) == 10:  # 1800123456
-            return f"{cleaned[:4]} {cleaned[4:7]} {cleaned[7:]}"
-        elif len(cleaned) == 6:  # 132861
-            return f"{cleaned[:3]} {cleaned[3:]}"
-    elif cleaned.startswith('+61'):
-        # International format
-        return cleaned
-    
-    return cleaned
+    # Shared normalizer groups 1800/1300/13 and geographic numbers for readability
+    return format_phone(phone)
+
+def search_terms_for(organization: str, service_desc: str) -> List[str]:
+    """Common search terms (ATO, hospital, etc.) for an organization and its services"""
+    labels = set(SEARCH_TERM_CLASSIFIER.labels(organization))
+    labels.update(label for label in SEARCH_TERM_CLASSIFIER.labels(service_desc)
+                  if SEARCH_TERM_CATEGORIES[label]['in_services'])
+    return [term for label, category in SEARCH_TERM_CATEGORIES.items() if label in labels
+            for term in category['terms']]
 
 def csv_to_llm_json(csv_file_path: str, output_file_path: str) -> None:
     """Convert CSV to LLM-optimized JSON"""
@@ -88,15 +103,7 @@ def csv_to_llm_json(csv_file_path: str, output_file_path: str) -> None:
             org_keywords = extract_keywords(organization)
             
             # Add common search terms (ATO, hospital, etc.)
-            search_terms = []
-            if 'tax' in organization.lower() or 'ato' in organization.lower():
-                search_terms.extend(['ato', 'tax', 'taxation'])
-            if 'hospital' in organization.lower() or 'health' in organization.lower():
-                search_terms.extend(['hospital', 'health', 'medical'])
-            if 'medicare' in organization.lower() or service_desc.lower():
-                search_terms.extend(['medicare', 'health'])
-            if 'centrelink' in organization.lower() or service_desc.lower():
-                search_terms.extend(['centrelink', 'welfare', 'benefits'])
+            search_terms = search_terms_for(organization, service_desc)
                 
             all_keywords = list(dict.fromkeys(keywords + org_keywords + search_terms))
             
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Entity Scanner Benchmark
+Compares the single-pass entity scanner against the original per-pattern
+threat extraction on a corpus of saved Scamwatch articles
+"""
+
+import argparse
+import csv
+import random
+import re
+import sys
+import os
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'agents'))
+
+from scamwatch_threat_agent import (
+    SCAM_TYPES, SCAM_TACTICS, IMPERSONATED_ORGANIZATIONS, IMPERSONATION_CONTEXT,
+    EXCLUDED_EMAIL_DOMAINS, EXCLUDED_WEBSITE_DOMAINS, ScamwatchThreatAgent
+)
+
+FILLER = (
+    "Scammers are contacting people and pretending to be from trusted organisations. "
+    "If you receive a call or message, do not click links or provide personal details. "
+    "Hang up and contact the organisation using details you find yourself. "
+)
+
+
+def legacy_extract(page_text):
+    """Original extract_threat_intelligence logic (one pass per pattern and keyword)"""
+    info = {'scam_type': '', 'scam_phone_numbers': [], 'scam_emails': [], 'scam_websites': [],
+            'impersonated_organizations': [], 'scam_tactics': [], 'date_reported': ''}
+
+    for scam_category, keywords in SCAM_TYPES.items():
+        if any(keyword in page_text.lower() for keyword in keywords):
+            info['scam_type'] = scam_category
+            break
+
+    phone_patterns = [
+        r'(\+61\s*[2-8]\s*\d{4}\s*\d{4})', r'(\(0[2-8]\)\s*\d{4}\s*\d{4})',
+        r'(0[2-8]\s*\d{4}\s*\d{4})', r'(1800\s*\d{3}\s*\d{3})',
+        r'(1300\s*\d{3}\s*\d{3})', r'(13\s*\d{2}\s*\d{2})',
+    ]
+    for pattern in phone_patterns:
+        for match in re.findall(pattern, page_text):
+            if match.strip() not in info['scam_phone_numbers']:
+                info['scam_phone_numbers'].append(match.strip())
+
+    for email in re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', page_text):
+        if not any(domain in email.lower() for domain in EXCLUDED_EMAIL_DOMAINS):
+            if email not in info['scam_emails']:
+                info['scam_emails'].append(email)
+
+    for url in re.findall(r'https?://(?:www\.)?([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', page_text):
+        if not any(domain in url.lower() for domain in EXCLUDED_WEBSITE_DOMAINS):
+            if url not in info['scam_websites']:
+                info['scam_websites'].append(url)
+
+    for org in IMPERSONATED_ORGANIZATIONS:
+        if org.lower() in page_text.lower():
+            for keyword in IMPERSONATION_CONTEXT:
+                if keyword in page_text.lower() and org.lower() in page_text.lower():
+                    if org not in info['impersonated_organizations']:
+                        info['impersonated_organizations'].append(org)
+                    break
+
+    for pattern in [r'(\d{1,2}\s+\w+\s+\d{4})', r'(\w+\s+\d{1,2},?\s+\d{4})', r'(\d{4}-\d{2}-\d{2})']:
+        matches = re.findall(pattern, page_text)
+        if matches:
+            info['date_reported'] = matches[0]
+            break
+
+    for tactic_name, keywords in SCAM_TACTICS.items():
+        if any(keyword in page_text.lower() for keyword in keywords):
+            info['scam_tactics'].append(tactic_name)
+
+    return info
+
+
+def load_corpus(corpus_dir, synthetic_size):
+    """Load saved article texts, or synthesize articles from threat records"""
+    corpus_path = Path(corpus_dir)
+    texts = [p.read_text(encoding='utf-8') for p in sorted(corpus_path.glob('*.txt'))] if corpus_path.exists() else []
+    if texts:
+        print(f"Loaded {len(texts)} saved articles from {corpus_dir}")
+        return texts
+
+    threats_file = Path('data/raw/scamwatch_threats.csv')
+    rows = list(csv.DictReader(open(threats_file, encoding='utf-8'))) if threats_file.exists() else []
+    rng = random.Random(42)
+    for i in range(synthetic_size):
+        row = rows[i % len(rows)] if rows else {}
+        body = [FILLER * rng.randint(20, 60)]
+        body.append(f"{row.get('article_title', 'Scam alert')} - published {row.get('date_reported', '1 July 2025')}. ")
+        body.append(f"Scammers impersonating {row.get('impersonated_organizations', 'the ATO')} are calling from "
+                    f"{row.get('threat_value') or '1800 595 160'} and emailing from alerts@secure-verify.com. ")
+        body.append(f"Visit https://www.fake-refund-{i}.com for details or call (02) 9{i % 1000:03d} 1234. ")
+        body.append(FILLER * rng.randint(20, 60))
+        rng.shuffle(body)
+        texts.append(''.join(body))
+    print(f"No saved articles in {corpus_dir}; synthesized {len(texts)} articles")
+    return texts
+
+
+def compare(legacy, scanned):
+    """Fields where the single-pass scanner agrees with the legacy extraction"""
+    fields = ['scam_type', 'scam_emails', 'scam_websites', 'impersonated_organizations', 'scam_tactics', 'date_reported']
+    agreement = {field: legacy[field] == scanned[field] for field in fields}
+    # Legacy phone lists include overlapping fragments (e.g. "1300 12" inside "1300 123 456")
+    agreement['scam_phone_numbers'] = set(scanned['scam_phone_numbers']) <= set(legacy['scam_phone_numbers'])
+    return agreement
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark single-pass entity scanning')
+    parser.add_argument('--corpus', default='data/raw/scamwatch_articles', help='Directory of saved article .txt files')
+    parser.add_argument('--synthetic', type=int, default=200, help='Synthetic articles when no corpus is saved')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions')
+    args = parser.parse_args()
+
+    print("Entity Scanner Benchmark")
+    print("=" * 50)
+    texts = load_corpus(args.corpus, args.synthetic)
+    total_chars = sum(len(t) for t in texts)
+    agent = ScamwatchThreatAgent()
+
+    def scanner_extract(text):
+        info = {'scam_type': '', 'scam_phone_numbers': [], 'scam_emails': [], 'scam_websites': [],
+                'impersonated_organizations': [], 'scam_tactics': [], 'date_reported': ''}
+        return agent.analyze_page_text(info, text)
+
+    timings = {}
+    for name, extract in [('legacy', legacy_extract), ('scanner', scanner_extract)]:
+        best = float('inf')
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for text in texts:
+                extract(text)
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+        print(f"  {name:8}: {best * 1000:8.1f} ms total, {best / len(texts) * 1000:.3f} ms/article, "
+              f"{total_chars / best / 1e6:.1f} MB/s")
+
+    agreement = {}
+    for text in texts:
+        for field, same in compare(legacy_extract(text), scanner_extract(text)).items():
+            agreement[field] = agreement.get(field, 0) + int(same)
+
+    print(f"\nSpeedup: {timings['legacy'] / timings['scanner']:.2f}x over {len(texts)} articles ({total_chars / 1e6:.2f} MB)")
+    print("Field agreement with legacy extraction:")
+    for field, count in agreement.items():
+        print(f"  {field}: {count}/{len(texts)}")
+
+
+if __name__ == "__main__":
+    main()
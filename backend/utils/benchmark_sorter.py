@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Sorter Benchmark
+Times the column-wise risk, priority and region computation of the sorter
+against the original row-by-row apply() logic (tests/test_sorter_agent.py)
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'agents'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests'))
+
+from sorter_agent import SorterAgent
+# The row-wise reference lives with the equivalence tests
+from test_sorter_agent import legacy_columns, vectorized_columns
+
+# Values mixed into the synthetic dataset to reach every branch
+PHONE_VARIANTS = ['1800 000 000', '1300 123 456', '13 11 14', '02 9999 9999', '0411 111 111', '12345', '000',
+                  '+44 20 7946 0958', 'call us', ' 1800 22 8333 ']
+EMAIL_VARIANTS = ['info@health.nsw.gov.au', 'help@charity.org.au', 'ADMIN@DSS.GOV.AU', 'bad-address']
+STATE_VARIANTS = ['NSW', 'nsw', 'Federal', 'VIC', 'qld', 'ACT', 'XX', None]
+NAME_VARIANTS = ['Federal Court of Australia', 'NSW Police Force', 'Fire and Rescue NSW', 'Lifeline',
+                 'State Emergency Service', 'Ambulance Service of NSW', None]
+CONFIDENCE_VARIANTS = [0.5, 0.6, 0.65, 0.7, 0.75, 0.8, 0.9, 0.95, 1.0, np.nan]
+
+
+def synthetic_contacts(rows, seed=42):
+    """Standardized contacts repeated to the requested size with varied values"""
+    base = pd.read_csv('data/standardized_contacts.csv')
+    df = base.iloc[np.arange(rows) % len(base)].reset_index(drop=True)
+    rng = np.random.default_rng(seed)
+
+    def scatter(column, variants, share, where=None):
+        mask = rng.random(rows) < share
+        if where is not None:
+            mask &= where
+        df.loc[mask, column] = rng.choice(np.array(variants, dtype=object), mask.sum())
+
+    scatter('contact_value', PHONE_VARIANTS, 0.3, (df['contact_type'] == 'phone').to_numpy())
+    scatter('contact_value', EMAIL_VARIANTS, 0.5, (df['contact_type'] == 'email').to_numpy())
+    scatter('state', STATE_VARIANTS, 0.3)
+    scatter('organization_name', NAME_VARIANTS, 0.1)
+    df['confidence_score'] = rng.choice(CONFIDENCE_VARIANTS, rows)
+    # Distinct names and numbers, as in a national register
+    unique = rng.random(rows) < 0.5
+    df.loc[unique, 'organization_name'] = df.loc[unique, 'organization_name'].astype(str) + ' ' + \
+        pd.Series(np.arange(rows)[unique], index=df.index[unique]).astype(str)
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark column-wise sorter categorization')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Synthetic records')
+    parser.add_argument('--legacy-rows', type=int, default=None,
+                        help='Time the row-wise version on fewer records and scale up (default: all)')
+    args = parser.parse_args()
+
+    print("Sorter Benchmark")
+    print("=" * 50)
+    sorter = SorterAgent()
+    df = synthetic_contacts(args.rows)
+    legacy_df = df if args.legacy_rows is None else df.iloc[:args.legacy_rows]
+    print(f"{len(df)} synthetic records ({df['organization_name'].nunique()} distinct names)")
+
+    start = time.perf_counter()
+    vectorized = vectorized_columns(df, sorter)
+    vectorized_time = time.perf_counter() - start
+    print(f"  column-wise: {vectorized_time:8.2f} s")
+
+    start = time.perf_counter()
+    legacy = legacy_columns(legacy_df, sorter)
+    legacy_time = (time.perf_counter() - start) * len(df) / len(legacy_df)
+    scaled = '' if len(legacy_df) == len(df) else f" (scaled from {len(legacy_df)} records)"
+    print(f"  row-wise:    {legacy_time:8.2f} s{scaled}")
+
+    print(f"\nSpeedup: {legacy_time / vectorized_time:.1f}x")
+    print("Equivalence with the row-wise results:")
+    identical = True
+    for column, expected in legacy.items():
+        actual = vectorized[column].loc[expected.index]
+        same = expected.astype(object).equals(actual.astype(object))
+        identical &= same
+        print(f"  {column}: {'identical' if same else 'DIFFERENT'}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Verification Benchmark
+Load-tests contact verification with a realistic query mix (mostly legitimate,
+some threats, many unknown, varied formatting) against synthetic indexes of
+increasing size, in-process and over the local HTTP API, reporting latency
+percentiles, throughput and memory per index size
+"""
+
+import argparse
+import gc
+import http.client
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.lookup_artifact import LookupArtifact, write_artifact
+from utils.phone_normalizer import key_strings
+from utils.verification_index import VerificationIndex
+from utils.verification_server import VerificationServer
+
+SIZES = [400, 10_000, 100_000, 1_000_000]
+ENGINES = ['index', 'batch', 'artifact', 'http']
+
+# Share of each kind of query, and of each contact type
+QUERY_MIX = {'legitimate': 0.50, 'threat': 0.10, 'unknown': 0.35, 'invalid': 0.05}
+KIND_MIX = {'phone': 0.80, 'email': 0.10, 'website': 0.10}
+INVALID_VALUES = {'phone': ['call us', '12345', 'n/a', '1800 CALL NOW'], 'email': ['info at example', 'n/a'],
+                  'website': ['localhost', 'see above', 'http://']}
+
+ORGANIZATION_TYPES = ['government', 'hospital', 'charity']
+THREAT_SHARE = 0.03
+SERIAL_STEP = 37_735_729   # coprime to 10^8, so ids map to distinct 8-digit serials
+BATCH_SIZE = 10_000
+
+
+def synthetic_contacts(rows, seed=42):
+    """A sorted-master frame of `rows` distinct contacts (phones, emails, websites; ~3% threats)"""
+    rng = np.random.default_rng(seed)
+    kinds = rng.choice(list(KIND_MIX), rows, p=list(KIND_MIX.values()))
+    ids = np.arange(rows)
+    # Distinct landline numbers and some 1800/1300 lines; mobiles (04) are left for unknowns
+    serial = ids * SERIAL_STEP % 10 ** 8
+    keys = 61 * 10 ** 9 + rng.choice([2, 3, 7, 8], rows) * 10 ** 8 + serial
+    freecall = rng.random(rows) < 0.1
+    keys[freecall] = 61 * 10 ** 10 + rng.choice([1800, 1300], freecall.sum()) * 10 ** 6 + serial[freecall] % 10 ** 6
+    values = np.where(kinds == 'phone', key_strings(keys),
+                      np.where(kinds == 'email', np.char.add(np.char.add('contact@org', ids.astype(str)), '.org.au'),
+                               np.char.add(np.char.add('https://www.org', ids.astype(str)), '.com.au/')))
+    threat = rng.random(rows) < THREAT_SHARE
+    org_type = np.where(threat, 'threat', rng.choice(ORGANIZATION_TYPES, rows))
+    return pd.DataFrame({
+        'contact_id': np.char.add('contact_', ids.astype(str)),
+        'contact_type': kinds,
+        'contact_value': values.astype(object),
+        'organization_name': np.char.add('Organisation ', (ids // 3).astype(str)),
+        'organization_type': org_type,
+        'confidence_score': np.round(rng.uniform(0.5, 1.0, rows), 2),
+        'risk_level': np.where(threat, 'threat', 'safe'),
+        'priority_score': np.round(rng.uniform(0, 3, rows), 2),
+        'category': np.where(threat, 'Security Threats', 'Official Services'),
+    }).drop_duplicates('contact_value')
+
+
+def reformat(kind, value, rng):
+    """The same contact written the way callers and exports write it"""
+    style = rng.integers(3)
+    if kind == 'phone':
+        digits = value.lstrip('+')[2:]
+        national = digits if digits.startswith(('13', '18')) else '0' + digits
+        return [national, f"{national[:-6]} {national[-6:-3]} {national[-3:]}", f"+61 {digits}"][style]
+    if kind == 'email':
+        return [value, value.upper(), f"mailto:{value}"][style]
+    host = value.split('//')[-1].strip('/')
+    return [value, host.removeprefix('www.'), f"HTTP://{host.upper()}/contact-us"][style]
+
+
+def query_mix(contacts, count, seed=7):
+    """(kind, value, expected) queries drawn from the contacts in QUERY_MIX proportions"""
+    rng = np.random.default_rng(seed)
+    groups = {(kind, verdict): frame['contact_value'].to_numpy()
+              for (kind, verdict), frame in contacts.groupby(['contact_type', 'risk_level'])}
+    queries = []
+    for expected in rng.choice(list(QUERY_MIX), count, p=list(QUERY_MIX.values())):
+        kind = str(rng.choice(list(KIND_MIX), p=list(KIND_MIX.values())))
+        listed = groups.get((kind, 'safe' if expected == 'legitimate' else 'threat'))
+        if expected in ('legitimate', 'threat') and listed is not None and len(listed):
+            queries.append((kind, reformat(kind, str(rng.choice(listed)), rng), expected))
+        elif expected == 'invalid':
+            queries.append((kind, str(rng.choice(INVALID_VALUES[kind])), 'invalid'))
+        else:
+            serial = int(rng.integers(10 ** 8))
+            unknown = {'phone': f"04{serial:08d}", 'email': f"someone{serial}@example.net",
+                       'website': f"https://unlisted{serial}.example.net/"}[kind]
+            queries.append((kind, unknown, 'unknown'))      # also when no contact of the kind is listed
+    return queries
+
+
+def rss_bytes():
+    """Resident memory of this process"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def summarize(engine, latencies_ns, elapsed, queries):
+    latencies_us = np.asarray(latencies_ns, dtype=np.float64) / 1000
+    result = {'engine': engine, 'queries': queries, 'qps': round(queries / elapsed)}
+    for name, q in (('p50_us', 50), ('p99_us', 99), ('p999_us', 99.9)):
+        result[name] = round(float(np.percentile(latencies_us, q)), 1) if len(latencies_us) else None
+    return result
+
+
+def run_single(engine, lookup, queries):
+    """One query at a time on this thread, timing each"""
+    latencies = np.empty(len(queries), dtype=np.int64)
+    clock = time.perf_counter_ns
+    start = clock()
+    for position, (kind, value, _) in enumerate(queries):
+        began = clock()
+        lookup(kind, value)
+        latencies[position] = clock() - began
+    return summarize(engine, latencies, (clock() - start) / 1e9, len(queries))
+
+
+def run_batch(index, queries):
+    """verify_batch over BATCH_SIZE queries per call (latency is per batch)"""
+    frame = pd.DataFrame(queries, columns=['kind', 'value', 'expected'])
+    latencies = []
+    start = time.perf_counter_ns()
+    for offset in range(0, len(frame), BATCH_SIZE):
+        began = time.perf_counter_ns()
+        chunk = frame.iloc[offset:offset + BATCH_SIZE]
+        for kind, group in chunk.groupby('kind'):
+            index.verify_batch(kind, group['value'])
+        latencies.append(time.perf_counter_ns() - began)
+    return summarize('batch', latencies, (time.perf_counter_ns() - start) / 1e9, len(frame))
+
+
+def _serve(server):
+    server.serve_forever()
+
+
+def run_http(index, queries, concurrency):
+    """GET /verify over keep-alive connections from `concurrency` client threads
+
+    The server runs in a forked process (where available) so the clients
+    do not share its interpreter lock.
+    """
+    server = VerificationServer(('127.0.0.1', 0), index)
+    host, port = server.server_address
+    if 'fork' in multiprocessing.get_all_start_methods():
+        process = multiprocessing.get_context('fork').Process(target=_serve, args=(server,), daemon=True)
+        process.start()
+        stop = process.terminate
+    else:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        stop = server.shutdown
+
+    latencies = np.empty(len(queries), dtype=np.int64)
+    errors = []
+
+    def client(worker):
+        connection = http.client.HTTPConnection(host, port, timeout=30)
+        try:
+            for position in range(worker, len(queries), concurrency):
+                kind, value, _ = queries[position]
+                began = time.perf_counter_ns()
+                connection.request('GET', f"/verify/{kind}?value={quote(value)}")
+                response = connection.getresponse()
+                response.read()
+                latencies[position] = time.perf_counter_ns() - began
+                if response.status != 200:
+                    errors.append(response.status)
+        finally:
+            connection.close()
+
+    try:
+        clients = [threading.Thread(target=client, args=(worker,)) for worker in range(concurrency)]
+        start = time.perf_counter()
+        for thread in clients:
+            thread.start()
+        for thread in clients:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        stop()
+        server.server_close()
+    result = summarize(f'http x{concurrency}', latencies, elapsed, len(queries))
+    result['errors'] = len(errors)
+    return result
+
+
+def benchmark_size(rows, engines, query_count, concurrency):
+    """Build an index of `rows` contacts and run every engine against one query mix"""
+    contacts = synthetic_contacts(rows)
+    queries = query_mix(contacts, query_count)
+    gc.collect()
+    before = rss_bytes()
+    start = time.perf_counter()
+    index = VerificationIndex(contacts)
+    build_seconds = time.perf_counter() - start
+    gc.collect()
+    index_mb = (rss_bytes() - before) / 2 ** 20
+
+    # Every query must get the verdict it was drawn for
+    wrong = sum(index.verify(kind, value)['verdict'] != expected for kind, value, expected in queries)
+    info = {'rows': len(contacts), 'keys': len(index), 'build_seconds': round(build_seconds, 2),
+            'index_mb': round(index_mb, 1), 'wrong_verdicts': wrong, 'results': []}
+
+    for engine in engines:
+        if engine == 'index':
+            info['results'].append(run_single('index', index.verify, queries))
+        elif engine == 'batch':
+            info['results'].append(run_batch(index, queries))
+        elif engine == 'artifact':
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'contacts.lookup')
+                write_artifact(index, path)
+                info['artifact_mb'] = round(os.path.getsize(path) / 2 ** 20, 2)
+                with LookupArtifact(path) as artifact:
+                    info['results'].append(run_single('artifact', artifact.lookup, queries))
+        elif engine == 'http':
+            info['results'].append(run_http(index, queries, concurrency))
+    return info
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test contact verification lookups')
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='Index sizes (contacts)')
+    parser.add_argument('--engines', nargs='+', choices=ENGINES, default=ENGINES, help='Lookup paths to measure')
+    parser.add_argument('--queries', type=int, default=100_000, help='Queries per engine and size')
+    parser.add_argument('--concurrency', type=int, default=8, help='Client connections for the http engine')
+    parser.add_argument('--json', help='Also write the results to this JSON file')
+    args = parser.parse_args()
+
+    print("Verification Benchmark")
+    print("=" * 50)
+    print("Query mix: " + ', '.join(f"{share:.0%} {name}" for name, share in QUERY_MIX.items()) +
+          " (" + ', '.join(f"{share:.0%} {kind}" for kind, share in KIND_MIX.items()) + ")")
+    report = []
+    for rows in args.sizes:
+        info = benchmark_size(rows, args.engines, args.queries, args.concurrency)
+        report.append(info)
+        artifact = f", artifact {info['artifact_mb']} MB" if 'artifact_mb' in info else ''
+        print(f"\n{info['rows']:,} contacts ({info['keys']:,} keys): built in {info['build_seconds']} s, "
+              f"index {info['index_mb']} MB{artifact}, {info['wrong_verdicts']} unexpected verdicts")
+        print(f"  {'engine':<10} {'queries/s':>11} {'p50 µs':>9} {'p99 µs':>9} {'p99.9 µs':>9}")
+        for result in info['results']:
+            print(f"  {result['engine']:<10} {result['qps']:>11,} {result['p50_us']:>9} {result['p99_us']:>9} "
+                  f"{result['p999_us']:>9}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'query_mix': QUERY_MIX, 'kind_mix': KIND_MIX, 'sizes': report}, f, indent=2)
+        print(f"\n📄 Results saved to: {args.json}")
+    return 0 if all(info['wrong_verdicts'] == 0 for info in report) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Bulk Verify - Streaming verification of phone numbers, emails and URLs in large files
+Reads a CSV or JSONL export (call-detail records, SMS logs) in chunks, looks every
+value up against the verification index and writes each row with its verdict
+
+    python utils/bulk_verify.py calls.csv --type phone --column caller -o calls_verified.csv
+    python utils/bulk_verify.py queries.jsonl -o verdicts.jsonl        # 'type' and 'value' fields
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import pandas as pd
+
+# Allow running from backend/utils or as part of the backend package path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.verification_index import KINDS, MASTER_FILE, THREAT_FILE, RESULT_FIELDS, VerificationIndex
+
+CHUNK_SIZE = 100000         # rows read, verified and written per step
+JSONL_SUFFIXES = {'.jsonl', '.ndjson'}
+
+# Columns appended to every row (prefixed so they never clash with input columns)
+OUTPUT_PREFIX = 'verify_'
+
+
+def file_format(path):
+    """'jsonl' or 'csv' from the file name (ignoring a compression suffix)"""
+    suffixes = [suffix.lower() for suffix in Path(path).suffixes]
+    if suffixes and suffixes[-1] in ('.gz', '.bz2', '.xz', '.zst', '.zip'):
+        suffixes = suffixes[:-1]
+    return 'jsonl' if suffixes and suffixes[-1] in JSONL_SUFFIXES else 'csv'
+
+
+def read_chunks(path, chunk_size=CHUNK_SIZE):
+    """Input rows in DataFrame chunks, every field as text (phone numbers keep leading zeros)"""
+    if file_format(path) == 'jsonl':
+        with pd.read_json(path, lines=True, chunksize=chunk_size, dtype=False) as reader:
+            for chunk in reader:
+                yield chunk.astype(object).where(chunk.notna(), None).map(
+                    lambda value: value if value is None else str(value))
+    else:
+        with pd.read_csv(path, dtype=str, chunksize=chunk_size, keep_default_na=False,
+                         na_values=['']) as reader:
+            yield from reader
+
+
+def verify_chunk(index, chunk, kind=None, column='value', type_column='type'):
+    """Verdict columns for one chunk: every value of `column` as `kind`, or as
+    the type named per row in `type_column` (rows of other types are invalid)"""
+    if column not in chunk.columns:
+        raise KeyError(f"Input has no '{column}' column")
+    if kind is not None:
+        return index.verify_batch(kind, chunk[column])
+    if type_column not in chunk.columns:
+        raise KeyError(f"Input has no '{type_column}' column (pass --type for single-type files)")
+
+    kinds = chunk[type_column].astype(str).str.strip().str.lower()
+    parts = [index.verify_batch(name, chunk.loc[kinds == name, column]) for name in KINDS]
+    others = chunk.index[~kinds.isin(KINDS)]
+    parts.append(index.verify_batch(KINDS[0], pd.Series(None, index=others, dtype=object)))   # invalid
+    return pd.concat(parts).loc[chunk.index]
+
+
+def write_chunk(chunk, path, first):
+    """Append rows to a CSV (header with the first chunk) or JSONL file"""
+    mode = 'w' if first else 'a'
+    if file_format(path) == 'jsonl':
+        chunk.to_json(path, orient='records', lines=True, mode=mode, force_ascii=False)
+    else:
+        chunk.to_csv(path, mode=mode, header=first, index=False)
+
+
+def verify_file(index, input_file, output_file, kind=None, column='value', type_column='type',
+                chunk_size=CHUNK_SIZE):
+    """Verify every row of input_file into output_file, one chunk in memory at a time
+
+    Output rows are the input rows plus verify_* columns (key, verdict,
+    organization, risk level, priority, match, ...). The output appears
+    under its final name only once complete. Returns row and verdict counts.
+    """
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_file.with_name('.tmp-' + output_file.name)    # same suffixes, same format
+
+    started = time.perf_counter()
+    rows = 0
+    verdicts = Counter()
+    for number, chunk in enumerate(read_chunks(input_file, chunk_size)):
+        results = verify_chunk(index, chunk, kind, column, type_column)
+        verdicts.update(results['verdict'].value_counts().to_dict())
+        write_chunk(pd.concat([chunk, results.add_prefix(OUTPUT_PREFIX)], axis=1), tmp_path, number == 0)
+        rows += len(chunk)
+    if not tmp_path.exists():       # empty JSONL input
+        tmp_path.touch()
+    os.replace(tmp_path, output_file)
+
+    elapsed = time.perf_counter() - started
+    return {'rows': rows, 'verdicts': dict(verdicts), 'elapsed_seconds': round(elapsed, 2),
+            'rows_per_second': int(rows / elapsed) if elapsed > 0 else None}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Verify the phone numbers, emails or URLs in a CSV/JSONL file')
+    parser.add_argument('input', help='CSV or JSONL file (optionally compressed)')
+    parser.add_argument('-o', '--output', required=True, help='Output CSV or JSONL file')
+    parser.add_argument('--type', choices=KINDS, help="Type of every value (default: per row, from --type-column)")
+    parser.add_argument('--column', default='value', help="Column holding the values (default: value)")
+    parser.add_argument('--type-column', default='type', help="Column naming each row's type (default: type)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='Rows per chunk')
+    parser.add_argument('--master', default=MASTER_FILE, help='Sorted contacts master CSV')
+    parser.add_argument('--threats', default=THREAT_FILE, help='Threat contacts CSV')
+    args = parser.parse_args()
+
+    index = VerificationIndex.from_files(args.master, args.threats)
+    print(f"Indexed {index.contacts} contacts ({len(index)} distinct keys)")
+    try:
+        stats = verify_file(index, args.input, args.output, args.type, args.column, args.type_column,
+                            args.chunk_size)
+    except KeyError as e:
+        parser.error(e.args[0])
+
+    print(f"✅ Verified {stats['rows']:,} rows in {stats['elapsed_seconds']} s "
+          f"({stats['rows_per_second'] or 0:,} rows/s) -> {args.output}")
+    for verdict, count in sorted(stats['verdicts'].items(), key=lambda item: -item[1]):
+        print(f"  {verdict}: {count:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Contact Index - Normalized-key membership sets for cross-referencing contacts
+Keys phone numbers, email addresses and registrable website domains so values
+that differ only in formatting match, and stores each key set as sorted 64-bit
+hashes with the keys packed alongside for exact confirmation
+"""
+
+import os
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Allow running from backend/utils or as part of the backend package path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.phone_normalizer import INVALID_KEY, phone_key_array
+
+# Saved indexes of another layout are rebuilt
+INDEX_VERSION = 1
+
+EMAIL_KEY = r'^[^@\s]+@[^@\s]+\.[^@\s]+$'
+
+# Host part of a URL or bare domain (scheme, credentials, port and path are dropped)
+URL_HOST = re.compile(r'(?:[a-z][a-z0-9+.-]*://)?(?:[^@/?#\s]*@)?([^@/?#:\s]*)')
+HOST_NAME = re.compile(r'[a-z0-9-]+(?:\.[a-z0-9-]+)*\.[a-z]{2,}')
+
+# Multi-label public suffixes seen in Australian contact data (a subset of the
+# Public Suffix List, plus the state government umbrellas it leaves out); any
+# other domain is registered directly under its TLD
+PUBLIC_SUFFIXES = {
+    'com.au', 'net.au', 'org.au', 'edu.au', 'gov.au', 'asn.au', 'id.au', 'info.au', 'conf.au', 'oz.au', 'csiro.au',
+    'act.au', 'nsw.au', 'nt.au', 'qld.au', 'sa.au', 'tas.au', 'vic.au', 'wa.au',
+    'act.gov.au', 'nsw.gov.au', 'nt.gov.au', 'qld.gov.au', 'sa.gov.au', 'tas.gov.au', 'vic.gov.au', 'wa.gov.au',
+    'act.edu.au', 'catholic.edu.au', 'nsw.edu.au', 'nt.edu.au', 'qld.edu.au', 'sa.edu.au', 'tas.edu.au',
+    'vic.edu.au', 'wa.edu.au',
+    'co.uk', 'org.uk', 'gov.uk', 'ac.uk', 'co.nz', 'org.nz', 'govt.nz', 'com.sg', 'com.hk', 'co.in', 'com.cn'
+}
+MAX_SUFFIX_LABELS = max(suffix.count('.') + 1 for suffix in PUBLIC_SUFFIXES)
+
+
+def _as_series(values):
+    if isinstance(values, pd.Series):
+        return values.dropna()
+    return pd.Series(list(values), dtype=object).dropna()
+
+
+def public_suffix(host):
+    """Longest public suffix of a host, e.g. 'www.health.vic.gov.au' -> 'vic.gov.au' ('' without a dot)"""
+    host = host.strip('.')
+    suffix_start = cut = host.rfind('.')
+    if suffix_start < 0:
+        return ''
+    for _ in range(MAX_SUFFIX_LABELS - 1):
+        cut = host.rfind('.', 0, cut)
+        if host[cut + 1:] in PUBLIC_SUFFIXES:
+            suffix_start = cut
+        if cut < 0:
+            break
+    return host[suffix_start + 1:]
+
+
+def registrable_domain(host):
+    """Domain a host is registered under, e.g. 'www.service.nsw.gov.au' -> 'service.nsw.gov.au'"""
+    host = host.strip('.')
+    suffix = public_suffix(host)
+    if not suffix or len(suffix) == len(host):
+        return ''
+    return host[host.rfind('.', 0, len(host) - len(suffix) - 1) + 1:]
+
+
+def website_domain(value):
+    """Registrable domain of a URL or host name ('' when there is none)"""
+    host = website_host(value)
+    return registrable_domain(host) if HOST_NAME.fullmatch(host) else ''
+
+
+def website_host(value):
+    """Lower-cased host name of a URL, host or email address"""
+    return URL_HOST.match(value.strip().lower()).group(1).rstrip('.')
+
+
+def phone_keys(values):
+    """Distinct canonical phone keys (E.164 digits as int64) of the valid numbers in values"""
+    keys = phone_key_array(_as_series(values))
+    return np.unique(keys[keys != INVALID_KEY])
+
+
+def email_keys(values):
+    """Distinct normalized (trimmed, lower-cased) email addresses in values"""
+    emails = _as_series(values).astype(str).str.strip().str.lower().str.removeprefix('mailto:')
+    return np.unique(emails[emails.str.match(EMAIL_KEY)].to_numpy(dtype=object))
+
+
+def domain_keys(values):
+    """Distinct registrable domains of the URLs and host names in values"""
+    hosts = {website_host(value) for value in _as_series(values).astype(str).unique()}
+    domains = {registrable_domain(host) for host in hosts if HOST_NAME.fullmatch(host)}
+    domains.discard('')
+    return np.array(sorted(domains), dtype=object)
+
+
+def host_keys(values):
+    """Distinct host names (without 'www.') of the URLs and host names in values"""
+    hosts = {website_host(value) for value in _as_series(values).astype(str).unique()}
+    hosts = {host[4:] if host.startswith('www.') else host for host in hosts if HOST_NAME.fullmatch(host)}
+    return np.array(sorted(hosts), dtype=object)
+
+
+def text_keys(values):
+    """Distinct trimmed, non-empty strings in values"""
+    text = _as_series(values).astype(str).str.strip()
+    return np.unique(text[text != ''].to_numpy(dtype=object))
+
+
+def _hashes(keys):
+    if keys.dtype.kind in 'iu':
+        return keys.astype(np.uint64)
+    return pd.util.hash_array(keys.astype(object), categorize=False)
+
+
+class IndicatorSet:
+    """Compact exact membership set of integer or string keys
+
+    Keys are held as a sorted array of 64-bit hashes (integer keys are their
+    own hash). String keys are packed into one UTF-8 buffer in hash order, so
+    a hash hit is confirmed against the key itself and collisions never match.
+    """
+
+    def __init__(self, keys=(), hashes=None, blob=None, offsets=None):
+        if hashes is not None:
+            self.hashes, self.blob, self.offsets = hashes, blob, offsets
+            return
+        keys = np.asarray(keys)
+        if keys.dtype.kind not in 'iu':
+            keys = np.unique(keys.astype(object))
+        hashes = _hashes(keys)
+        order = np.argsort(hashes, kind='stable')
+        self.hashes = hashes[order]
+        self.blob = self.offsets = None
+        if keys.dtype.kind not in 'iu':
+            encoded = [key.encode('utf-8') for key in keys[order]]
+            self.blob = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+            self.offsets = np.concatenate(([0], np.cumsum([len(key) for key in encoded]))).astype(np.int64)
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def _key(self, position):
+        return self.blob[self.offsets[position]:self.offsets[position + 1]].tobytes().decode('utf-8')
+
+    def keys(self):
+        """All keys in hash order (int64 array or list of strings)"""
+        if self.blob is None:
+            return self.hashes.astype(np.int64)
+        return [self._key(position) for position in range(len(self))]
+
+    def contains(self, queries):
+        """Boolean membership of each query key"""
+        queries = np.asarray(queries)
+        if len(self) == 0 or len(queries) == 0:
+            return np.zeros(len(queries), dtype=bool)
+        if self.blob is None:
+            queries = queries.astype(np.int64)
+        hashes = _hashes(queries)
+        positions = np.searchsorted(self.hashes, hashes)
+        found = self.hashes[np.minimum(positions, len(self) - 1)] == hashes
+        if self.blob is not None:
+            # Confirm every hash hit against the keys sharing that hash
+            for index in np.flatnonzero(found):
+                position, query = positions[index], queries[index]
+                while position < len(self) and self.hashes[position] == hashes[index] and self._key(position) != query:
+                    position += 1
+                found[index] = position < len(self) and self.hashes[position] == hashes[index]
+        return found
+
+
+class ContactIndex:
+    """Indicator sets by kind ('phones', 'emails', 'domains', 'hosts', ...) tagged with a source fingerprint"""
+
+    def __init__(self, sets=None, fingerprint=None):
+        self.sets = dict(sets or {})
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def from_contacts(cls, phones=(), emails=(), websites=(), fingerprint=None, **text):
+        """Index raw phone, email and website values by normalized key (extra kinds as trimmed text)"""
+        sets = {
+            'phones': IndicatorSet(phone_keys(phones)),
+            'emails': IndicatorSet(email_keys(emails)),
+            'domains': IndicatorSet(domain_keys(websites)),
+            'hosts': IndicatorSet(host_keys(websites))
+        }
+        sets.update({kind: IndicatorSet(text_keys(values)) for kind, values in text.items()})
+        return cls(sets, fingerprint)
+
+    def __getitem__(self, kind):
+        return self.sets.get(kind) or IndicatorSet(np.array([], dtype=np.int64 if kind == 'phones' else object))
+
+    def contains(self, kind, keys):
+        return self[kind].contains(keys)
+
+    def save(self, path):
+        """Write the index as one uncompressed .npz archive"""
+        arrays = {'version': np.array(INDEX_VERSION), 'fingerprint': np.array(self.fingerprint or ''),
+                  'kinds': np.array(list(self.sets), dtype=str)}
+        for kind, indicator_set in self.sets.items():
+            arrays[f'{kind}_hashes'] = indicator_set.hashes
+            if indicator_set.blob is not None:
+                arrays[f'{kind}_blob'] = indicator_set.blob
+                arrays[f'{kind}_offsets'] = indicator_set.offsets
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, fingerprint=None):
+        """Read a saved index, or None when missing, outdated or built from different sources"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        with np.load(path, allow_pickle=False) as archive:
+            if 'version' not in archive or int(archive['version']) != INDEX_VERSION:
+                return None
+            stored = str(archive['fingerprint'])
+            if fingerprint is not None and stored != fingerprint:
+                return None
+            sets = {}
+            for kind in archive['kinds']:
+                blob = archive[f'{kind}_blob'] if f'{kind}_blob' in archive else None
+                offsets = archive[f'{kind}_offsets'] if blob is not None else None
+                sets[str(kind)] = IndicatorSet(hashes=archive[f'{kind}_hashes'], blob=blob, offsets=offsets)
+        return cls(sets, stored or None)
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Contact Store - Embedded SQLite store of every contact the pipeline has seen
+Stages upsert their records by a stable contact key instead of rewriting CSV
+files, reads are indexed by contact type, normalized value, organization type
+and risk level, and CSV/JSON exports are generated from the store on demand
+
+    python utils/contact_store.py --load data/sorted_contacts_master.csv
+    python utils/contact_store.py --risk-level threat --export threats.json
+"""
+
+import argparse
+import hashlib
+import os
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+# Allow running from backend/utils or as part of the backend package path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.phone_normalizer import key_strings
+from utils.verification_index import QUERY_KEYS, contact_keys
+
+STORE_FILE = 'data/contacts.db'
+
+# Columns of the standardized dataset, then the columns the sorter adds
+STANDARD_FIELDS = ['contact_id', 'contact_type', 'contact_value', 'organization_name', 'organization_type',
+                   'source_agent', 'source_url', 'address', 'suburb', 'state', 'postcode', 'services',
+                   'verified_date', 'confidence_score', 'notes']
+SORTED_FIELDS = ['risk_level', 'priority_score', 'geographic_region', 'category']
+CONTACT_FIELDS = STANDARD_FIELDS + SORTED_FIELDS
+NUMERIC_FIELDS = {'confidence_score', 'priority_score'}
+
+# Columns reads can filter on, each backed by an index
+FILTER_FIELDS = ['contact_type', 'normalized_value', 'organization_type', 'risk_level', 'partition_name']
+
+# The sorted master's order: highest priority (lowest score) first, then most confident
+EXPORT_ORDER = 'priority_score IS NULL, priority_score, confidence_score DESC, rowid'
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS contacts (
+    contact_key TEXT PRIMARY KEY,
+    normalized_value TEXT NOT NULL,
+    partition_name TEXT,
+    {', '.join(f"{field} {'REAL' if field in NUMERIC_FIELDS else 'TEXT'}" for field in CONTACT_FIELDS)},
+    updated_at TEXT NOT NULL
+);
+{''.join(f"CREATE INDEX IF NOT EXISTS contacts_{field} ON contacts ({field});" for field in FILTER_FIELDS)}
+"""
+
+
+def _text(values):
+    """Trimmed strings with missing values as '' (the standardizer renders them as 'nan',
+    which reads back from its CSV as a missing value)"""
+    text = values.astype(str).str.strip()
+    return text.where(values.notna() & (text != 'nan'), '')
+
+
+def normalized_values(df):
+    """Normalized contact value of every record: the verification index key
+    (E.164 digits for phones), else the trimmed lower-cased raw value"""
+    keys = contact_keys(df)
+    values = _text(df['contact_value']).str.lower()
+    phones = ((df['contact_type'] == 'phone') & keys.notna()).to_numpy()
+    keys = keys.astype(object)
+    if phones.any():
+        keys[phones] = key_strings(keys[phones].astype('int64').to_numpy())
+    return keys.where(keys.notna(), values).astype(str)
+
+
+def stable_keys(df, normalized=None):
+    """Key of every record that survives re-scrapes: the same contact from the
+    same source and organization keeps its key whatever its row position or
+    formatting, unlike positional contact_ids"""
+    if normalized is None:
+        normalized = normalized_values(df)
+    parts = [_text(df['source_agent']), _text(df['contact_type']), normalized, _text(df['organization_name'])]
+    return pd.Series([hashlib.sha1('\x1f'.join(row).encode('utf-8')).hexdigest()[:20] for row in zip(*parts)],
+                     index=df.index, dtype=object)
+
+
+class ContactStore:
+    """Contacts keyed by stable contact key in one SQLite database (WAL mode)
+
+    Each stage updates only its own columns of known records: the
+    standardizer's upserts leave the sorter's risk levels and priorities in
+    place, and the sorter updates nothing else. Readers see the last
+    committed state while a stage is writing.
+    """
+
+    def __init__(self, path=STORE_FILE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def __len__(self):
+        return self.connection.execute('SELECT COUNT(*) FROM contacts').fetchone()[0]
+
+    def _upsert(self, df, partition=None, update_fields=None):
+        """Insert or update records by stable key (no commit); returns their keys"""
+        fields = [field for field in CONTACT_FIELDS if field in df.columns]
+        updated = fields if update_fields is None else [field for field in fields if field in update_fields]
+        if df.empty:
+            return pd.Series([], dtype=object)
+        normalized = normalized_values(df)
+        keys = stable_keys(df, normalized)
+        columns = ['contact_key', 'normalized_value'] + fields + ['updated_at']
+        if partition is not None:
+            columns.append('partition_name')
+        updates = ', '.join(f'{column} = excluded.{column}' for column in columns[1:]
+                            if column not in fields or column in updated)
+        sql = (f"INSERT INTO contacts ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+               f"ON CONFLICT (contact_key) DO UPDATE SET {updates}")
+
+        values = df[fields].astype(object)
+        values = values.where(values.notna(), None)
+        extra = [datetime.now().isoformat()] + ([partition] if partition is not None else [])
+        rows = (list(row) + extra for row in zip(keys, normalized, *(values[field] for field in fields)))
+        self.connection.executemany(sql, rows)
+        return keys
+
+    def upsert(self, df, partition=None, update_fields=None):
+        """Insert new records and update known ones; returns the count
+
+        Known records get the columns df provides, or only those of them in
+        update_fields, so a stage can leave other stages' columns alone.
+        """
+        with self.connection:
+            return len(self._upsert(df, partition, update_fields))
+
+    def replace_partition(self, partition, df):
+        """Make df the partition's records: upsert them and delete the partition's
+        records no longer in df. Returns (records upserted, records deleted)"""
+        with self.connection:
+            keys = self._upsert(df, partition)
+            self.connection.execute('CREATE TEMP TABLE IF NOT EXISTS batch_keys (contact_key TEXT PRIMARY KEY)')
+            self.connection.execute('DELETE FROM batch_keys')
+            self.connection.executemany('INSERT OR IGNORE INTO batch_keys VALUES (?)', ((key,) for key in keys))
+            deleted = self.connection.execute(
+                'DELETE FROM contacts WHERE partition_name = ? '
+                'AND contact_key NOT IN (SELECT contact_key FROM batch_keys)', (partition,)).rowcount
+        return len(keys), deleted
+
+    def partitions(self):
+        """Names of the partitions with records in the store"""
+        rows = self.connection.execute('SELECT DISTINCT partition_name FROM contacts WHERE partition_name IS NOT NULL')
+        return {name for name, in rows}
+
+    def query(self, fields=CONTACT_FIELDS, order_by=EXPORT_ORDER, **filters):
+        """Records matching every filter (a value or a list of values per FILTER_FIELDS
+        column) as a DataFrame, in the sorted master's order unless order_by says otherwise"""
+        conditions, params = [], []
+        for field, value in filters.items():
+            if field not in FILTER_FIELDS:
+                raise ValueError(f"Cannot filter on '{field}' (expected one of: {', '.join(FILTER_FIELDS)})")
+            values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+            conditions.append(f"{field} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+        sql = f"SELECT {', '.join(fields)} FROM contacts{where} ORDER BY {order_by}"
+        return pd.read_sql_query(sql, self.connection, params=params)
+
+    def find(self, kind, value):
+        """Records of a phone number, email address or website in any format"""
+        key = QUERY_KEYS[kind](value)
+        if key is None:
+            return pd.DataFrame(columns=CONTACT_FIELDS)
+        if kind == 'phone':
+            key = key_strings([key])[0]
+        return self.query(contact_type=kind, normalized_value=key)
+
+    def export(self, path, fields=CONTACT_FIELDS, **filters):
+        """Write matching records to a CSV, or a JSON array for a '.json' path; returns the count"""
+        df = self.query(fields, **filters)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f'.tmp-{path.name}')
+        if path.suffix.lower() == '.json':
+            df.to_json(tmp_path, orient='records', indent=2)
+        else:
+            df.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        return len(df)
+
+    def stats(self):
+        stats = {'contacts': len(self)}
+        for field in ('contact_type', 'organization_type', 'risk_level'):
+            rows = self.connection.execute(f'SELECT {field}, COUNT(*) FROM contacts GROUP BY {field} ORDER BY 2 DESC')
+            stats[field] = {str(value): count for value, count in rows}
+        return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load, inspect and export the SQLite contact store')
+    parser.add_argument('--db', default=STORE_FILE, help='Contact store database')
+    parser.add_argument('--load', action='append', default=[], metavar='CSV',
+                        help='Upsert the records of a standardized or sorted contacts CSV (repeatable)')
+    parser.add_argument('--export', metavar='PATH', help='Write matching records to a CSV or .json file')
+    parser.add_argument('--standardized', action='store_true', help='Export only the standardized columns')
+    parser.add_argument('--type', dest='contact_type', help='Only this contact type')
+    parser.add_argument('--organization-type', help='Only this organization type')
+    parser.add_argument('--risk-level', help='Only this risk level')
+    args = parser.parse_args()
+
+    with ContactStore(args.db) as store:
+        for path in args.load:
+            count = store.upsert(pd.read_csv(path, dtype={'contact_value': str, 'postcode': str}))
+            print(f"📥 {path}: {count} records upserted")
+
+        filters = {field: getattr(args, field) for field in ('contact_type', 'organization_type', 'risk_level')
+                   if getattr(args, field)}
+        if args.export:
+            fields = STANDARD_FIELDS if args.standardized else CONTACT_FIELDS
+            count = store.export(args.export, fields, **filters)
+            print(f"📄 {args.export}: {count} records")
+        else:
+            stats = store.stats()
+            print(f"🗄️ {args.db}: {stats['contacts']} contacts")
+            for field in ('contact_type', 'organization_type', 'risk_level'):
+                print(f"  {field}: " + ', '.join(f"{value} {count}" for value, count in stats[field].items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,51 @@ Converts all agent outputs to a standardized contact format for Critic Agent rev
 """
 
 import pandas as pd
+import numpy as np
+import argparse
 import csv
+import hashlib
 import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import re
 
+# Add the backend directory to the Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.standardized_store import StandardizedStore
+from utils.contact_store import STORE_FILE, ContactStore
+
+CHARITY_FILES = [
+    'data/raw/verified_charity_contacts.csv',  # This has the phone numbers we extracted
+    'data/raw/acnc_charities_picton.csv',     # This has full charity details from new ACNC agent
+    'data/raw/acnc_enhanced_picton.csv'
+]
+
+# Sources in output order: (partition name, standardizer method, raw input files)
+# contact_ids are prefixed per source, so partitions never collide
+SOURCES = [
+    ('government_services', 'standardize_government_services', ['data/raw/government_services.csv']),
+    ('nsw_services', 'standardize_nsw_services', ['data/raw/nsw_correct_directory.csv']),
+    ('nsw_hospitals', 'standardize_nsw_hospitals', ['data/raw/nsw_hospitals.csv']),
+    ('scam_threats', 'standardize_scam_threats', ['data/raw/scamwatch_threats.csv']),
+    ('charities', 'standardize_charity_data', CHARITY_FILES)
+]
+SOURCE_METHODS = [method_name for _, method_name, _ in SOURCES]
+
+# Partitions standardized by a different version of this module are rebuilt
+STANDARDIZER_VERSION = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+
+
+def standardize_source(method_name):
+    """Worker entry point: standardize one source and return it as columnar lists"""
+    batch = getattr(DataStandardizer(), method_name)()
+    return batch.to_dict('list')
+
+
 class DataStandardizer:
     def __init__(self):
         self.standard_columns = [
@@ -32,40 +71,83 @@ class DataStandardizer:
         ]
         
         self.output_file = 'data/standardized_contacts.csv'
+        self.store_file = STORE_FILE          # SQLite contact store shared with later stages
+        
+    def _text(self, df, column, fallback=None):
+        """Column as strings the way str() renders each cell ('nan' for missing values)
+
+        fallback is used when the column is absent: another Series, or a constant.
+        """
+        if column in df.columns:
+            return df[column].astype(str).fillna('nan')
+        if isinstance(fallback, pd.Series):
+            return fallback
+        return pd.Series('' if fallback is None else fallback, index=df.index, dtype=object)
+    
+    def _has_value(self, df, column):
+        """Mask of rows where a contact column is present and non-blank"""
+        if column not in df.columns:
+            return pd.Series(False, index=df.index)
+        return df[column].notna() & (self._text(df, column).str.strip() != '')
+    
+    def _contact_rows(self, base, id_base, contacts):
+        """Reshape wide contact columns into one typed row per contact
         
+        base: DataFrame of shared organization fields (one row per source row)
+        id_base: Series of contact_id prefixes aligned with base
+        contacts: list of (suffix, contact_type, mask, values) in output order
+        """
+        frames = []
+        for order, (suffix, contact_type, mask, values) in enumerate(contacts):
+            if not mask.any():
+                continue
+            frame = base.loc[mask].copy()
+            frame['contact_id'] = id_base[mask] + suffix
+            frame['contact_type'] = contact_type if isinstance(contact_type, str) else contact_type[mask]
+            frame['contact_value'] = values[mask]
+            frame['_row'] = np.flatnonzero(mask.to_numpy())
+            frame['_order'] = order
+            frames.append(frame)
+        
+        if not frames:
+            return pd.DataFrame(columns=self.standard_columns)
+        
+        # Keep the per-row ordering (phone, email, website) of the source data
+        combined = pd.concat(frames, ignore_index=True)
+        combined = combined.sort_values(['_row', '_order'], kind='stable')
+        return combined[self.standard_columns].reset_index(drop=True)
+    
     def standardize_government_services(self):
         """Standardize federal government services data"""
         filepath = Path('data/raw/government_services.csv')
         if not filepath.exists():
             print(f"  ✗ {filepath} not found")
-            return []
+            return pd.DataFrame(columns=self.standard_columns)
             
         print(f"  Processing government services...")
         df = pd.read_csv(filepath)
-        standardized = []
         
-        for idx, row in df.iterrows():
-            # Create phone contact record - using correct column name 'phone_number'
-            phone_col = row.get('phone_number', row.get('phone', ''))
-            if pd.notna(phone_col) and str(phone_col).strip():
-                record = {
-                    'contact_id': f"gov_phone_{idx}",
-                    'contact_type': 'phone',
-                    'contact_value': str(phone_col).strip(),
-                    'organization_name': str(row.get('service_name', '')).strip(),
-                    'organization_type': 'government',
-                    'source_agent': 'government_services_scraper',
-                    'source_url': str(row.get('source_url', '')),
-                    'address': '',
-                    'suburb': '',
-                    'state': 'Federal',
-                    'postcode': '',
-                    'services': str(row.get('description', '')).strip(),
-                    'verified_date': datetime.now().isoformat(),
-                    'confidence_score': 0.9,  # High confidence - official gov source
-                    'notes': f"Federal government directory - {row.get('hours_of_operation', '')}"
-                }
-                standardized.append(record)
+        # Create phone contact record - using correct column name 'phone_number'
+        phone_col = 'phone_number' if 'phone_number' in df.columns else 'phone'
+        base = pd.DataFrame({
+            'organization_name': self._text(df, 'service_name').str.strip(),
+            'organization_type': 'government',
+            'source_agent': 'government_services_scraper',
+            'source_url': self._text(df, 'source_url'),
+            'address': '',
+            'suburb': '',
+            'state': 'Federal',
+            'postcode': '',
+            'services': self._text(df, 'description').str.strip(),
+            'verified_date': datetime.now().isoformat(),
+            'confidence_score': 0.9,  # High confidence - official gov source
+            'notes': "Federal government directory - " + self._text(df, 'hours_of_operation')
+        }, index=df.index)
+        
+        id_base = 'gov_phone_' + df.index.astype(str).to_series(index=df.index)
+        standardized = self._contact_rows(base, id_base, [
+            ('', 'phone', self._has_value(df, phone_col), self._text(df, phone_col).str.strip())
+        ])
         
         print(f"    Standardized {len(standardized)} government contacts")
         return standardized
@@ -75,63 +157,36 @@ class DataStandardizer:
         filepath = Path('data/raw/nsw_correct_directory.csv')
         if not filepath.exists():
             print(f"  ✗ {filepath} not found")
-            return []
+            return pd.DataFrame(columns=self.standard_columns)
             
         print(f"  Processing NSW government services...")
         df = pd.read_csv(filepath)
-        standardized = []
         
-        for idx, row in df.iterrows():
-            # Skip the first "Listen" row which is not a real agency
-            if str(row.get('agency_name', '')).strip() in ['Listen', '']:
-                continue
-                
-            base_record = {
-                'organization_name': str(row.get('agency_name', '')).strip(),
-                'organization_type': 'government',
-                'source_agent': 'nsw_correct_scraper',
-                'source_url': str(row.get('source_url', '')),
-                'address': str(row.get('street_address', '')).strip(),
-                'suburb': '',  # Extract from address if needed
-                'state': 'NSW',
-                'postcode': '',  # Extract from address if needed
-                'services': '',  # NSW agencies don't have service descriptions
-                'verified_date': datetime.now().isoformat(),
-                'confidence_score': 0.85,  # High confidence - official NSW directory
-                'notes': f"NSW Government Directory - Postal: {row.get('postal_address', '')}"
-            }
-            
-            contact_id_base = f"nsw_gov_{idx}"
-            
-            # Phone contact
-            if pd.notna(row.get('phone', '')) and str(row.get('phone', '')).strip():
-                phone_record = base_record.copy()
-                phone_record.update({
-                    'contact_id': f"{contact_id_base}_phone",
-                    'contact_type': 'phone',
-                    'contact_value': str(row['phone']).strip()
-                })
-                standardized.append(phone_record)
-            
-            # Email contact
-            if pd.notna(row.get('email', '')) and str(row.get('email', '')).strip():
-                email_record = base_record.copy()
-                email_record.update({
-                    'contact_id': f"{contact_id_base}_email",
-                    'contact_type': 'email',
-                    'contact_value': str(row['email']).strip()
-                })
-                standardized.append(email_record)
-            
-            # Website contact
-            if pd.notna(row.get('website', '')) and str(row.get('website', '')).strip():
-                website_record = base_record.copy()
-                website_record.update({
-                    'contact_id': f"{contact_id_base}_website",
-                    'contact_type': 'website',
-                    'contact_value': str(row['website']).strip()
-                })
-                standardized.append(website_record)
+        # Skip the first "Listen" row which is not a real agency
+        agency = self._text(df, 'agency_name').str.strip()
+        df = df[~agency.isin(['Listen', ''])]
+        
+        base = pd.DataFrame({
+            'organization_name': agency[df.index],
+            'organization_type': 'government',
+            'source_agent': 'nsw_correct_scraper',
+            'source_url': self._text(df, 'source_url'),
+            'address': self._text(df, 'street_address').str.strip(),
+            'suburb': '',  # Extract from address if needed
+            'state': 'NSW',
+            'postcode': '',  # Extract from address if needed
+            'services': '',  # NSW agencies don't have service descriptions
+            'verified_date': datetime.now().isoformat(),
+            'confidence_score': 0.85,  # High confidence - official NSW directory
+            'notes': "NSW Government Directory - Postal: " + self._text(df, 'postal_address')
+        }, index=df.index)
+        
+        id_base = 'nsw_gov_' + df.index.astype(str).to_series(index=df.index)
+        standardized = self._contact_rows(base, id_base, [
+            (f"_{contact_type}", contact_type, self._has_value(df, contact_type),
+             self._text(df, contact_type).str.strip())
+            for contact_type in ['phone', 'email', 'website']
+        ])
         
         print(f"    Standardized {len(standardized)} NSW government contacts")
         return standardized
@@ -141,59 +196,32 @@ class DataStandardizer:
         filepath = Path('data/raw/nsw_hospitals.csv')
         if not filepath.exists():
             print(f"  ✗ {filepath} not found")
-            return []
+            return pd.DataFrame(columns=self.standard_columns)
             
         print(f"  Processing NSW hospitals...")
         df = pd.read_csv(filepath)
-        standardized = []
         
-        for idx, row in df.iterrows():
-            base_record = {
-                'organization_name': str(row.get('hospital_name', '')).strip(),
-                'organization_type': 'hospital',
-                'source_agent': 'nsw_hospitals_agent',
-                'source_url': 'NSW Health API',
-                'address': str(row.get('street_address', '')).strip(),
-                'suburb': str(row.get('suburb', '')).strip(),
-                'state': 'NSW',
-                'postcode': str(row.get('postcode', '')).strip(),
-                'services': str(row.get('services', '')).strip(),
-                'verified_date': datetime.now().isoformat(),
-                'confidence_score': 0.95,  # Very high - official API
-                'notes': f"LHD: {row.get('local_health_district', '')}"
-            }
-            
-            contact_id_base = f"hospital_{idx}"
-            
-            # Phone contact
-            if pd.notna(row.get('phone', '')) and str(row.get('phone', '')).strip():
-                phone_record = base_record.copy()
-                phone_record.update({
-                    'contact_id': f"{contact_id_base}_phone",
-                    'contact_type': 'phone',
-                    'contact_value': str(row['phone']).strip()
-                })
-                standardized.append(phone_record)
-            
-            # Email contact
-            if pd.notna(row.get('email', '')) and str(row.get('email', '')).strip():
-                email_record = base_record.copy()
-                email_record.update({
-                    'contact_id': f"{contact_id_base}_email",
-                    'contact_type': 'email',
-                    'contact_value': str(row['email']).strip()
-                })
-                standardized.append(email_record)
-            
-            # Website contact
-            if pd.notna(row.get('website', '')) and str(row.get('website', '')).strip():
-                website_record = base_record.copy()
-                website_record.update({
-                    'contact_id': f"{contact_id_base}_website",
-                    'contact_type': 'website',
-                    'contact_value': str(row['website']).strip()
-                })
-                standardized.append(website_record)
+        base = pd.DataFrame({
+            'organization_name': self._text(df, 'hospital_name').str.strip(),
+            'organization_type': 'hospital',
+            'source_agent': 'nsw_hospitals_agent',
+            'source_url': 'NSW Health API',
+            'address': self._text(df, 'street_address').str.strip(),
+            'suburb': self._text(df, 'suburb').str.strip(),
+            'state': 'NSW',
+            'postcode': self._text(df, 'postcode').str.strip(),
+            'services': self._text(df, 'services').str.strip(),
+            'verified_date': datetime.now().isoformat(),
+            'confidence_score': 0.95,  # Very high - official API
+            'notes': "LHD: " + self._text(df, 'local_health_district')
+        }, index=df.index)
+        
+        id_base = 'hospital_' + df.index.astype(str).to_series(index=df.index)
+        standardized = self._contact_rows(base, id_base, [
+            (f"_{contact_type}", contact_type, self._has_value(df, contact_type),
+             self._text(df, contact_type).str.strip())
+            for contact_type in ['phone', 'email', 'website']
+        ])
         
         print(f"    Standardized {len(standardized)} hospital contacts")
         return standardized
@@ -203,146 +231,160 @@ class DataStandardizer:
         filepath = Path('data/raw/scamwatch_threats.csv')
         if not filepath.exists():
             print(f"  ✗ {filepath} not found")
-            return []
+            return pd.DataFrame(columns=self.standard_columns)
             
         print(f"  Processing scam threats...")
         df = pd.read_csv(filepath)
-        standardized = []
         
-        for idx, row in df.iterrows():
-            if str(row.get('threat_value', '')).strip():
-                record = {
-                    'contact_id': f"threat_{idx}",
-                    'contact_type': str(row.get('threat_type', '')),
-                    'contact_value': str(row['threat_value']).strip(),
-                    'organization_name': f"SCAM: {row.get('article_title', '')}",
-                    'organization_type': 'threat',
-                    'source_agent': 'scamwatch_threat_agent',
-                    'source_url': str(row.get('article_url', '')),
-                    'address': '',
-                    'suburb': '',
-                    'state': '',
-                    'postcode': '',
-                    'services': str(row.get('scam_tactics', '')),
-                    'verified_date': datetime.now().isoformat(),
-                    'confidence_score': 0.8,  # Good confidence - official scamwatch
-                    'notes': f"Scam type: {row.get('scam_type', '')}, Impersonates: {row.get('impersonated_organizations', '')}"
-                }
-                standardized.append(record)
+        base = pd.DataFrame({
+            'organization_name': "SCAM: " + self._text(df, 'article_title'),
+            'organization_type': 'threat',
+            'source_agent': 'scamwatch_threat_agent',
+            'source_url': self._text(df, 'article_url'),
+            'address': '',
+            'suburb': '',
+            'state': '',
+            'postcode': '',
+            'services': self._text(df, 'scam_tactics'),
+            'verified_date': datetime.now().isoformat(),
+            'confidence_score': 0.8,  # Good confidence - official scamwatch
+            'notes': ("Scam type: " + self._text(df, 'scam_type') +
+                      ", Impersonates: " + self._text(df, 'impersonated_organizations'))
+        }, index=df.index)
+        
+        threat_value = self._text(df, 'threat_value').str.strip()
+        id_base = 'threat_' + df.index.astype(str).to_series(index=df.index)
+        standardized = self._contact_rows(base, id_base, [
+            ('', self._text(df, 'threat_type'), threat_value != '', threat_value)
+        ])
         
         print(f"    Standardized {len(standardized)} threat indicators")
         return standardized
     
     def standardize_charity_data(self):
         """Standardize charity data if available"""
-        charity_files = [
-            'data/raw/verified_charity_contacts.csv',  # This has the phone numbers we extracted
-            'data/raw/acnc_charities_picton.csv',     # This has full charity details from new ACNC agent
-            'data/raw/acnc_enhanced_picton.csv'
-        ]
-        
         standardized = []
         
-        for filename in charity_files:
+        for filename in CHARITY_FILES:
             filepath = Path(filename)
             if filepath.exists():
                 print(f"  Processing {filename}...")
                 df = pd.read_csv(filepath)
                 
-                for idx, row in df.iterrows():
-                    base_record = {
-                        'organization_name': str(row.get('charity_name', row.get('Charity_Name', ''))).strip(),
-                        'organization_type': 'charity',
-                        'source_agent': 'acnc_data_agent',
-                        'source_url': str(row.get('website', row.get('Website', ''))),
-                        'address': str(row.get('address', row.get('Address', ''))).strip(),
-                        'suburb': str(row.get('suburb', row.get('Suburb', 'Picton'))).strip(),
-                        'state': 'NSW',
-                        'postcode': str(row.get('postcode', row.get('Postcode', ''))).strip(),
-                        'services': str(row.get('activities', row.get('Activities', ''))).strip(),
-                        'verified_date': datetime.now().isoformat(),
-                        'confidence_score': 0.7,  # Medium confidence - charity data
-                        'notes': f"ABN: {row.get('ABN', '')}"
-                    }
-                    
-                    contact_id_base = f"charity_{filename}_{idx}"
-                    
-                    # Phone contact
-                    phone_col = next((col for col in df.columns if 'phone' in col.lower()), None)
-                    if phone_col and pd.notna(row.get(phone_col, '')):
-                        phone_record = base_record.copy()
-                        phone_record.update({
-                            'contact_id': f"{contact_id_base}_phone",
-                            'contact_type': 'phone',
-                            'contact_value': str(row[phone_col]).strip()
-                        })
-                        standardized.append(phone_record)
-                    
-                    # Email contact  
-                    email_col = next((col for col in df.columns if 'email' in col.lower()), None)
-                    if email_col and pd.notna(row.get(email_col, '')) and str(row[email_col]).strip():
-                        email_record = base_record.copy()
-                        email_record.update({
-                            'contact_id': f"{contact_id_base}_email",
-                            'contact_type': 'email',
-                            'contact_value': str(row[email_col]).strip()
-                        })
-                        standardized.append(email_record)
-                    
-                    # Create organizational record even if no phone/email (for charity verification)
-                    # This is valuable for anti-scam purposes - people can verify charity legitimacy
-                    if not phone_col or not pd.notna(row.get(phone_col, '')) or not str(row.get(phone_col, '')).strip():
-                        if not email_col or not pd.notna(row.get(email_col, '')) or not str(row.get(email_col, '')).strip():
-                            # No phone or email - create organizational verification record
-                            org_record = base_record.copy()
-                            org_record.update({
-                                'contact_id': f"{contact_id_base}_org",
-                                'contact_type': 'organization',
-                                'contact_value': f"ABN: {row.get('abn', row.get('ABN', ''))}"
-                            })
-                            standardized.append(org_record)
+                base = pd.DataFrame({
+                    'organization_name': self._text(df, 'charity_name', self._text(df, 'Charity_Name')).str.strip(),
+                    'organization_type': 'charity',
+                    'source_agent': 'acnc_data_agent',
+                    'source_url': self._text(df, 'website', self._text(df, 'Website')),
+                    'address': self._text(df, 'address', self._text(df, 'Address')).str.strip(),
+                    'suburb': self._text(df, 'suburb', self._text(df, 'Suburb', 'Picton')).str.strip(),
+                    'state': 'NSW',
+                    'postcode': self._text(df, 'postcode', self._text(df, 'Postcode')).str.strip(),
+                    'services': self._text(df, 'activities', self._text(df, 'Activities')).str.strip(),
+                    'verified_date': datetime.now().isoformat(),
+                    'confidence_score': 0.7,  # Medium confidence - charity data
+                    'notes': "ABN: " + self._text(df, 'ABN')
+                }, index=df.index)
+                
+                id_base = f"charity_{filename}_" + df.index.astype(str).to_series(index=df.index)
+                
+                phone_col = next((col for col in df.columns if 'phone' in col.lower()), None)
+                email_col = next((col for col in df.columns if 'email' in col.lower()), None)
+                has_phone = df[phone_col].notna() if phone_col else pd.Series(False, index=df.index)
+                has_email = self._has_value(df, email_col) if email_col else pd.Series(False, index=df.index)
+                
+                # Create organizational record even if no phone/email (for charity verification)
+                # This is valuable for anti-scam purposes - people can verify charity legitimacy
+                no_contact = ~self._has_value(df, phone_col) & ~has_email if phone_col else ~has_email
+                abn = "ABN: " + self._text(df, 'abn', self._text(df, 'ABN'))
+                
+                standardized.append(self._contact_rows(base, id_base, [
+                    ('_phone', 'phone', has_phone,
+                     self._text(df, phone_col).str.strip() if phone_col else base['notes']),
+                    ('_email', 'email', has_email,
+                     self._text(df, email_col).str.strip() if email_col else base['notes']),
+                    ('_org', 'organization', no_contact, abn)
+                ]))
                 
                 # Continue to process all available charity files
         
-        if standardized:
+        standardized = (pd.concat(standardized, ignore_index=True) if standardized
+                        else pd.DataFrame(columns=self.standard_columns))
+        if len(standardized):
             print(f"    Standardized {len(standardized)} charity contacts")
         
         return standardized
     
-    def generate_standardized_dataset(self):
-        """Generate complete standardized dataset"""
+    def standardize_all_sources(self, max_workers=None, method_names=None):
+        """Standardize sources, one worker process per source
+        
+        Batches come back in method_names order regardless of which worker
+        finishes first, so the merged output and contact_ids are deterministic.
+        """
+        method_names = SOURCE_METHODS if method_names is None else method_names
+        workers = min(len(method_names), max_workers or os.cpu_count() or 1)
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    columns = list(executor.map(standardize_source, method_names))
+                return [pd.DataFrame(batch, columns=self.standard_columns) for batch in columns]
+            except (OSError, RuntimeError) as e:
+                print(f"  Worker processes unavailable ({e}), standardizing sequentially")
+        
+        return [getattr(self, method_name)() for method_name in method_names]
+    
+    def generate_standardized_dataset(self, max_workers=None, force=False):
+        """Generate complete standardized dataset
+        
+        Only sources whose raw input (or this module's code) changed are
+        re-standardized, unless force is set; the merged dataset is rebuilt
+        from the per-source partitions.
+        """
         print("Data Standardizer - Common Format Generator")
         print("=" * 50)
         print("Converting all agent outputs to standard format...")
         
-        all_standardized = []
+        store = StandardizedStore([(name, inputs) for name, _, inputs in SOURCES],
+                                  merged_file=self.output_file, version=STANDARDIZER_VERSION)
+        stale = store.stale_partitions(force)
+        if stale:
+            print(f"  Rebuilding {len(stale)} of {len(SOURCES)} partitions: {', '.join(stale)}")
+            methods = dict((name, method_name) for name, method_name, _ in SOURCES)
+            batches = self.standardize_all_sources(max_workers, [methods[name] for name in stale])
+            rebuilt = dict(zip(stale, batches))
+            for name, batch in rebuilt.items():
+                store.write_partition(name, batch[self.standard_columns])
+        else:
+            rebuilt = {}
+            print("  All partitions up to date")
         
-        # Process each data source
-        all_standardized.extend(self.standardize_government_services())
-        all_standardized.extend(self.standardize_nsw_services())
-        all_standardized.extend(self.standardize_nsw_hospitals())  
-        all_standardized.extend(self.standardize_scam_threats())
-        all_standardized.extend(self.standardize_charity_data())
+        # Rebuilt partitions replace their records in the contact store; partitions
+        # the store has never seen are loaded from their CSV
+        with ContactStore(self.store_file) as contacts:
+            synced = contacts.partitions()
+            for name, _, _ in SOURCES:
+                if name in rebuilt:
+                    batch = rebuilt[name][self.standard_columns]
+                elif name not in synced and store.partition_path(name).exists():
+                    batch = pd.read_csv(store.partition_path(name), dtype={'contact_value': str, 'postcode': str})
+                else:
+                    continue
+                upserted, deleted = contacts.replace_partition(name, batch)
+                print(f"  🗄️ {name}: {upserted} records upserted, {deleted} removed from {self.store_file}")
         
-        if not all_standardized:
+        if not any(entry['records'] for entry in store.manifest['partitions'].values()):
             print("No data to standardize")
             return None
         
-        # Save to CSV
-        df = pd.DataFrame(all_standardized, columns=self.standard_columns)
-        df.to_csv(self.output_file, index=False)
+        # Merge partitions into the combined CSV
+        df = pd.read_csv(store.merged_view())
         
         print(f"\nStandardized dataset saved to: {self.output_file}")
-        print(f"Total records: {len(all_standardized)}")
+        print(f"Total records: {len(df)}")
         
         # Statistics
-        stats = {}
-        for contact_type in df['contact_type'].unique():
-            stats[contact_type] = len(df[df['contact_type'] == contact_type])
-        
-        org_stats = {}
-        for org_type in df['organization_type'].unique():
-            org_stats[org_type] = len(df[df['organization_type'] == org_type])
+        stats = df['contact_type'].value_counts().to_dict()
+        org_stats = df['organization_type'].value_counts().to_dict()
         
         print(f"\nContact Type Breakdown:")
         for contact_type, count in sorted(stats.items()):
@@ -360,8 +402,13 @@ class DataStandardizer:
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description='Convert all agent outputs to the standardized contact format')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-standardize every source, even when its partition is up to date')
+    args = parser.parse_args()
+    
     standardizer = DataStandardizer()
-    df = standardizer.generate_standardized_dataset()
+    df = standardizer.generate_standardized_dataset(force=args.force)
     
     if df is not None:
         print(f"\n✅ Standardized dataset ready for Critic Agent review")
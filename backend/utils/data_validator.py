@@ -9,11 +9,44 @@ import csv
 import json
 from pathlib import Path
 from collections import defaultdict
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add the backend directory to the Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.phone_normalizer import normalize_phone, key_strings
+from utils.contact_index import ContactIndex
+from utils.lookalike_index import LookalikeIndex
+from utils.standardized_store import fingerprint_inputs
+
+# Persistent normalized-key indexes, rebuilt when their source files change
+LEGITIMATE_INDEX_FILE = 'legitimate_contacts_index.npz'
+THREAT_INDEX_FILE = 'threat_indicators_index.npz'
+
+# Column name terms for each kind of contact detail ('contact'/'number' would
+# also catch contact_id, contact_email, abn_number and the like)
+CONTACT_COLUMN_TERMS = {
+    'phones': ['phone', 'tel', 'mobile', 'fax'],
+    'emails': ['email', 'mail'],
+    'websites': ['website', 'web', 'url', 'link']
+}
+PROVENANCE_TERMS = ['source']
+
+# Index kind -> report label
+CROSS_REFERENCE_KINDS = {'phones': 'phones', 'emails': 'emails', 'domains': 'websites'}
 
 class DataValidator:
     def __init__(self):
         self.legitimate_data = {}
         self.threat_data = {}
+        self.legitimate_files = {}
+        self.threat_files = {}
+        self.legitimate_index = None
+        self.threat_index = None
         self.validation_results = {
             'verified_legitimate': [],
             'potential_threats': [],
@@ -38,185 +71,179 @@ class DataValidator:
         for filename, source_type in datasets:
             filepath = Path(filename)
             if filepath.exists():
-                print(f"  ✓ Loading {filename}")
-                df = pd.read_csv(filepath)
-                self.legitimate_data[source_type] = df
-                print(f"    Records: {len(df)}")
+                self.legitimate_files[source_type] = filepath
             else:
                 print(f"  ✗ Missing {filename}")
         
+        # Datasets are only read when their saved index is out of date
+        self.legitimate_index = self.load_index(LEGITIMATE_INDEX_FILE, self.legitimate_files)
+        for source_type, filepath in self.legitimate_files.items():
+            if self.legitimate_index is not None:
+                print(f"  ✓ {filepath.name} (indexed)")
+                continue
+            print(f"  ✓ Loading {filepath.name}")
+            df = pd.read_csv(filepath)
+            self.legitimate_data[source_type] = df
+            print(f"    Records: {len(df)}")
+        
         # Load threat intelligence
         threat_file = Path('scamwatch_threats.csv')
         if threat_file.exists():
-            print(f"  ✓ Loading threat intelligence")
-            df = pd.read_csv(threat_file)
-            self.threat_data['scamwatch'] = df
-            print(f"    Threat indicators: {len(df)}")
+            self.threat_files['scamwatch'] = threat_file
+            self.threat_index = self.load_index(THREAT_INDEX_FILE, self.threat_files)
+            if self.threat_index is not None:
+                print(f"  ✓ Threat intelligence (indexed)")
+            else:
+                print(f"  ✓ Loading threat intelligence")
+                df = pd.read_csv(threat_file)
+                self.threat_data['scamwatch'] = df
+                print(f"    Threat indicators: {len(df)}")
         else:
             print(f"  ✗ Missing threat data")
     
+    def contact_columns(self, df):
+        """Phone, email and website columns of a dataset, found by name
+
+        Provenance columns (e.g. source_url) are not contact details of the organization.
+        """
+        columns = {'phones': [], 'emails': [], 'websites': []}
+        for col in df.columns:
+            name = col.lower()
+            if any(term in name for term in PROVENANCE_TERMS):
+                continue
+            for kind, terms in CONTACT_COLUMN_TERMS.items():
+                if any(term in name for term in terms):
+                    columns[kind].append(col)
+        return columns
+    
+    def sources_fingerprint(self, files):
+        return fingerprint_inputs([str(path) for path in files.values()])
+    
+    def load_index(self, index_file, files):
+        """Saved index built from the current contents of the source files (None when stale)"""
+        return ContactIndex.load(index_file, self.sources_fingerprint(files)) if files else None
+    
     def extract_all_contacts(self):
-        """Extract all phone numbers and emails from legitimate sources"""
-        legitimate_contacts = {
-            'phones': set(),
-            'emails': set(),
-            'websites': set()
-        }
-        
+        """Index phone numbers, emails and website domains from legitimate sources"""
         print(f"\nExtracting contact information from legitimate sources...")
         
-        # Process each legitimate dataset
-        for source_type, df in self.legitimate_data.items():
-            print(f"  Processing {source_type}...")
-            
-            # Look for phone number columns
-            phone_cols = [col for col in df.columns if 
-                         any(term in col.lower() for term in ['phone', 'tel', 'contact', 'number'])]
-            
-            # Look for email columns
-            email_cols = [col for col in df.columns if 
-                         any(term in col.lower() for term in ['email', 'mail'])]
-            
-            # Look for website columns
-            website_cols = [col for col in df.columns if 
-                           any(term in col.lower() for term in ['website', 'web', 'url', 'link'])]
-            
-            # Extract phone numbers
-            for col in phone_cols:
-                phones = df[col].dropna().astype(str)
-                for phone in phones:
-                    cleaned_phone = self.clean_phone_number(phone)
-                    if cleaned_phone and len(cleaned_phone) >= 8:
-                        legitimate_contacts['phones'].add(cleaned_phone)
-            
-            # Extract emails
-            for col in email_cols:
-                emails = df[col].dropna().astype(str)
-                for email in emails:
-                    if '@' in email and '.' in email:
-                        legitimate_contacts['emails'].add(email.strip().lower())
+        index = self.legitimate_index
+        if index is not None:
+            print(f"  Using saved index {LEGITIMATE_INDEX_FILE}")
+        else:
+            values = {'phones': [], 'emails': [], 'websites': []}
+            for source_type, df in self.legitimate_data.items():
+                print(f"  Processing {source_type}...")
+                for kind, columns in self.contact_columns(df).items():
+                    values[kind].extend(df[col] for col in columns)
             
-            # Extract websites
-            for col in website_cols:
-                websites = df[col].dropna().astype(str)
-                for website in websites:
-                    if any(proto in website for proto in ['http', 'www', '.com', '.gov', '.org']):
-                        legitimate_contacts['websites'].add(website.strip().lower())
+            combined = {kind: pd.concat(series, ignore_index=True) if series else pd.Series(dtype=object)
+                        for kind, series in values.items()}
+            index = ContactIndex.from_contacts(fingerprint=self.sources_fingerprint(self.legitimate_files), **combined)
+            if self.legitimate_files:
+                index.save(LEGITIMATE_INDEX_FILE)
         
-        print(f"    Legitimate phones: {len(legitimate_contacts['phones'])}")
-        print(f"    Legitimate emails: {len(legitimate_contacts['emails'])}")
-        print(f"    Legitimate websites: {len(legitimate_contacts['websites'])}")
+        print(f"    Legitimate phones: {len(index['phones'])}")
+        print(f"    Legitimate emails: {len(index['emails'])}")
+        print(f"    Legitimate website domains: {len(index['domains'])}")
         
-        return legitimate_contacts
+        return index
     
     def extract_threat_indicators(self):
-        """Extract threat indicators from scam data"""
-        threat_indicators = {
-            'phones': set(),
-            'emails': set(),
-            'websites': set(),
-            'impersonated_orgs': set()
-        }
-        
+        """Index threat indicators from scam data"""
         print(f"\nExtracting threat indicators...")
         
-        if 'scamwatch' in self.threat_data:
-            df = self.threat_data['scamwatch']
-            
-            # Extract threat phone numbers
-            threat_phones = df[df['threat_type'] == 'phone']['threat_value'].dropna()
-            for phone in threat_phones:
-                cleaned_phone = self.clean_phone_number(str(phone))
-                if cleaned_phone:
-                    threat_indicators['phones'].add(cleaned_phone)
-            
-            # Extract threat emails
-            threat_emails = df[df['threat_type'] == 'email']['threat_value'].dropna()
-            for email in threat_emails:
-                if '@' in str(email):
-                    threat_indicators['emails'].add(str(email).strip().lower())
-            
-            # Extract threat websites
-            threat_websites = df[df['threat_type'] == 'website']['threat_value'].dropna()
-            for website in threat_websites:
-                threat_indicators['websites'].add(str(website).strip().lower())
+        index = self.threat_index
+        if index is not None:
+            print(f"  Using saved index {THREAT_INDEX_FILE}")
+        else:
+            frames = list(self.threat_data.values())
+            df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(
+                columns=['threat_type', 'threat_value', 'impersonated_organizations'])
+            values = lambda threat_type: df.loc[df['threat_type'] == threat_type, 'threat_value']
             
-            # Extract impersonated organizations
-            impersonated = df['impersonated_organizations'].dropna()
-            for orgs in impersonated:
-                if pd.notna(orgs) and str(orgs).strip():
-                    for org in str(orgs).split(','):
-                        threat_indicators['impersonated_orgs'].add(org.strip())
-        
-        print(f"    Threat phones: {len(threat_indicators['phones'])}")
-        print(f"    Threat emails: {len(threat_indicators['emails'])}")
-        print(f"    Threat websites: {len(threat_indicators['websites'])}")
-        print(f"    Impersonated orgs: {len(threat_indicators['impersonated_orgs'])}")
-        
-        return threat_indicators
+            # Impersonated organizations are comma-separated lists
+            organizations = df['impersonated_organizations'].dropna().astype(str).str.split(',').explode()
+            index = ContactIndex.from_contacts(values('phone'), values('email'), values('website'),
+                                               fingerprint=self.sources_fingerprint(self.threat_files),
+                                               impersonated_orgs=organizations)
+            if self.threat_files:
+                index.save(THREAT_INDEX_FILE)
+        
+        print(f"    Threat phones: {len(index['phones'])}")
+        print(f"    Threat emails: {len(index['emails'])}")
+        print(f"    Threat website domains: {len(index['domains'])}")
+        print(f"    Impersonated orgs: {len(index['impersonated_orgs'])}")
+        
+        return index
     
     def cross_reference_data(self, legitimate_contacts, threat_indicators):
-        """Cross-reference legitimate vs threat data"""
+        """Cross-reference legitimate vs threat data by normalized key"""
         print(f"\nCross-referencing legitimate contacts against threat indicators...")
+        started = time.perf_counter()
+        
+        compromised = {}
+        safe = {}
+        for kind, label in CROSS_REFERENCE_KINDS.items():
+            keys = legitimate_contacts[kind].keys()
+            matched = threat_indicators.contains(kind, keys)
+            if kind == 'phones':
+                keys = key_strings(keys)
+            keys = np.asarray(keys, dtype=object)
+            compromised[label] = sorted(keys[matched])
+            safe[label] = set(keys[~matched])
+        
+        # Threat domains imitating (rather than equal to) a legitimate domain
+        lookalikes = LookalikeIndex(legitimate_contacts['hosts'].keys()).screen(threat_indicators['hosts'].keys())
         
         results = {
-            'compromised_phones': [],
-            'compromised_emails': [],
-            'compromised_websites': [],
-            'safe_contacts': {
-                'phones': legitimate_contacts['phones'] - threat_indicators['phones'],
-                'emails': legitimate_contacts['emails'] - threat_indicators['emails'],
-                'websites': legitimate_contacts['websites'] - threat_indicators['websites']
-            }
+            'compromised_phones': compromised['phones'],
+            'compromised_emails': compromised['emails'],
+            'compromised_websites': compromised['websites'],
+            'lookalike_websites': [{'website': domain, 'lookalike_of': matches[0]['domain'], 'match': matches[0]['match']}
+                                   for domain, matches in sorted(lookalikes.items())],
+            'safe_contacts': safe
         }
-        
-        # Find compromised contacts
-        compromised_phones = legitimate_contacts['phones'].intersection(threat_indicators['phones'])
-        compromised_emails = legitimate_contacts['emails'].intersection(threat_indicators['emails'])
-        compromised_websites = legitimate_contacts['websites'].intersection(threat_indicators['websites'])
-        
-        results['compromised_phones'] = list(compromised_phones)
-        results['compromised_emails'] = list(compromised_emails)
-        results['compromised_websites'] = list(compromised_websites)
+        print(f"  Cross-referenced in {(time.perf_counter() - started) * 1000:.1f} ms")
         
         # Statistics
         print(f"  🚨 COMPROMISED CONTACTS FOUND:")
-        print(f"    Compromised phones: {len(compromised_phones)}")
-        print(f"    Compromised emails: {len(compromised_emails)}")
-        print(f"    Compromised websites: {len(compromised_websites)}")
+        print(f"    Compromised phones: {len(results['compromised_phones'])}")
+        print(f"    Compromised emails: {len(results['compromised_emails'])}")
+        print(f"    Compromised websites: {len(results['compromised_websites'])}")
+        print(f"    Lookalike websites: {len(results['lookalike_websites'])}")
         
         print(f"  ✅ VERIFIED SAFE CONTACTS:")
         print(f"    Safe phones: {len(results['safe_contacts']['phones'])}")
         print(f"    Safe emails: {len(results['safe_contacts']['emails'])}")
         print(f"    Safe websites: {len(results['safe_contacts']['websites'])}")
         
-        if compromised_phones:
+        if results['compromised_phones']:
             print(f"\n  ⚠️  COMPROMISED PHONE NUMBERS:")
-            for phone in compromised_phones:
+            for phone in results['compromised_phones']:
                 print(f"    {phone}")
         
+        if results['lookalike_websites']:
+            print(f"\n  ⚠️  LOOKALIKE WEBSITES:")
+            for lookalike in results['lookalike_websites']:
+                print(f"    {lookalike['website']} imitates {lookalike['lookalike_of']} ({lookalike['match']})")
+        
         return results
     
     def clean_phone_number(self, phone_text):
-        """Clean phone number for comparison"""
-        import re
-        
+        """Canonical phone key for comparison ('' when not a phone number)"""
         if not phone_text or str(phone_text).lower() in ['nan', 'none', '']:
             return ""
         
-        phone_clean = str(phone_text).strip()
-        phone_clean = re.sub(r'[^\d+()]', ' ', phone_clean)
-        phone_clean = re.sub(r'\s+', ' ', phone_clean)
-        
-        return phone_clean.strip()
+        return normalize_phone(phone_text)
     
     def save_validation_results(self, cross_ref_results, filename='validation_report.json'):
         """Save validation results to JSON"""
         report = {
             'validation_timestamp': pd.Timestamp.now().isoformat(),
             'data_sources': {
-                'legitimate_sources': list(self.legitimate_data.keys()),
-                'threat_sources': list(self.threat_data.keys())
+                'legitimate_sources': list(self.legitimate_files.keys()),
+                'threat_sources': list(self.threat_files.keys())
             },
             'statistics': {
                 'total_legitimate_phones': len(cross_ref_results['safe_contacts']['phones']) + len(cross_ref_results['compromised_phones']),
@@ -225,6 +252,7 @@ class DataValidator:
                 'compromised_phones': len(cross_ref_results['compromised_phones']),
                 'compromised_emails': len(cross_ref_results['compromised_emails']),
                 'compromised_websites': len(cross_ref_results['compromised_websites']),
+                'lookalike_websites': len(cross_ref_results['lookalike_websites']),
                 'safe_phones': len(cross_ref_results['safe_contacts']['phones']),
                 'safe_emails': len(cross_ref_results['safe_contacts']['emails']),
                 'safe_websites': len(cross_ref_results['safe_contacts']['websites'])
@@ -234,6 +262,7 @@ class DataValidator:
                 'emails': cross_ref_results['compromised_emails'],
                 'websites': cross_ref_results['compromised_websites']
             },
+            'lookalike_websites': cross_ref_results['lookalike_websites'],
             'verified_safe_sample': {
                 'phones': list(cross_ref_results['safe_contacts']['phones'])[:10],
                 'emails': list(cross_ref_results['safe_contacts']['emails'])[:10],
@@ -252,7 +281,7 @@ class DataValidator:
         # Load all datasets
         self.load_all_datasets()
         
-        if not self.legitimate_data and not self.threat_data:
+        if not self.legitimate_files and not self.threat_files:
             print("No data available for validation")
             return None
         
@@ -288,6 +317,7 @@ def main():
         print(f"  🚨 Compromised phones: {stats['compromised_phones']}")
         print(f"  🚨 Compromised emails: {stats['compromised_emails']}")
         print(f"  🚨 Compromised websites: {stats['compromised_websites']}")
+        print(f"  🚨 Lookalike websites: {stats['lookalike_websites']}")
         
         print(f"  ✅ Verified safe phones: {stats['safe_phones']}")
         print(f"  ✅ Verified safe emails: {stats['safe_emails']}")
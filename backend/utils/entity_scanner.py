@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Entity Scanner - Single-pass contact and threat entity extraction
+Finds phone numbers, emails, URLs, dates and keyword entities in page text
+with one compiled pattern set and one keyword automaton pass
+"""
+
+import re
+import sys
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+# Allow running from backend/utils or as part of the backend package path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.keyword_automaton import KeywordAutomaton
+from utils.phone_normalizer import PHONE_PATTERNS
+
+
+EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+
+URL_PATTERN = r'https?://(?:www\.)?(?P<url_host>[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+
+DATE_PATTERNS = [
+    ('date_dmy', r'\d{1,2}\s+\w+\s+\d{4}'),       # "29 August 2025"
+    ('date_mdy', r'\b\w+\s+\d{1,2},?\s+\d{4}'),    # "August 29, 2025"
+    ('date_iso', r'\d{4}-\d{2}-\d{2}'),           # "2025-08-29"
+]
+
+# Every entity contains a digit, '@' or '://' - only text around these is matched
+TRIGGER_PATTERN = re.compile(r'[\d@:]')
+
+# Entities start at most one token before their first trigger and end at most
+# three tokens after it (e.g. "+61 2 9999 8888", "August 29, 2025")
+TOKENS_BEFORE = 1
+TOKENS_AFTER = 3
+MAX_TOKEN_LENGTH = 256
+WHITESPACE = (' ', '\n', '\t', '\r', '\xa0')
+
+PATTERN_KINDS = {name: 'phone' for name, _ in PHONE_PATTERNS}
+PATTERN_KINDS.update({'email': 'email', 'url': 'url'})
+PATTERN_KINDS.update({name: 'date' for name, _ in DATE_PATTERNS})
+
+
+def compile_entity_pattern(include_dates: bool = True):
+    """Compile all contact patterns into one alternation with named groups"""
+    alternatives = [f'(?P<{name}>{pattern})' for name, pattern in PHONE_PATTERNS]
+    alternatives.append(f'(?P<email>{EMAIL_PATTERN})')
+    alternatives.append(f'(?P<url>{URL_PATTERN})')
+    if include_dates:
+        alternatives.extend(f'(?P<{name}>{pattern})' for name, pattern in DATE_PATTERNS)
+    return re.compile('|'.join(alternatives))
+
+
+def _token_start(text, pos):
+    """Index of the first character of the token containing pos"""
+    floor = max(0, pos - MAX_TOKEN_LENGTH)
+    return max(text.rfind(ch, floor, pos) for ch in WHITESPACE) + 1 or floor
+
+
+def _token_end(text, pos):
+    """Index of the whitespace character ending the token containing pos"""
+    ceiling = min(len(text), pos + MAX_TOKEN_LENGTH)
+    ends = [i for i in (text.find(ch, pos, ceiling) for ch in WHITESPACE) if i >= 0]
+    return min(ends) if ends else ceiling
+
+
+def candidate_regions(text):
+    """Merged [start, end) windows of whole tokens that can contain entities
+
+    Matching the combined pattern inside these windows gives the same spans as
+    matching the full text, but skips the prose between entities entirely.
+    """
+    regions = []
+    length = len(text)
+    pos = 0
+    while True:
+        trigger = TRIGGER_PATTERN.search(text, pos)
+        if trigger is None:
+            break
+        start = _token_start(text, trigger.start())
+        for _ in range(TOKENS_BEFORE):
+            while start > 0 and text[start - 1].isspace():
+                start -= 1
+            start = _token_start(text, start) if start > 0 else 0
+        token_end = _token_end(text, trigger.start())
+        end = token_end
+        for _ in range(TOKENS_AFTER):
+            while end < length and text[end].isspace():
+                end += 1
+            end = _token_end(text, end) if end < length else length
+
+        if regions and start <= regions[-1][1]:
+            regions[-1][1] = max(regions[-1][1], end)
+        else:
+            regions.append([start, end])
+        pos = max(token_end, trigger.end())
+    return regions
+
+
+@dataclass
+class EntitySpan:
+    """A single entity found in text"""
+    kind: str       # phone/email/url/date or a keyword group name
+    label: str      # pattern variant (e.g. phone_1800) or keyword label
+    start: int
+    end: int
+    text: str       # exact matched text
+    value: str      # cleaned value (stripped text, or host for URLs)
+
+
+class ScanResult:
+    """Entity spans for one text with convenience accessors"""
+
+    def __init__(self, spans: List[EntitySpan]):
+        self.spans = spans
+
+    def of_kind(self, kind: str) -> List[EntitySpan]:
+        return [span for span in self.spans if span.kind == kind]
+
+    def values(self, kind: str) -> List[str]:
+        """Distinct values of a kind in document order"""
+        return list(dict.fromkeys(span.value for span in self.spans if span.kind == kind))
+
+    def labels(self, kind: str) -> set:
+        """Distinct labels of a kind present in the text"""
+        return {span.label for span in self.spans if span.kind == kind}
+
+    def first_value(self, kind: str, label_order: Optional[Iterable[str]] = None) -> str:
+        """First value of a kind, optionally preferring labels in the given order"""
+        spans = self.of_kind(kind)
+        if not spans:
+            return ''
+        if label_order:
+            for label in label_order:
+                for span in spans:
+                    if span.label == label:
+                        return span.value
+        return spans[0].value
+
+
+class EntityScanner:
+    """Shared extraction engine: one compiled pattern set plus one keyword automaton
+
+    keyword_groups maps a group name (e.g. 'scam_type') to {label: [keywords]}.
+    """
+
+    def __init__(self, keyword_groups: Optional[Dict[str, Dict[str, List[str]]]] = None,
+                 include_dates: bool = True):
+        self.pattern = compile_entity_pattern(include_dates)
+        self.automaton = KeywordAutomaton()
+        for group, labels in (keyword_groups or {}).items():
+            for label, keywords in labels.items():
+                for keyword in keywords:
+                    self.automaton.add(keyword, (group, label))
+        self.automaton.build()
+
+    def scan_patterns(self, text: str) -> List[EntitySpan]:
+        """Find all phone/email/url/date spans in one regex pass over candidate regions"""
+        spans = []
+        for start, end in candidate_regions(text):
+            for match in self.pattern.finditer(text, start, end):
+                name = match.lastgroup
+                matched = match.group(name)
+                value = match.group('url_host') if name == 'url' else matched.strip()
+                spans.append(EntitySpan(PATTERN_KINDS[name], name, match.start(), match.end(), matched, value))
+        return spans
+
+    def scan_keywords(self, text: str) -> List[EntitySpan]:
+        """Find all keyword occurrences in one automaton pass"""
+        spans = []
+        prepared = self.automaton.prepare(text)
+        payloads = self.automaton.payloads
+        for start, end, key in self.automaton.iter_matches(prepared, prepared=True):
+            for group, label in payloads[key]:
+                spans.append(EntitySpan(group, label, start, end, text[start:end], key))
+        return spans
+
+    def scan(self, text: str) -> ScanResult:
+        """Return every entity span in text ordered by offset"""
+        if not text:
+            return ScanResult([])
+        spans = self.scan_patterns(text) + self.scan_keywords(text)
+        spans.sort(key=lambda span: (span.start, span.end))
+        return ScanResult(spans)
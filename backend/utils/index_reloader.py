@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Index Reloader - Background rebuild and swap of the verification index
+Watches the pipeline outputs an index is built from, rebuilds the index on a
+background thread when their content changes and swaps it in with a single
+reference assignment, so queries never wait for a reload or see a partial index
+"""
+
+import os
+import sys
+import threading
+import time
+
+# Allow running from backend/utils or as part of the backend package path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.standardized_store import fingerprint_inputs
+
+RELOAD_INTERVAL = 5.0       # seconds between checks of the pipeline outputs
+
+
+class IndexReloader(threading.Thread):
+    """Keeps `index` built from the current contents of `files`
+
+    `load` builds a new index from the files. A change is picked up once
+    the files' size and modification time have stayed the same for one
+    interval (the pipeline writes them in place), and the index is only
+    rebuilt when their content fingerprint differs from the loaded one.
+    Readers take `index` once per request: a request in flight keeps the
+    index it started with, and the old index is freed when the last one
+    finishes. A failed rebuild keeps the current index and is retried
+    when the files change again.
+    """
+
+    def __init__(self, files, load, interval=RELOAD_INTERVAL, on_swap=None):
+        super().__init__(daemon=True)
+        self.files = [str(path) for path in files]
+        self.load = load
+        self.interval = interval
+        self.on_swap = on_swap
+        self.index = None
+        self.version = None
+        self.loaded_at = None
+        self.reload_seconds = None
+        self.reloads = 0
+        self.reload_errors = 0
+        self.last_error = None
+        self._seen = self._loaded = None
+        self._stopped = threading.Event()
+
+    def signature(self):
+        """Size and modification time of every watched file (None when missing)"""
+        signature = []
+        for path in self.files:
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_size, stat.st_mtime_ns))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def reload(self):
+        """Rebuild and swap in the index if the files' content changed; True when swapped"""
+        signature = self.signature()
+        self._seen = self._loaded = signature
+        version = fingerprint_inputs(self.files)
+        if version == self.version:
+            return False
+        start = time.perf_counter()
+        index = self.load()
+        self.reload_seconds = round(time.perf_counter() - start, 3)
+        self.index, self.version = index, version
+        self.loaded_at = time.time()
+        self.reloads += 1
+        if self.on_swap:
+            self.on_swap(index)
+        return True
+
+    def poll(self):
+        """One check of the watched files; True when a new index was swapped in"""
+        signature = self.signature()
+        if signature != self._seen:
+            self._seen = signature          # still being written: check again next interval
+            return False
+        if signature == self._loaded:
+            return False
+        try:
+            return self.reload()
+        except Exception as e:              # keep serving the current index
+            self._loaded = signature
+            self.reload_errors += 1
+            self.last_error = f"{e.__class__.__name__}: {e}"
+            print(f"⚠️ Index reload failed, keeping version {self.short_version}: {self.last_error}")
+            return False
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            if self.poll():
+                print(f"🔄 Index version {self.short_version} loaded in {self.reload_seconds} s")
+
+    def stop(self):
+        self._stopped.set()
+
+    @property
+    def short_version(self):
+        return self.version[:12] if self.version else None
+
+    def metrics(self):
+        return {'index_version': self.short_version, 'loaded_at': self.loaded_at,
+                'reload_seconds': self.reload_seconds, 'reloads': self.reloads,
+                'reload_errors': self.reload_errors, 'last_error': self.last_error}
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Keyword Automaton - Aho-Corasick multi-keyword matcher
+Compiles a keyword set once and finds every occurrence in a single pass over the text
+Used by the entity scanner and the keyword classifier shared across agents
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+# Optional C implementation - falls back to the pure Python automaton below
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def fold_case(text: str) -> str:
+    """Lower-case text one character at a time, keeping its length
+
+    str.lower() can lengthen a string ('İ' becomes 'i' plus a combining dot),
+    which would shift match offsets away from the original text. Characters
+    whose lower case is longer fold to its first character instead.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return ''.join(char.lower()[0] for char in text)
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton mapping keywords to one or more payloads
+
+    Matching is plain substring matching (same semantics as ``keyword in text``),
+    case-insensitive by default. Each keyword can carry several payloads, e.g.
+    'government' is both a scam type keyword and an authority tactic keyword.
+    """
+
+    def __init__(self, keywords: Iterable[Tuple[str, Any]] = (), case_sensitive: bool = False):
+        self.case_sensitive = case_sensitive
+        self.payloads: Dict[str, List[Any]] = {}
+        self._built = False
+        self._native = None
+
+        # Pure Python automaton state tables
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+
+        for keyword, payload in keywords:
+            self.add(keyword, payload)
+
+    def add(self, keyword: str, payload: Any = None):
+        """Register a keyword with a payload (call build() afterwards)"""
+        if not keyword:
+            return
+        key = keyword if self.case_sensitive else fold_case(keyword)
+        self.payloads.setdefault(key, []).append(payload if payload is not None else keyword)
+        self._built = False
+
+    def build(self):
+        """Compile the registered keywords into the automaton"""
+        if ahocorasick is not None:
+            native = ahocorasick.Automaton()
+            for key in self.payloads:
+                native.add_word(key, key)
+            if self.payloads:
+                native.make_automaton()
+                self._native = native
+            else:
+                self._native = None
+            self._built = True
+            return self
+
+        goto: List[Dict[str, int]] = [{}]
+        output: List[List[str]] = [[]]
+
+        # Trie construction
+        for key in self.payloads:
+            state = 0
+            for char in key:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    output.append([])
+                state = next_state
+            output[state].append(key)
+
+        # Breadth-first failure links
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                candidate = goto[fallback].get(char, 0)
+                fail[next_state] = candidate if candidate != next_state else 0
+                output[next_state].extend(output[fail[next_state]])
+
+        self._goto, self._fail, self._output = goto, fail, output
+        self._built = True
+        return self
+
+    def prepare(self, text: str) -> str:
+        """Case-fold text once so callers can reuse it across scans (offsets are unchanged)"""
+        return text if self.case_sensitive else fold_case(text)
+
+    def iter_matches(self, text: str, prepared: bool = False) -> Iterator[Tuple[int, int, str]]:
+        """Yield (start, end, keyword) for every keyword occurrence in text"""
+        if not self._built:
+            self.build()
+        haystack = text if prepared else self.prepare(text)
+
+        if ahocorasick is not None:
+            if self._native is None:
+                return
+            for end_index, key in self._native.iter(haystack):
+                yield end_index + 1 - len(key), end_index + 1, key
+            return
+
+        goto, fail, output = self._goto, self._fail, self._output
+        root = goto[0]
+        state = 0
+        for index, char in enumerate(haystack):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0) if state else root.get(char, 0)
+            if output[state]:
+                for key in output[state]:
+                    yield index + 1 - len(key), index + 1, key
+
+    def find_keywords(self, text: str, prepared: bool = False) -> set:
+        """Return the set of distinct keywords present in text"""
+        return {key for _, _, key in self.iter_matches(text, prepared)}
+
+
+class KeywordClassifier:
+    """Labels texts by the keyword sets they mention, in one automaton pass per text
+
+    categories maps a label to its keywords (a keyword may belong to several
+    labels). Labels are returned in the order the categories were defined, so
+    "first matching category wins" rules stay declarative. Batch methods
+    classify each distinct text once.
+    """
+
+    def __init__(self, categories: Dict[str, Iterable[str]], case_sensitive: bool = False):
+        self.order = {label: index for index, label in enumerate(categories)}
+        self.automaton = KeywordAutomaton(
+            ((keyword, label) for label, keywords in categories.items() for keyword in keywords),
+            case_sensitive
+        ).build()
+
+    def labels(self, text: str) -> List[str]:
+        """Labels whose keywords occur in text, in definition order"""
+        if not text:
+            return []
+        payloads = self.automaton.payloads
+        found = {label for key in self.automaton.find_keywords(text) for label in payloads[key]}
+        return sorted(found, key=self.order.__getitem__)
+
+    def first(self, text: str, default: Any = None) -> Any:
+        """First label (in definition order) whose keywords occur in text"""
+        labels = self.labels(text)
+        return labels[0] if labels else default
+
+    def matches(self, text: str) -> bool:
+        """Whether text contains any keyword"""
+        return bool(text) and next(self.automaton.iter_matches(text), None) is not None
+
+    def labels_many(self, texts: Iterable[str]) -> List[List[str]]:
+        """labels() for every text, scanning each distinct text once"""
+        cache: Dict[str, List[str]] = {}
+        return [cache[text] if text in cache else cache.setdefault(text, self.labels(text)) for text in texts]
+
+    def matches_many(self, texts: Iterable[str]) -> List[bool]:
+        """matches() for every text, scanning each distinct text once"""
+        cache: Dict[str, bool] = {}
+        return [cache[text] if text in cache else cache.setdefault(text, self.matches(text)) for text in texts]
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Lookalike Index - Typosquat and homoglyph detection against legitimate domains
+Folds IDN and confusable characters to a common skeleton and finds legitimate
+domains within a small edit distance through SymSpell-style deletion neighbourhoods
+"""
+
+import argparse
+import os
+import sys
+import time
+import unicodedata
+from collections import defaultdict
+
+import pandas as pd
+
+# Allow running from backend/utils or as part of the backend package path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.contact_index import HOST_NAME, public_suffix, registrable_domain, website_host
+
+MASTER_FILE = 'data/sorted_contacts_master.csv'
+
+MAX_DISTANCE = 2
+AFFIX_LENGTH = 8            # deletion neighbourhoods are built over key prefixes and suffixes
+
+# Allowed edits by skeleton length: short names must match exactly
+DISTANCE_BY_LENGTH = [(5, 0), (9, 1)]
+
+# Leading labels shorter than this are too generic to index on their own
+MIN_LABEL_LENGTH = 5
+
+# State government umbrellas: only the government registers hosts under them,
+# so every host below one is owned by the same party
+STATE_DOMAINS = ['act.gov.au', 'nsw.gov.au', 'nt.gov.au', 'qld.gov.au', 'sa.gov.au', 'tas.gov.au',
+                 'vic.gov.au', 'wa.gov.au']
+
+# Non-Latin letters that render like Latin ones (Cyrillic, Greek, Armenian, Latin variants)
+HOMOGLYPHS = str.maketrans({
+    'а': 'a', 'в': 'b', 'с': 'c', 'ԁ': 'd', 'е': 'e', 'һ': 'h', 'і': 'i', 'ј': 'j', 'к': 'k', 'ӏ': 'l',
+    'м': 'm', 'п': 'n', 'о': 'o', 'р': 'p', 'ԛ': 'q', 'г': 'r', 'ѕ': 's', 'т': 't', 'ц': 'u', 'ν': 'v',
+    'ѡ': 'w', 'х': 'x', 'у': 'y', 'ʐ': 'z', 'α': 'a', 'β': 'b', 'ε': 'e', 'η': 'n', 'ι': 'i', 'κ': 'k',
+    'ο': 'o', 'ρ': 'p', 'τ': 't', 'υ': 'u', 'χ': 'x', 'ω': 'w', 'օ': 'o', 'ս': 'u', 'ɑ': 'a', 'ɡ': 'g',
+    'ı': 'i', 'ȷ': 'j', 'ł': 'l', 'ø': 'o', 'đ': 'd', 'ħ': 'h'
+})
+
+# ASCII characters and pairs that read alike; separators are dropped
+CONFUSABLE_CHARACTERS = str.maketrans({'0': 'o', '1': 'l', 'i': 'l', '5': 's', '-': None, '.': None})
+CONFUSABLE_PAIRS = [('rn', 'm'), ('vv', 'w')]
+
+
+def decode_idna(host):
+    """Unicode form of a punycode ('xn--') host name"""
+    if 'xn--' in host:
+        try:
+            return host.encode('ascii').decode('idna')
+        except UnicodeError:
+            pass
+    return host
+
+
+def fold_host(host):
+    """Host in Unicode with homoglyphs and accents folded to Latin letters"""
+    host = unicodedata.normalize('NFKC', decode_idna(host).lower()).translate(HOMOGLYPHS)
+    host = ''.join(ch for ch in unicodedata.normalize('NFKD', host) if not unicodedata.combining(ch))
+    return host[4:] if host.startswith('www.') else host
+
+
+def skeleton(text):
+    """Visual skeleton of folded text: confusable characters mapped, separators removed"""
+    for pair, replacement in CONFUSABLE_PAIRS:
+        text = text.replace(pair, replacement)
+    return text.translate(CONFUSABLE_CHARACTERS)
+
+
+def allowed_distance(key):
+    for max_length, distance in DISTANCE_BY_LENGTH:
+        if len(key) < max_length:
+            return distance
+    return MAX_DISTANCE
+
+
+def deletions(key, distance):
+    """key and every string obtained by deleting up to `distance` characters from it"""
+    variants = {key}
+    frontier = {key}
+    for _ in range(distance):
+        frontier = {variant[:i] + variant[i + 1:] for variant in frontier for i in range(len(variant))}
+        variants |= frontier
+    return variants
+
+
+def edit_distance(a, b, limit):
+    """Optimal string alignment distance, or limit + 1 when it exceeds limit
+
+    Only the diagonal band of width `limit` is computed.
+    """
+    over = limit + 1
+    if abs(len(a) - len(b)) > limit:
+        return over
+    previous2 = None
+    previous = [j if j <= limit else over for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        current = [over] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+        low, high = max(1, i - limit), min(len(b), i + limit)
+        for j in range(low, high + 1):
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+        if min(current[low - 1:high + 1]) > limit:
+            return over
+        previous2, previous = previous, current
+    return min(previous[-1], over)
+
+
+def neighbourhood_keys(key):
+    """Deletion neighbourhoods of a key's prefix and suffix
+
+    Two keys within MAX_DISTANCE edits share a variant in both, so requiring
+    both keeps the candidates to verify few even for long common prefixes.
+    """
+    return (deletions(key[:AFFIX_LENGTH], MAX_DISTANCE), deletions(key[-AFFIX_LENGTH:], MAX_DISTANCE))
+
+
+def owner_domain(host):
+    """Domain identifying who controls a host: its registrable domain, or the
+    state government umbrella for hosts under one ('aho.nsw.gov.au' -> 'nsw.gov.au')
+    """
+    for domain in STATE_DOMAINS:
+        if host == domain or host.endswith('.' + domain):
+            return domain
+    return registrable_domain(host)
+
+
+def name_keys(host):
+    """Skeletons of a folded host's names: the host without its public suffix
+    (and under a state government umbrella, also without just 'gov.au') and,
+    when distinctive, its leading label
+
+    'aci.health.nsw.gov.au' is named both 'aci.health.nsw' and 'aci.health'.
+    """
+    suffixes = [public_suffix(host)]
+    if suffixes[0] in STATE_DOMAINS:
+        suffixes.insert(0, 'gov.au')
+    names = [host[:len(host) - len(suffix) - 1] if suffix and len(suffix) < len(host) else host
+             for suffix in suffixes]
+    label = names[-1].split('.', 1)[0]
+    if len(label) >= MIN_LABEL_LENGTH:
+        names.append(label)
+    return list(dict.fromkeys(skeleton(name) for name in names))
+
+
+class LookalikeIndex:
+    """Legitimate domains indexed for lookalike (typosquat, homoglyph, suffix swap) queries
+
+    Whole hosts are matched exactly after folding homoglyphs and on their
+    visual skeleton; names (hosts without their suffix) are matched within a
+    small edit distance through deletion neighbourhoods. So 'servlce.com.au',
+    'ѕervice.nsw.gov.au' and 'service-nsw.gov.au.com' all find 'service.nsw.gov.au'.
+    Hosts owned by the owner of a legitimate domain (same registrable domain or
+    state government umbrella) are the real sites and never reported.
+    """
+
+    def __init__(self, domains=()):
+        self.hosts = []
+        self.host_ids = {}
+        self.skeletons = {}
+        self.owners = set()
+        self.names = []
+        self.by_prefix = defaultdict(set)
+        self.by_suffix = defaultdict(set)
+        for domain in domains:
+            self.add(domain)
+
+    @classmethod
+    def from_contacts(cls, df):
+        """Index the websites and email domains of every non-threat contact"""
+        legitimate = df[(df['organization_type'].astype(str).str.lower() != 'threat') &
+                        df['contact_type'].isin(['website', 'email'])]
+        return cls(legitimate['contact_value'].dropna().astype(str).unique())
+
+    @classmethod
+    def from_master(cls, master_file=MASTER_FILE):
+        return cls.from_contacts(pd.read_csv(master_file))
+
+    def __len__(self):
+        return len(self.hosts)
+
+    def add(self, domain):
+        """Register a legitimate URL, host or email domain"""
+        host = fold_host(website_host(domain))
+        if not HOST_NAME.fullmatch(host) or host in self.host_ids:
+            return
+        host_id = len(self.hosts)
+        self.hosts.append(host)
+        self.host_ids[host] = host_id
+        self.skeletons.setdefault(skeleton(host), host_id)
+        self.owners.add(owner_domain(host))
+        for key in name_keys(host):
+            name_id = len(self.names)
+            self.names.append((host_id, key))
+            prefixes, suffixes = neighbourhood_keys(key)
+            for variant in prefixes:
+                self.by_prefix[variant].add(name_id)
+            for variant in suffixes:
+                self.by_suffix[variant].add(name_id)
+
+    def _similar_names(self, key):
+        """(host_id, distance) of indexed names within the allowed distance of key"""
+        prefixes, suffixes = neighbourhood_keys(key)
+        by_prefix = [self.by_prefix[variant] for variant in prefixes if variant in self.by_prefix]
+        by_suffix = [self.by_suffix[variant] for variant in suffixes if variant in self.by_suffix]
+        if sum(map(len, by_suffix)) < sum(map(len, by_prefix)):
+            by_prefix, by_suffix = by_suffix, by_prefix
+        # Union the smaller side, then keep what the other side shares with it
+        candidates = set().union(*by_prefix)
+        candidates = set().union(*(candidates.intersection(ids) for ids in by_suffix)) if candidates else candidates
+        for name_id in candidates:
+            host_id, name = self.names[name_id]
+            limit = allowed_distance(name)
+            distance = edit_distance(key, name, limit)
+            if distance <= limit:
+                yield host_id, distance
+
+    def lookup(self, candidate):
+        """Legitimate domains the candidate imitates, closest first
+
+        Each match is {'domain', 'distance', 'match'} where match is one of
+        homoglyph (same host once IDN/confusable letters are folded), confusable
+        (same skeleton, e.g. 0/o, rn/m or extra hyphens), embedded (the
+        legitimate host in front of or inside another domain), suffix_swap
+        (same name under another suffix) or typo (within the allowed edit distance).
+        """
+        raw = decode_idna(website_host(candidate))
+        host = fold_host(raw)
+        if not HOST_NAME.fullmatch(host) or owner_domain(raw) in self.owners:
+            return []
+
+        best = {}
+
+        def found(host_id, distance, match):
+            if host_id is not None and (host_id not in best or distance < best[host_id][0]):
+                best[host_id] = (distance, match)
+
+        found(self.host_ids.get(host), 0, 'homoglyph')
+        found(self.skeletons.get(skeleton(host)), 0, 'confusable')
+        # 'ato.gov.au.refund-portal.com'
+        dot = host.find('.')
+        while dot >= 0:
+            found(self.host_ids.get(host[:dot]), 0, 'embedded')
+            dot = host.find('.', dot + 1)
+        for key in name_keys(host):
+            found(self.skeletons.get(key), 0, 'embedded')        # 'ato-gov-au.com'
+            for host_id, distance in self._similar_names(key):
+                found(host_id, distance, 'suffix_swap' if distance == 0 else 'typo')
+
+        matches = [{'domain': self.hosts[host_id], 'distance': distance, 'match': match}
+                   for host_id, (distance, match) in best.items()]
+        return sorted(matches, key=lambda m: (m['distance'], m['domain']))
+
+    def screen(self, candidates):
+        """Lookalike matches for every distinct candidate that has any"""
+        results = {}
+        for candidate in dict.fromkeys(candidates):
+            matches = self.lookup(candidate)
+            if matches:
+                results[candidate] = matches
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find legitimate domains that candidate domains imitate')
+    parser.add_argument('domains', nargs='+', help='Candidate URLs or host names')
+    parser.add_argument('--master', default=MASTER_FILE, help='Sorted contacts master CSV')
+    args = parser.parse_args()
+
+    index = LookalikeIndex.from_master(args.master)
+    print(f"Indexed {len(index)} legitimate domains from {args.master}")
+    for domain in args.domains:
+        start = time.perf_counter()
+        matches = index.lookup(domain)
+        elapsed_us = (time.perf_counter() - start) * 1e6
+        if matches:
+            found = ', '.join(f"{m['domain']} ({m['match']}, distance {m['distance']})" for m in matches)
+        else:
+            found = 'no lookalikes'
+        print(f"  {domain}: {found} [{elapsed_us:.0f} µs]")
+
+
+if __name__ == "__main__":
+    main()
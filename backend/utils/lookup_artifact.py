@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Lookup Artifact - Memory-mapped binary contact lookup written by the sorter
+Stores the verification index's exact-match entries as sorted 64-bit keys and
+fixed-width records over a string table, so readers map the file and
+binary-search it without parsing anything at startup
+
+Layout (little-endian, sections 8-byte aligned):
+    header      HEADER_DTYPE
+    phones      int64[phone_count]   E.164 digits, sorted
+    emails      uint64[email_count]  key hashes, sorted
+    websites    uint64[website_count]
+    records     RECORD_DTYPE[phone_count + email_count + website_count], in key order
+    strings     UTF-8 text the records point into
+String keys hash to the first 8 bytes of their SHA-256 digest (little-endian),
+and a hash hit is confirmed against the record's key text.
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Allow running from backend/utils or as part of the backend package path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.phone_normalizer import key_strings
+from utils.verification_index import INVALID, KINDS, QUERY_KEYS, UNKNOWN
+
+ARTIFACT_FILE = 'data/sorted_contacts_master.lookup'
+MAGIC = b'CONTACTS'
+FORMAT_VERSION = 1
+
+HEADER_DTYPE = np.dtype([
+    ('magic', 'S8'), ('version', '<u4'), ('reserved', '<u4'), ('created', '<f8'),
+    ('phone_count', '<u8'), ('email_count', '<u8'), ('website_count', '<u8'), ('strings_size', '<u8'),
+])
+
+# Text fields are (offset, length) pairs into the string table; priority is NaN when unset
+TEXT_FIELDS = ['key', 'verdict', 'organization', 'organization_type', 'risk_level', 'category']
+RECORD_DTYPE = np.dtype([(field, '<u4', 2) for field in TEXT_FIELDS] +
+                        [('priority', '<f8'), ('records', '<u4'), ('reserved', '<u4')])
+
+
+def key_hash(key):
+    """64-bit hash of an email address or host name (reproducible on any platform)"""
+    return int.from_bytes(hashlib.sha256(key.encode('utf-8')).digest()[:8], 'little')
+
+
+def _aligned(size):
+    return (size + 7) & ~7
+
+
+def _sections(header):
+    """(kind, byte offset, count) of every key section, then the records and strings offsets"""
+    offset = HEADER_DTYPE.itemsize
+    sections = []
+    for kind in KINDS:
+        count = int(header[f'{kind}_count'])
+        sections.append((kind, offset, count))
+        offset = _aligned(offset + count * 8)
+    records = offset
+    strings = records + sum(count for _, _, count in sections) * RECORD_DTYPE.itemsize
+    return sections, records, strings
+
+
+def write_artifact(index, path=ARTIFACT_FILE):
+    """Write a VerificationIndex's exact-match entries as a lookup artifact
+
+    The file is written under a temporary name and renamed, so readers that
+    already mapped the previous artifact keep a consistent view of it.
+    """
+    strings = bytearray()
+    positions = {}
+
+    def text(value):
+        if value is None:
+            return (0, 0)
+        if value not in positions:
+            encoded = str(value).encode('utf-8')
+            positions[value] = (len(strings), len(encoded))
+            strings.extend(encoded)
+        return positions[value]
+
+    key_arrays, records = [], []
+    for kind in KINDS:
+        entries = index.entries[kind]
+        if kind == 'phone':
+            keys = np.fromiter(entries, dtype=np.int64, count=len(entries))
+        else:
+            keys = np.fromiter((key_hash(key) for key in entries), dtype=np.uint64, count=len(entries))
+        order = np.argsort(keys, kind='stable')
+        key_arrays.append(keys[order])
+        entry_list = list(entries.values())
+        for position in order:
+            entry = entry_list[position]
+            priority = np.nan if entry['priority'] is None else entry['priority']
+            records.append(tuple(text(entry[field]) for field in TEXT_FIELDS) + (priority, entry['records'], 0))
+
+    header = np.zeros(1, dtype=HEADER_DTYPE)
+    header['magic'], header['version'], header['created'] = MAGIC, FORMAT_VERSION, time.time()
+    for kind, keys in zip(KINDS, key_arrays):
+        header[f'{kind}_count'] = len(keys)
+    header['strings_size'] = len(strings)
+    sections, records_offset, _ = _sections(header[0])
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(header.tobytes())
+        for (_, offset, _), keys in zip(sections, key_arrays):
+            f.write(b'\0' * (offset - f.tell()))
+            f.write(keys.tobytes())
+        f.write(b'\0' * (records_offset - f.tell()))
+        f.write(np.array(records, dtype=RECORD_DTYPE).tobytes())
+        f.write(bytes(strings))
+    os.replace(tmp_path, path)
+    return len(records)
+
+
+class LookupArtifact:
+    """Read-only exact-match lookups over a memory-mapped artifact
+
+    Opening maps the file and builds array views over it; pages are read on
+    first use and shared by every process mapping the same file. Results
+    have the fields of VerificationIndex.verify, but only exact matches are
+    answered: parent-domain fallback and lookalike screening need the full
+    in-memory index.
+    """
+
+    def __init__(self, path=ARTIFACT_FILE):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = np.frombuffer(self._map, dtype=HEADER_DTYPE, count=1).copy()[0]
+        if header['magic'] != MAGIC or header['version'] != FORMAT_VERSION:
+            version = int(header['version']) if header['magic'] == MAGIC else None
+            self.close()
+            raise ValueError(f"{self.path} is not a version {FORMAT_VERSION} lookup artifact (found {version})")
+        self.created = float(header['created'])
+        sections, records_offset, self._strings = _sections(header)
+        self.keys = {}
+        self._bases = {}
+        base = 0
+        for kind, offset, count in sections:
+            dtype = '<i8' if kind == 'phone' else '<u8'
+            self.keys[kind] = np.frombuffer(self._map, dtype=dtype, count=count, offset=offset)
+            self._bases[kind] = base
+            base += count
+        self.records = np.frombuffer(self._map, dtype=RECORD_DTYPE, count=base, offset=records_offset)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        # Array views hold the buffer; drop them before closing the map
+        self.keys, self.records = {}, None
+        self._map.close()
+
+    def _text(self, pair):
+        offset, length = int(pair[0]), int(pair[1])
+        if length == 0:
+            return None
+        start = self._strings + offset
+        return self._map[start:start + length].decode('utf-8')
+
+    def _record(self, position):
+        record = self.records[position]
+        result = {field: self._text(record[field]) for field in TEXT_FIELDS}
+        priority = float(record['priority'])
+        result.update(priority=None if np.isnan(priority) else priority, match='exact', imitates=None,
+                      records=int(record['records']))
+        return result
+
+    def _find(self, kind, key):
+        keys = self.keys[kind]
+        target = key if kind == 'phone' else key_hash(key)
+        position = int(np.searchsorted(keys, target))
+        while position < len(keys) and keys[position] == target:
+            record = self._bases[kind] + position
+            if kind == 'phone' or self._text(self.records[record]['key']) == key:
+                return self._record(record)
+            position += 1                   # hash collision
+        return None
+
+    def lookup(self, kind, value):
+        """Verdict record for one value (verdict unknown / invalid when not listed)"""
+        if kind not in KINDS:
+            raise ValueError(f"Unknown contact type '{kind}' (expected one of: {', '.join(KINDS)})")
+        key = QUERY_KEYS[kind](value) if value is not None else None
+        entry = self._find(kind, key) if key is not None else None
+        if entry is None:
+            shown = key_strings([key])[0] if kind == 'phone' and key is not None else key
+            entry = {'key': shown, 'verdict': UNKNOWN if key is not None else INVALID,
+                     'organization': None, 'organization_type': None, 'risk_level': None, 'priority': None,
+                     'category': None, 'match': None, 'imitates': None, 'records': 0}
+        return dict(entry, type=kind, value=value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Look contacts up in the sorter\'s binary lookup artifact')
+    parser.add_argument('kind', choices=KINDS, help='Contact type')
+    parser.add_argument('values', nargs='+', help='Values to look up')
+    parser.add_argument('--artifact', default=ARTIFACT_FILE, help='Lookup artifact written by the sorter')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with LookupArtifact(args.artifact) as artifact:
+        opened_us = (time.perf_counter() - start) * 1e6
+        print(f"Mapped {len(artifact)} keys from {args.artifact} in {opened_us:.0f} µs")
+        for value in args.values:
+            start = time.perf_counter()
+            result = artifact.lookup(args.kind, value)
+            elapsed_us = (time.perf_counter() - start) * 1e6
+            organization = f" - {result['organization']}" if result['organization'] else ''
+            print(f"  {value}: {result['verdict']}{organization} "
+                  f"(risk {result['risk_level']}, priority {result['priority']}) [{elapsed_us:.1f} µs]")
+
+
+if __name__ == "__main__":
+    main()
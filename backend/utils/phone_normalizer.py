@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Phone Normalizer - Shared Australian phone number normalization
+Turns any written form of a number into one canonical E.164-style key and
+classifies it, so every agent matches phone numbers the same way
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+# Phone formats found in page text, in priority order for the same offset
+PHONE_PATTERNS = [
+    ('phone_intl', r'\+61\s*[2-8]\s*\d{4}\s*\d{4}'),     # +61 X XXXX XXXX
+    ('phone_area', r'\(0[2-8]\)\s*\d{4}\s*\d{4}'),       # (0X) XXXX XXXX
+    ('phone_geo', r'0[2-8]\s*\d{4}\s*\d{4}'),            # 0X XXXX XXXX
+    ('phone_1800', r'1800\s*\d{3}\s*\d{3}'),             # 1800 XXX XXX
+    ('phone_1300', r'1300\s*\d{3}\s*\d{3}'),             # 1300 XXX XXX
+    ('phone_13x', r'13\d\s*\d{3}'),                      # 13X XXX
+    ('phone_13', r'13\s*\d{2}\s*\d{2}'),                 # 13 XX XX
+]
+
+PHONE_IN_TEXT = re.compile('|'.join(f'(?:{pattern})' for _, pattern in PHONE_PATTERNS))
+
+# Everything except digits and '+' is formatting
+NON_DIALLED = re.compile(r'[^\d+]')
+
+# Canonical forms of a cleaned (digits and '+') number
+CANONICAL_NUMBER = re.compile(
+    r'^(?:(?:\+61|0061|61(?=[2-478]\d{8}$))0?|0)(?P<nsn>[2-478]\d{8})$'     # geographic / mobile
+    r'|^(?:(?:\+61|0061)0?)?(?P<special>1[38]00\d{6}|13\d{4})$'              # 1800 / 1300 / 13
+    r'|^(?P<emergency>000|112|106)$'                                         # emergency lines
+    r'|^(?:\+|00)(?P<intl>(?!61)[1-9]\d{6,14})$'                             # other countries
+)
+
+AUSTRALIAN_TYPES = {'mobile', '1800', '1300', '13', 'geographic', 'emergency'}
+
+MEMO_SIZE = 65536
+
+# Vectorized normalization limits
+INVALID_KEY = -1
+MAX_KEY_DIGITS = 15          # E.164 maximum
+MAX_VECTOR_CHARS = 48        # longer values use the scalar path
+NSN_LEADING_DIGITS = [2, 3, 4, 7, 8]
+EMERGENCY_NUMBERS = [0, 112, 106]
+
+
+class PhoneNumber(NamedTuple):
+    """Normalized phone number"""
+    key: str            # canonical key, e.g. '+61260584444' ('' when not a phone number)
+    number_type: str    # 13/1300/1800/geographic/mobile/emergency/international/invalid
+    digits: str         # dialled digits without formatting
+
+
+def _key_from_groups(nsn, special, emergency, intl):
+    if nsn:
+        return '+61' + nsn
+    if special:
+        return '+61' + special
+    if emergency:
+        return emergency
+    if intl:
+        return '+' + intl
+    return ''
+
+
+def number_type(key):
+    """Classify a canonical key"""
+    if not key:
+        return 'invalid'
+    if not key.startswith('+'):
+        return 'emergency'
+    if not key.startswith('+61'):
+        return 'international'
+    national = key[3:]
+    if len(national) == 9:
+        return 'mobile' if national.startswith('4') else 'geographic'
+    if len(national) == 10:
+        return national[:4]     # 1800 / 1300
+    return '13'
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _parse(text):
+    cleaned = NON_DIALLED.sub('', text)
+    match = CANONICAL_NUMBER.match(cleaned)
+    key = _key_from_groups(*match.group('nsn', 'special', 'emergency', 'intl')) if match else ''
+    return PhoneNumber(key, number_type(key), cleaned.lstrip('+'))
+
+
+def parse_phone(value):
+    """Normalize and classify a single value (memoized)"""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return PhoneNumber('', 'invalid', '')
+    return _parse(str(value).strip())
+
+
+def normalize_phone(value):
+    """Canonical key for a phone number, '' if it is not a valid number"""
+    return parse_phone(value).key
+
+
+def classify_phone(value):
+    """Number type for a phone number"""
+    return parse_phone(value).number_type
+
+
+def is_australian(value):
+    """True for valid Australian numbers (including 13 numbers and emergency lines)"""
+    return parse_phone(value).number_type in AUSTRALIAN_TYPES
+
+
+def phone_key(value):
+    """Canonical key as a 64-bit integer (E.164 digits), INVALID_KEY if not a number"""
+    key = parse_phone(value).key
+    return int(key.lstrip('+')) if key else INVALID_KEY
+
+
+def _digit_rows(texts):
+    """Fixed-width code point matrix for an array of strings (one row per string)"""
+    width = max(1, min(MAX_VECTOR_CHARS, texts.dtype.itemsize // 4))
+    chars = texts.astype(f'<U{width}')
+    return chars.view(np.uint32).reshape(len(texts), width)
+
+
+def _rest_value(digits, offset, length):
+    """Integer value of digits[offset:offset + length] for every row"""
+    rows = np.arange(len(digits))
+    last = digits.shape[1] - 1
+    value = np.zeros(len(digits), dtype=np.int64)
+    for column in range(MAX_KEY_DIGITS):
+        inside = column < length
+        digit = digits[rows, np.minimum(offset + column, last)]
+        value = np.where(inside, value * 10 + digit, value)
+    return value
+
+
+def _keys_for_strings(texts):
+    """Vectorized CANONICAL_NUMBER over distinct strings, returning integer keys"""
+    texts = np.asarray(texts, dtype=str)
+    count = len(texts)
+    keys = np.full(count, INVALID_KEY, dtype=np.int64)
+    if count == 0:
+        return keys
+
+    codes = _digit_rows(texts)
+    is_digit = (codes >= 48) & (codes <= 57)
+    is_plus = codes == 43
+    kept = is_digit | is_plus
+    rows = np.arange(count)
+
+    # A '+' is only allowed as the first dialled character
+    first_kept = np.argmax(kept, axis=1)
+    plus = is_plus[rows, first_kept] & kept.any(axis=1)
+    plus_ok = is_plus.sum(axis=1) == plus.astype(int)
+
+    # Digits moved to the front of each row, in order
+    length = is_digit.sum(axis=1)
+    position = np.cumsum(is_digit, axis=1) - 1
+    digits = np.zeros((count, max(codes.shape[1], MAX_KEY_DIGITS + 5)), dtype=np.int64)
+    digit_rows, digit_columns = np.nonzero(is_digit)
+    digits[digit_rows, position[digit_rows, digit_columns]] = codes[digit_rows, digit_columns] - 48
+    at = lambda column: digits[rows, column]
+
+    d0, d1, d2, d3 = digits[:, 0], digits[:, 1], digits[:, 2], digits[:, 3]
+    starts_61 = (d0 == 6) & (d1 == 1) & (length >= 2)
+    starts_00 = (d0 == 0) & (d1 == 0) & (length >= 2)
+    starts_0061 = starts_00 & (d2 == 6) & (d3 == 1) & (length >= 4)
+    nsn_lead = lambda digit: np.isin(digit, NSN_LEADING_DIGITS)
+
+    # Prefix before the national number
+    intl_au = (plus & starts_61) | (~plus & starts_0061)
+    offset = np.where(plus, 2, 4) * intl_au
+    offset = offset + (intl_au & (at(offset) == 0))
+    bare_61 = ~plus & ~intl_au & starts_61 & (length == 11) & nsn_lead(d2)
+    trunk_0 = ~plus & ~intl_au & (d0 == 0) & (length == 10) & nsn_lead(d1)
+    offset = offset + 2 * bare_61 + trunk_0
+    rest_length = length - offset
+
+    first, second = at(offset), at(offset + 1)
+    third_fourth = (at(offset + 2) == 0) & (at(offset + 3) == 0)
+    rest = _rest_value(digits, offset, rest_length)
+
+    nsn = (intl_au | bare_61 | trunk_0) & (rest_length == 9) & nsn_lead(first)
+    special = (intl_au | (~plus & ~bare_61 & ~trunk_0 & ~starts_0061)) & (first == 1) & (
+        ((rest_length == 10) & np.isin(second, [3, 8]) & third_fourth) |
+        ((rest_length == 6) & (second == 3))
+    )
+    australian = (nsn | special) & plus_ok
+    keys[australian] = 61 * 10 ** rest_length[australian] + rest[australian]
+
+    emergency = ~plus & (length == 3) & np.isin(rest, EMERGENCY_NUMBERS) & plus_ok & ~australian
+    keys[emergency] = rest[emergency]
+
+    # Other countries: '+' or '00' then a non-Australian country code
+    intl_offset = np.where(plus, 0, 2)
+    intl_length = length - intl_offset
+    intl_first, intl_second = at(intl_offset), at(intl_offset + 1)
+    international = (plus | starts_00) & plus_ok & ~australian & ~emergency & \
+        (intl_first >= 1) & ~((intl_first == 6) & (intl_second == 1)) & \
+        (intl_length >= 7) & (intl_length <= 15)
+    keys[international] = _rest_value(digits, intl_offset, intl_length)[international]
+
+    # Strings wider than the vector width take the scalar path
+    if texts.dtype.itemsize // 4 > MAX_VECTOR_CHARS:
+        for index in np.flatnonzero(np.char.str_len(texts) > MAX_VECTOR_CHARS):
+            keys[index] = phone_key(str(texts[index]))
+    return keys
+
+
+def phone_key_array(values):
+    """Vectorized phone_key for a Series or array of values
+
+    Distinct values are normalized once, so repeated numbers cost a lookup.
+    """
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+    keys = np.append(_keys_for_strings(np.asarray(uniques, dtype=str)), INVALID_KEY)
+    return keys[codes]
+
+
+def key_strings(keys):
+    """Canonical string keys for an array of integer keys"""
+    keys = np.asarray(keys, dtype=np.int64)
+    text = np.char.add('+', keys.astype(str)).astype(object)
+    emergency = (keys >= 0) & (keys < 1000)
+    if emergency.any():
+        text[emergency] = np.char.zfill(keys[emergency].astype(str), 3)
+    text[keys == INVALID_KEY] = ''
+    return text
+
+
+def normalize_phone_series(values):
+    """Vectorized normalize_phone for a Series or array of values"""
+    index = values.index if isinstance(values, pd.Series) else None
+    return pd.Series(key_strings(phone_key_array(values)), index=index, dtype=object)
+
+
+def classify_phone_keys(keys):
+    """Vectorized number types for an array of integer keys"""
+    keys = np.asarray(keys, dtype=np.int64)
+    digits = np.where(keys > 0, np.floor(np.log10(np.maximum(keys, 1))).astype(np.int64) + 1, 1)
+    top = lambda count: keys // 10 ** np.maximum(digits - count, 0)
+    australian = top(2) == 61
+    conditions = [
+        keys == INVALID_KEY,
+        (keys >= 0) & (keys < 1000),
+        australian & (digits == 11) & (top(3) == 614),
+        australian & (digits == 12) & (top(6) == 611800),
+        australian & (digits == 12) & (top(6) == 611300),
+        australian & (digits == 8) & (top(4) == 6113),
+        australian & (digits == 11),
+    ]
+    choices = ['invalid', 'emergency', 'mobile', '1800', '1300', '13', 'geographic']
+    return np.select(conditions, choices, default='international').astype(object)
+
+
+def classify_phone_series(values):
+    """Vectorized classify_phone for a Series or array of values"""
+    index = values.index if isinstance(values, pd.Series) else None
+    return pd.Series(classify_phone_keys(phone_key_array(values)), index=index, dtype=object)
+
+
+def format_phone(value):
+    """Display form of a number in the usual Australian grouping"""
+    parsed = parse_phone(value)
+    key = parsed.key
+    if parsed.number_type in ('1800', '1300'):
+        national = key[3:]
+        return f"{national[:4]} {national[4:7]} {national[7:]}"
+    if parsed.number_type == '13':
+        national = key[3:]
+        return f"{national[:3]} {national[3:]}"
+    if parsed.number_type == 'mobile':
+        national = '0' + key[3:]
+        return f"{national[:4]} {national[4:7]} {national[7:]}"
+    if parsed.number_type == 'geographic':
+        national = '0' + key[3:]
+        return f"{national[:2]} {national[2:6]} {national[6:]}"
+    if parsed.number_type in ('emergency', 'international'):
+        return key
+    return parsed.digits
+
+
+def extract_phone(text):
+    """First phone number written in free text, as written ('' if none)"""
+    if not text:
+        return ''
+    match = PHONE_IN_TEXT.search(str(text))
+    return match.group().strip() if match else ''
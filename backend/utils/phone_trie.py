@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Phone Trie - Digit trie over canonical phone keys for prefix and range queries
+Answers exact, longest-prefix and neighbouring-number queries in time
+proportional to the number's length, so a number next to a listed scam line
+or inside an organization's block can be recognised without an exact match
+"""
+
+from array import array
+
+# Numbers differing only in their last NEIGHBOUR_DIGITS digits share a block
+NEIGHBOUR_DIGITS = 2
+
+NO_CHILD = -1
+
+
+def key_digits(key):
+    """Digit string of an integer phone key (E.164 digits, emergency numbers as 3 digits)"""
+    return f'{key:03d}' if 0 <= key < 1000 else str(key)
+
+
+class PhoneTrie:
+    """Listed phone numbers in a digit trie, each with a payload (e.g. its verdict entry)
+
+    Nodes live in flat arrays: ten child slots per node, the number of listed
+    numbers below each node and the payload of nodes that end a number.
+    """
+
+    def __init__(self):
+        self.children = array('i')
+        self.sizes = array('i')
+        self.values = []
+        self._node()
+
+    @classmethod
+    def from_entries(cls, entries):
+        """Trie over a {integer key: payload} mapping"""
+        trie = cls()
+        for key, value in entries.items():
+            trie.add(key, value)
+        return trie
+
+    def __len__(self):
+        return self.sizes[0]
+
+    def _node(self):
+        self.children.extend([NO_CHILD] * 10)
+        self.sizes.append(0)
+        self.values.append(None)
+        return len(self.values) - 1
+
+    def add(self, key, value):
+        path = [0]
+        for digit in key_digits(key):
+            slot = path[-1] * 10 + int(digit)
+            if self.children[slot] == NO_CHILD:
+                child = self._node()
+                self.children[slot] = child
+            path.append(self.children[slot])
+        if self.values[path[-1]] is None:
+            for node in path:
+                self.sizes[node] += 1
+        self.values[path[-1]] = (key, value)
+
+    def _walk(self, digits):
+        """Nodes along digits from the root, stopping where the trie ends"""
+        path = [0]
+        for digit in digits:
+            child = self.children[path[-1] * 10 + int(digit)]
+            if child == NO_CHILD:
+                break
+            path.append(child)
+        return path
+
+    def exact(self, key):
+        """Payload of a listed number, None when it is not listed"""
+        digits = key_digits(key)
+        path = self._walk(digits)
+        if len(path) != len(digits) + 1 or self.values[path[-1]] is None:
+            return None
+        return self.values[path[-1]][1]
+
+    def longest_prefix(self, key):
+        """Longest prefix of key shared with a listed number, and how many listed numbers share it"""
+        digits = key_digits(key)
+        path = self._walk(digits)
+        return digits[:len(path) - 1], self.sizes[path[-1]]
+
+    def _below(self, node, depth):
+        """Listed (key, payload) pairs exactly depth digits below node"""
+        if depth == 0:
+            return [self.values[node]] if self.values[node] is not None else []
+        found = []
+        for digit in range(10):
+            child = self.children[node * 10 + digit]
+            if child != NO_CHILD:
+                found.extend(self._below(child, depth - 1))
+        return found
+
+    def neighbours(self, key, digits=NEIGHBOUR_DIGITS):
+        """Listed numbers of the same length differing from key only in its last `digits` digits
+
+        Returned as (key, payload) pairs, nearest number first; key itself is left out.
+        """
+        text = key_digits(key)
+        if len(text) <= digits:
+            return []
+        path = self._walk(text[:-digits])
+        if len(path) != len(text) - digits + 1:
+            return []
+        found = [(other, value) for other, value in self._below(path[-1], digits) if other != key]
+        return sorted(found, key=lambda pair: abs(pair[0] - key))
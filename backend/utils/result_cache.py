@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Result Cache - Bounded cache of verification results in front of the index
+Keeps the results of recent queries keyed by the raw (type, value) so repeated
+lookups skip normalization and index probes, with LRU eviction behind a TinyLFU
+admission filter so one-off queries cannot flush the numbers callers keep asking about
+"""
+
+import threading
+from collections import OrderedDict
+
+CACHE_SIZE = 100_000        # results kept
+SKETCH_DEPTH = 4            # hash rows of the frequency sketch
+MIN_SKETCH_WIDTH = 1024     # counters per row, so small caches still tell queries apart
+MAX_COUNT = 15              # sketch counters saturate here (4-bit counters in TinyLFU)
+NEGATIVE_VERDICTS = {'unknown', 'invalid'}
+
+HALVED = bytes(count >> 1 for count in range(256))
+
+
+class FrequencySketch:
+    """Count-min sketch of recent query frequencies with periodic halving (aging)
+
+    After ten increments per counter of a row every counter is halved, so
+    estimates follow the current traffic rather than all traffic ever seen.
+    """
+
+    def __init__(self, capacity):
+        width = 1
+        while width < max(capacity, MIN_SKETCH_WIDTH):
+            width *= 2
+        self.mask = width - 1
+        self.rows = [bytearray(width) for _ in range(SKETCH_DEPTH)]
+        self.sample_size = 10 * width
+        self.additions = 0
+
+    def _slots(self, key):
+        h = hash(key)
+        step = (h >> 32) | 1
+        return [(h + row * step) & self.mask for row in range(SKETCH_DEPTH)]
+
+    def estimate(self, key):
+        return min(row[slot] for row, slot in zip(self.rows, self._slots(key)))
+
+    def add(self, key):
+        for row, slot in zip(self.rows, self._slots(key)):
+            if row[slot] < MAX_COUNT:
+                row[slot] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.additions //= 2
+            self.rows = [row.translate(HALVED) for row in self.rows]
+
+
+class ResultCache:
+    """Verification results for one index, LRU-evicted with TinyLFU admission
+
+    Every query is counted in a frequency sketch. When the cache is full, a
+    new result only replaces the least recently used one if its query has
+    been seen more often, so a scan of one-off numbers leaves the hot
+    entries alone. Unknown and invalid verdicts are cached too (negative
+    caching) unless `negative` is False. Results belong to the index they
+    were computed from: `invalidate` drops them when a new index is
+    swapped in, and queries answered from any other index bypass the cache.
+    Safe to share between threads.
+    """
+
+    def __init__(self, index, capacity=CACHE_SIZE, negative=True):
+        self.index = index
+        self.capacity = capacity
+        self.negative = negative
+        self.entries = OrderedDict()
+        self.sketch = FrequencySketch(capacity)
+        self.lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.rejections = self.invalidations = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def verify(self, index, kind, value):
+        """index.verify(kind, value), from the cache when possible"""
+        if index is not self.index:
+            return index.verify(kind, value)
+        key = (kind, value)
+        with self.lock:
+            self.sketch.add(key)
+            result = self.entries.get(key)
+            if result is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return result
+            self.misses += 1
+        result = index.verify(kind, value)
+        if self.negative or result['verdict'] not in NEGATIVE_VERDICTS:
+            self._admit(index, key, result)
+        return result
+
+    def _admit(self, index, key, result):
+        with self.lock:
+            if index is not self.index or key in self.entries:
+                return
+            if len(self.entries) >= self.capacity:
+                victim = next(iter(self.entries))
+                if self.sketch.estimate(key) <= self.sketch.estimate(victim):
+                    self.rejections += 1
+                    return
+                del self.entries[victim]
+                self.evictions += 1
+            self.entries[key] = result
+
+    def invalidate(self, index):
+        """Drop every result and cache results of `index` from now on"""
+        with self.lock:
+            self.index = index
+            self.entries.clear()
+            self.invalidations += 1
+
+    def metrics(self):
+        lookups = self.hits + self.misses
+        return {'size': len(self.entries), 'capacity': self.capacity, 'hits': self.hits, 'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else None, 'evictions': self.evictions,
+                'rejections': self.rejections, 'invalidations': self.invalidations}
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Sampling - Stratified samples and design-based estimates
+Draws a stratified random sample of records and estimates rates over the full
+dataset from it, with confidence intervals from the stratified variance
+"""
+
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+
+def z_score(confidence_level):
+    """Two-sided normal quantile for a confidence level, e.g. 0.95 -> 1.96"""
+    if not 0 < confidence_level < 1:
+        raise ValueError(f"Confidence level must be between 0 and 1, got {confidence_level}")
+    return NormalDist().inv_cdf(0.5 + confidence_level / 2)
+
+
+def stratified_sample(df, strata, sample_size, min_per_stratum=30, seed=None):
+    """Proportionally allocated stratified random sample
+
+    Every stratum gets its share of sample_size and at least min_per_stratum
+    records (or all of them when it is smaller). Returns the sample and a
+    design frame aligned with it (stratum code, stratum size, stratum sample
+    size and sampling weight).
+    """
+    codes = df.groupby(strata, sort=False, dropna=False).ngroup().to_numpy()
+    sizes = np.bincount(codes)
+    allocation = np.maximum(np.round(sample_size * sizes / max(len(df), 1)), min_per_stratum)
+    allocation = np.minimum(allocation, sizes).astype(np.int64)
+
+    # Rank records within their stratum in random order and keep the first n_h
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(len(df))
+    rank = pd.Series(codes[order]).groupby(codes[order]).cumcount().to_numpy()
+    chosen = np.sort(order[rank < allocation[codes[order]]])
+
+    sample = df.iloc[chosen]
+    stratum = codes[chosen]
+    design = pd.DataFrame({
+        'stratum': stratum,
+        'stratum_size': sizes[stratum],
+        'stratum_sample': allocation[stratum],
+        'weight': sizes[stratum] / allocation[stratum]
+    }, index=sample.index)
+    return sample, design
+
+
+class StratifiedEstimator:
+    """Estimates of population totals and ratios from a stratified sample"""
+
+    def __init__(self, design, confidence_level=0.95):
+        self.design = design
+        self.weights = design['weight'].to_numpy()
+        self.z = z_score(confidence_level)
+        strata = design.drop_duplicates('stratum').set_index('stratum')
+        self.stratum_size = strata['stratum_size']
+        self.stratum_sample = strata['stratum_sample']
+
+    def total(self, values):
+        """Estimated population total of a per-record variable"""
+        return float(np.dot(self.weights, np.asarray(values, dtype=float)))
+
+    def variance_of_total(self, values):
+        """Stratified variance of the estimated total (with finite population correction)"""
+        values = pd.Series(np.asarray(values, dtype=float), index=self.design.index)
+        within = values.groupby(self.design['stratum'].to_numpy()).var(ddof=1).fillna(0)
+        n, size = self.stratum_sample[within.index], self.stratum_size[within.index]
+        return float((size ** 2 * (1 - n / size) * within / n).sum())
+
+    def ratio(self, numerator, denominator=None):
+        """Ratio estimate sum(numerator) / sum(denominator) and its linearized variable
+
+        The linearized variable's total has the same variance as the ratio,
+        so linear combinations of ratios get their variance from it as well.
+        """
+        numerator = np.asarray(numerator, dtype=float)
+        denominator = np.ones(len(numerator)) if denominator is None else np.asarray(denominator, dtype=float)
+        denominator_total = self.total(denominator)
+        if denominator_total == 0:
+            return None, None
+        estimate = self.total(numerator) / denominator_total
+        return estimate, (numerator - estimate * denominator) / denominator_total
+
+    def ratio_interval(self, numerator, denominator=None):
+        """Wilson interval for a rate, using the design effect of the stratified sample
+
+        The effective sample size is the one a simple random sample would need
+        for the same variance; with no observed variance (e.g. no failures in
+        the sample) the sampled count is used, so rare errors still widen the interval.
+        """
+        estimate, linearized = self.ratio(numerator, denominator)
+        if estimate is None:
+            return None
+        sampled = len(linearized) if denominator is None else int((np.asarray(denominator) > 0).sum())
+        variance = self.variance_of_total(linearized)
+        effective = estimate * (1 - estimate) / variance if variance > 0 else sampled
+        z2 = self.z ** 2 / effective
+        center = (estimate + z2 / 2) / (1 + z2)
+        margin = self.z / (1 + z2) * np.sqrt(estimate * (1 - estimate) / effective + z2 / (4 * effective))
+        return {
+            'estimate': float(estimate),
+            'ci_low': float(max(0.0, center - margin)),
+            'ci_high': float(min(1.0, center + margin)),
+            'effective_sample_size': float(effective)
+        }
+
+    def interval(self, estimate, linearized):
+        """Normal confidence interval for a linear combination of estimates, clipped to [0, 1]"""
+        margin = self.z * np.sqrt(self.variance_of_total(linearized))
+        return {
+            'estimate': float(estimate),
+            'ci_low': float(max(0.0, estimate - margin)),
+            'ci_high': float(min(1.0, estimate + margin)),
+            'margin': float(margin)
+        }
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Standardized Store - Per-source partitions of the standardized dataset
+Keeps each source's standardized contacts in its own CSV tagged with the
+fingerprint of its raw input, and materializes the merged view on demand
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+STORE_DIR = 'data/standardized'
+MERGED_FILE = 'data/standardized_contacts.csv'
+MANIFEST_FILE = 'manifest.json'
+
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def fingerprint_inputs(inputs, version=''):
+    """Content fingerprint of a partition's raw input files ('missing' files included)
+
+    version identifies the code that turns the inputs into the partition, so
+    partitions built by other code never look up to date.
+    """
+    digest = hashlib.sha1(version.encode('utf-8'))
+    for filename in inputs:
+        digest.update(filename.encode('utf-8'))
+        path = Path(filename)
+        if not path.exists():
+            digest.update(b'\0missing')
+            continue
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+class StandardizedStore:
+    """Partitioned standardized dataset with a manifest of raw input fingerprints
+
+    partitions is the ordered list of (name, [raw input files]); the merged view
+    concatenates partitions in this order. version is mixed into every
+    partition fingerprint (see fingerprint_inputs).
+    """
+
+    def __init__(self, partitions=(), store_dir=STORE_DIR, merged_file=MERGED_FILE, version=''):
+        self.partitions = list(partitions)
+        self.version = version
+        self.store_dir = Path(store_dir)
+        self.merged_file = Path(merged_file)
+        self.manifest_path = self.store_dir / MANIFEST_FILE
+        self.manifest = self.load_manifest()
+
+    def load_manifest(self):
+        """Read the manifest, or start an empty one"""
+        if self.manifest_path.exists():
+            with open(self.manifest_path, 'r') as f:
+                return json.load(f)
+        return {'partitions': {}, 'order': [], 'merged_fingerprint': None}
+
+    def save_manifest(self):
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.manifest_path, 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+
+    def partition_path(self, name):
+        return self.store_dir / f"{name}.csv"
+
+    def stale_partitions(self, force=False):
+        """Names of partitions whose raw input or building code changed since they were built"""
+        stale = []
+        for name, inputs in self.partitions:
+            entry = self.manifest['partitions'].get(name)
+            if (force or entry is None or not self.partition_path(name).exists()
+                    or entry['fingerprint'] != fingerprint_inputs(inputs, self.version)):
+                stale.append(name)
+        return stale
+
+    def write_partition(self, name, df):
+        """Save a rebuilt partition and record its input fingerprint"""
+        inputs = dict(self.partitions)[name]
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        df.to_csv(self.partition_path(name), index=False)
+        self.manifest['partitions'][name] = {
+            'file': self.partition_path(name).name,
+            'inputs': inputs,
+            'fingerprint': fingerprint_inputs(inputs, self.version),
+            'records': len(df),
+            'built_at': datetime.now().isoformat()
+        }
+        self.manifest['order'] = [partition for partition, _ in self.partitions]
+        self.save_manifest()
+
+    def _merged_fingerprint(self):
+        """Fingerprint of the partition set the merged view is built from"""
+        entries = self.manifest['partitions']
+        parts = [f"{name}:{entries[name]['fingerprint']}:{entries[name]['built_at']}"
+                 for name in self.manifest['order'] if name in entries]
+        return hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+
+    def merged_view(self):
+        """Path of the merged CSV, rebuilt only when a partition changed
+
+        Partitions share one header, so merging is a byte-level concatenation
+        and the merged file reads exactly like a single standardized CSV.
+        """
+        fingerprint = self._merged_fingerprint()
+        if self.merged_file.exists() and self.manifest.get('merged_fingerprint') == fingerprint:
+            return self.merged_file
+
+        partition_files = [self.partition_path(name) for name in self.manifest['order']
+                           if self.partition_path(name).exists()]
+        if not partition_files:
+            return self.merged_file
+
+        tmp_path = self.merged_file.with_suffix('.csv.tmp')
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as merged:
+            for index, path in enumerate(partition_files):
+                with open(path, 'r', encoding='utf-8', newline='') as partition:
+                    header = partition.readline()
+                    if index == 0:
+                        merged.write(header)
+                    for chunk in iter(lambda: partition.read(HASH_CHUNK_SIZE), ''):
+                        merged.write(chunk)
+        os.replace(tmp_path, self.merged_file)
+
+        self.manifest['merged_fingerprint'] = fingerprint
+        self.save_manifest()
+        return self.merged_file
+
+
+def load_standardized_contacts(merged_file=MERGED_FILE, store_dir=STORE_DIR):
+    """Load the merged standardized dataset, refreshing it from partitions if needed
+
+    Falls back to a plain standardized CSV when no partition store exists.
+    Returns None when neither is available.
+    """
+    store = StandardizedStore(store_dir=store_dir, merged_file=merged_file)
+    path = store.merged_view() if store.manifest_path.exists() else Path(merged_file)
+    if not path.exists():
+        return None
+    return pd.read_csv(path)
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Verification Index - In-memory lookup of contacts by normalized phone, email or website
+Loads the sorted contacts master and the threat contacts into hash maps keyed
+the same way as the cross-reference indexes, so a query is answered with its
+verdict, organization, risk level and priority in a few microseconds
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Allow running from backend/utils or as part of the backend package path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.contact_index import EMAIL_KEY, HOST_NAME, registrable_domain, website_host
+from utils.lookalike_index import LookalikeIndex
+from utils.phone_normalizer import INVALID_KEY, key_strings, phone_key, phone_key_array
+from utils.phone_trie import NEIGHBOUR_DIGITS, PhoneTrie
+
+MASTER_FILE = 'data/sorted_contacts_master.csv'
+THREAT_FILE = 'data/threats/threat_contacts.csv'
+
+KINDS = ('phone', 'email', 'website')
+
+# Verdict for each sorter risk level; records sharing a key resolve to the
+# most severe one, then to the highest priority (lowest score)
+VERDICTS = {'threat': 'threat', 'suspicious': 'suspicious', 'safe': 'legitimate'}
+SEVERITY = {'threat': 0, 'suspicious': 1, 'safe': 2}
+UNKNOWN = 'unknown'         # well-formed value that is not in the index
+INVALID = 'invalid'         # not a phone number / email address / host name
+
+EMAIL_ADDRESS = re.compile(EMAIL_KEY)
+
+# Columns of the sorted master the index is built from
+CONTACT_COLUMNS = ['contact_id', 'contact_type', 'contact_value', 'organization_name', 'organization_type',
+                   'confidence_score', 'risk_level', 'priority_score', 'category']
+
+RECORD_FIELDS = ['verdict', 'organization', 'organization_type', 'risk_level', 'priority', 'category']
+RESULT_FIELDS = ['key'] + RECORD_FIELDS + ['match', 'imitates', 'records']
+
+# Unlisted websites and email domains imitating a legitimate domain, and
+# unlisted numbers in the same block as a threat number
+LOOKALIKE_VERDICT = 'suspicious'
+NEIGHBOUR_VERDICT = 'suspicious'
+
+
+def phone_query_key(value):
+    """Canonical integer key of a phone number, None when it is not one"""
+    key = phone_key(value)
+    return None if key == INVALID_KEY else key
+
+
+def email_query_key(value):
+    """Trimmed, lower-cased email address, None when it is not one"""
+    email = str(value).strip().lower().removeprefix('mailto:')
+    return email if EMAIL_ADDRESS.match(email) else None
+
+
+def website_query_key(value):
+    """Host name of a URL or host without 'www.', None when there is none"""
+    host = website_host(str(value))
+    if host.startswith('www.'):
+        host = host[4:]
+    return host if HOST_NAME.fullmatch(host) else None
+
+
+QUERY_KEYS = {'phone': phone_query_key, 'email': email_query_key, 'website': website_query_key}
+
+
+def parent_hosts(host):
+    """Parent domains of a host down to its registrable domain, nearest first
+
+    'a.aci.health.nsw.gov.au' -> 'aci.health.nsw.gov.au', 'health.nsw.gov.au', 'nsw.gov.au'
+    """
+    shortest = len(registrable_domain(host)) or len(host)
+    dot = host.find('.')
+    while dot >= 0 and len(host) - dot - 1 >= shortest:
+        yield host[dot + 1:]
+        dot = host.find('.', dot + 1)
+
+
+def contact_keys(df):
+    """Normalized key of every record (None where the value does not normalize)"""
+    keys = pd.Series(None, index=df.index, dtype=object)
+    values = df['contact_value']
+    phones = (df['contact_type'] == 'phone').to_numpy()
+    if phones.any():
+        phone_keys = phone_key_array(values[phones])
+        keys[phones] = np.where(phone_keys == INVALID_KEY, None, phone_keys.astype(object))
+    for kind in ('email', 'website'):
+        selected = (df['contact_type'] == kind).to_numpy()
+        if selected.any():
+            distinct = values[selected].dropna().astype(str).unique()
+            keys[selected] = values[selected].map(dict(zip(distinct, map(QUERY_KEYS[kind], distinct))))
+    return keys
+
+
+class VerificationIndex:
+    """Contacts by kind and normalized key, each key resolved to one verdict record
+
+    Phones are keyed by their canonical E.164 digits, emails by the trimmed
+    lower-cased address and websites by host name. Websites and email domains
+    not listed themselves fall back to the nearest listed parent domain
+    (a subdomain of an organization's site belongs to that organization),
+    except umbrella domains such as 'nsw.gov.au' whose subdomains belong to
+    several organizations. Websites and email domains that still do not
+    match are screened against the legitimate domains for lookalikes, and
+    unlisted numbers differing from a threat number only in the last
+    NEIGHBOUR_DIGITS digits are suspicious (phone_trie answers the
+    prefix and block queries).
+    """
+
+    def __init__(self, df=None):
+        self.entries = {kind: {} for kind in KINDS}
+        self.shared_domains = set()
+        self.lookalikes = LookalikeIndex()
+        self.phone_trie = PhoneTrie()
+        self.phone_keys = np.array([], dtype=np.int64)     # for vectorized batch screening
+        self.threat_blocks = np.array([], dtype=np.int64)
+        self.contacts = 0
+        if df is not None:
+            self._index(df)
+
+    @classmethod
+    def from_files(cls, master_file=MASTER_FILE, threat_file=THREAT_FILE):
+        """Index the sorted master and threat contacts (records in both count once)"""
+        files = [master_file] + ([threat_file] if threat_file and os.path.exists(threat_file) else [])
+        frames = []
+        for path in files:
+            frame = pd.read_csv(path, dtype={'contact_value': str})
+            missing = [column for column in CONTACT_COLUMNS if column not in frame.columns]
+            if missing:
+                raise ValueError(f"{path} is not a sorted contacts file (missing {', '.join(missing)})")
+            frames.append(frame)
+        df = pd.concat(frames, ignore_index=True).drop_duplicates('contact_id', keep='last')
+        return cls(df)
+
+    def __len__(self):
+        return sum(map(len, self.entries.values()))
+
+    def _index(self, df):
+        """Resolve sorted contact records (columns as in the sorted master) to one entry per key"""
+        df = df[df['contact_type'].isin(KINDS)]
+        risk = df['risk_level'].astype(str).str.lower()
+        records = pd.DataFrame({
+            'kind': df['contact_type'],
+            'key': contact_keys(df),
+            'severity': risk.map(SEVERITY).fillna(len(SEVERITY)),
+            'priority': pd.to_numeric(df['priority_score'], errors='coerce'),
+            'confidence': pd.to_numeric(df['confidence_score'], errors='coerce'),
+            'verdict': risk.map(VERDICTS).fillna(UNKNOWN),
+            'organization': df['organization_name'],
+            'organization_type': df['organization_type'],
+            'risk_level': df['risk_level'],
+            'category': df['category']
+        }).dropna(subset=['key'])
+        self.contacts = len(records)
+        records['records'] = records.groupby(['kind', 'key'])['kind'].transform('size')
+        records = records.sort_values(['severity', 'priority', 'confidence'], ascending=[True, True, False],
+                                      na_position='last', kind='stable')
+        records = records.drop_duplicates(['kind', 'key'])
+
+        websites = records[records['kind'] == 'website']
+        owners = websites.groupby(websites['key'].map(registrable_domain))['organization'].nunique()
+        self.shared_domains = set(owners.index[owners > 1])
+        self.lookalikes = LookalikeIndex.from_contacts(df)
+
+        for kind, group in records.groupby('kind'):
+            keys = group['key'].to_numpy()
+            display = key_strings(keys.astype(np.int64)) if kind == 'phone' else keys
+            columns = [group[field].astype(object).where(group[field].notna(), None) for field in RECORD_FIELDS]
+            priorities = [None if priority is None else round(float(priority), 2) for priority in columns[4]]
+            entries = self.entries[kind]
+            for key, shown, verdict, organization, org_type, risk_level, priority, category, count in zip(
+                    keys, display, columns[0], columns[1], columns[2], columns[3], priorities, columns[5],
+                    group['records']):
+                entries[key] = {
+                    'key': shown, 'verdict': verdict, 'organization': organization,
+                    'organization_type': org_type, 'risk_level': risk_level, 'priority': priority,
+                    'category': category, 'match': 'exact', 'imitates': None, 'records': int(count)
+                }
+        self.phone_trie = PhoneTrie.from_entries(self.entries['phone'])
+        self.phone_keys = np.fromiter(self.entries['phone'], dtype=np.int64, count=len(self.entries['phone']))
+        threats = [key for key, entry in self.entries['phone'].items() if entry['verdict'] == 'threat']
+        self.threat_blocks = np.unique(np.array(threats, dtype=np.int64) // 10 ** NEIGHBOUR_DIGITS)
+
+    def _neighbour(self, key):
+        """Suspicious record for an unlisted number in the same block as a threat number"""
+        if not any(entry['verdict'] == 'threat' for _, entry in self.phone_trie.neighbours(key)):
+            return None
+        return {'key': key_strings([key])[0], 'verdict': NEIGHBOUR_VERDICT, 'organization': None,
+                'organization_type': None, 'risk_level': NEIGHBOUR_VERDICT, 'priority': None, 'category': None,
+                'match': 'neighbour', 'imitates': None, 'records': 0}
+
+    def _lookup(self, kind, key):
+        entry = self.entries[kind].get(key)
+        if entry is not None:
+            return entry
+        if kind == 'phone':
+            return self._neighbour(key)
+        host = key.rpartition('@')[2] if kind == 'email' else key
+        for parent in ([host] if kind == 'email' else []) + list(parent_hosts(host)):
+            if parent in self.shared_domains:
+                break
+            entry = self.entries['website'].get(parent)
+            if entry is not None:
+                return dict(entry, match='domain')
+        matches = self.lookalikes.lookup(host)
+        if matches:
+            return {'key': host, 'verdict': LOOKALIKE_VERDICT, 'organization': None, 'organization_type': None,
+                    'risk_level': LOOKALIKE_VERDICT, 'priority': None, 'category': None, 'match': 'lookalike',
+                    'imitates': matches[0]['domain'], 'records': 0}
+        return None
+
+    def _entry(self, kind, key):
+        """Verdict record for a normalized key (None for a value that did not normalize)"""
+        entry = self._lookup(kind, key) if key is not None else None
+        if entry is not None:
+            return entry
+        shown = key_strings([key])[0] if kind == 'phone' and key is not None else key
+        return {'key': shown, 'verdict': UNKNOWN if key is not None else INVALID, 'organization': None,
+                'organization_type': None, 'risk_level': None, 'priority': None, 'category': None,
+                'match': None, 'imitates': None, 'records': 0}
+
+    def _check_kind(self, kind):
+        if kind not in self.entries:
+            raise ValueError(f"Unknown contact type '{kind}' (expected one of: {', '.join(KINDS)})")
+
+    def verify(self, kind, value):
+        """Verdict record for one phone number, email address or website
+
+        Returns a dict with type, value, key, verdict (threat / suspicious /
+        legitimate / unknown / invalid), organization, organization_type,
+        risk_level, priority, category, match (exact / domain / lookalike /
+        neighbour), the legitimate domain a lookalike imitates and the number
+        of records sharing the key.
+        """
+        self._check_kind(kind)
+        key = QUERY_KEYS[kind](value) if value is not None else None
+        return dict(self._entry(kind, key), type=kind, value=value)
+
+    def verify_batch(self, kind, values):
+        """Verdict records for many values of one type, as a DataFrame
+
+        Columns are RESULT_FIELDS, one row per value (aligned with a Series'
+        index). Phone numbers are normalized and screened against the indexed
+        keys vectorized, and every distinct value is looked up once, so
+        repeated numbers in a call log cost a row copy.
+        """
+        self._check_kind(kind)
+        index = values.index if isinstance(values, pd.Series) else None
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+        uniques = pd.Series(uniques, dtype=object).astype(str)
+        if kind == 'phone':
+            phone_keys = phone_key_array(uniques)
+            valid = phone_keys != INVALID_KEY
+            keys = np.where(valid, phone_keys.astype(object), None)
+            shown = np.where(valid, key_strings(phone_keys), None)
+            candidates = np.flatnonzero(np.isin(phone_keys, self.phone_keys) |
+                                        np.isin(phone_keys // 10 ** NEIGHBOUR_DIGITS, self.threat_blocks))
+        else:
+            keys = np.array([QUERY_KEYS[kind](value) for value in uniques], dtype=object)
+            valid = np.array([key is not None for key in keys], dtype=bool)
+            shown = keys
+            candidates = np.flatnonzero(valid)
+
+        # One row per distinct value plus a last row for missing values
+        columns = {field: np.full(len(uniques) + 1, None, dtype=object) for field in RESULT_FIELDS}
+        columns['key'][:-1] = shown
+        columns['verdict'][:] = INVALID
+        columns['verdict'][:-1][valid] = UNKNOWN
+        columns['records'][:] = 0
+        found = [(position, self._lookup(kind, keys[position])) for position in candidates]
+        found = [(position, entry) for position, entry in found if entry is not None]
+        if found:
+            positions = [position for position, _ in found]
+            for field in RESULT_FIELDS:
+                columns[field][positions] = [entry[field] for _, entry in found]
+        codes = np.where(codes < 0, len(uniques), codes)
+        table = pd.DataFrame({field: column[codes] for field, column in columns.items()}, dtype=object)
+        return table.set_axis(index) if index is not None else table
+
+    def stats(self):
+        return {'contacts': self.contacts, 'keys': {kind: len(entries) for kind, entries in self.entries.items()}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Verify phone numbers, email addresses and websites')
+    parser.add_argument('kind', choices=KINDS, help='Contact type')
+    parser.add_argument('values', nargs='+', help='Values to verify')
+    parser.add_argument('--master', default=MASTER_FILE, help='Sorted contacts master CSV')
+    parser.add_argument('--threats', default=THREAT_FILE, help='Threat contacts CSV')
+    args = parser.parse_args()
+
+    index = VerificationIndex.from_files(args.master, args.threats)
+    print(f"Indexed {index.contacts} contacts ({len(index)} distinct keys)")
+    for value in args.values:
+        start = time.perf_counter()
+        result = index.verify(args.kind, value)
+        elapsed_us = (time.perf_counter() - start) * 1e6
+        organization = f" - {result['organization']}" if result['organization'] else ''
+        if result['imitates']:
+            organization = f" - imitates {result['imitates']}"
+        print(f"  {value}: {result['verdict']}{organization} "
+              f"(risk {result['risk_level']}, priority {result['priority']}) [{elapsed_us:.1f} µs]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Verification Server - Local HTTP/JSON API over the verification index
+Answers phone, email and website verification queries from memory so call
+centre tools can check a contact live while the caller is on the line
+
+    GET  /verify/phone?value=1800%20595%20160
+    POST /verify          {"type": "email", "value": "info@example.org.au"}
+    POST /verify          {"queries": [{"type": "website", "value": "..."}, ...]}
+    GET  /health
+"""
+
+import argparse
+import json
+import os
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Allow running from backend/utils or as part of the backend package path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.index_reloader import RELOAD_INTERVAL, IndexReloader
+from utils.result_cache import CACHE_SIZE, ResultCache
+from utils.verification_index import KINDS, MASTER_FILE, THREAT_FILE, VerificationIndex
+
+HOST = '127.0.0.1'
+PORT = 8765
+MAX_BODY = 1 << 20          # bytes accepted in a POST body
+MAX_QUERIES = 10000         # queries accepted in one batch
+
+
+class VerificationError(Exception):
+    """Malformed request, reported to the client with its HTTP status"""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+class VerificationHandler(BaseHTTPRequestHandler):
+    """JSON endpoints over the server's index, on persistent HTTP/1.1 connections"""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'ContactVerification/1.0'
+    # Headers and body leave in one segment (flushed after each request);
+    # two small writes would wait on the client's delayed ACK
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._respond(self._get)
+
+    def do_POST(self):
+        self._respond(self._post)
+
+    def _get(self):
+        url = urlsplit(self.path)
+        if url.path == '/health':
+            return dict(status='ok', **self.index.stats(), **self.server.metrics())
+        parts = url.path.strip('/').split('/')
+        if len(parts) != 2 or parts[0] != 'verify':
+            raise VerificationError(f"Unknown endpoint '{url.path}'", 404)
+        values = parse_qs(url.query).get('value')
+        if not values:
+            raise VerificationError("Missing 'value' query parameter")
+        return self._verify(parts[1], values[0])
+
+    def _post(self):
+        if urlsplit(self.path).path.rstrip('/') != '/verify':
+            raise VerificationError(f"Unknown endpoint '{self.path}'", 404)
+        length = self.headers.get('Content-Length') or '0'
+        if not length.isdigit():
+            raise VerificationError("Invalid Content-Length")
+        length = int(length)
+        if length > MAX_BODY:
+            raise VerificationError(f"Request body over {MAX_BODY} bytes", 413)
+        try:
+            body = json.loads(self.rfile.read(length) or b'null')
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise VerificationError(f"Invalid JSON: {e}")
+        if isinstance(body, dict) and 'queries' in body:
+            queries = body['queries']
+            if not isinstance(queries, list) or len(queries) > MAX_QUERIES:
+                raise VerificationError(f"'queries' must be a list of at most {MAX_QUERIES} queries")
+            return {'results': [self._query(query) for query in queries]}
+        return self._query(body)
+
+    def _query(self, query):
+        if not isinstance(query, dict) or 'type' not in query or 'value' not in query:
+            raise VerificationError("Each query needs a 'type' and a 'value'")
+        return self._verify(query['type'], query['value'])
+
+    def _verify(self, kind, value):
+        if kind not in KINDS:
+            raise VerificationError(f"Unknown contact type '{kind}' (expected one of: {', '.join(KINDS)})", 404)
+        if not isinstance(value, str):
+            raise VerificationError("'value' must be a string")
+        return self.server.verify(self.index, kind, value)
+
+    def _respond(self, route):
+        # The whole request is answered from the index current when it arrived
+        self.index = self.server.index
+        try:
+            status, payload = 200, route()
+        except VerificationError as e:
+            # An unread request body would be parsed as the next request
+            status, payload = e.status, {'error': str(e)}
+            self.close_connection = True
+        body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.access_log:
+            super().log_message(format, *args)
+
+
+class VerificationServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding one verification index for all connections
+
+    With a reloader, `index` is replaced whenever the reloader swaps in a
+    rebuilt index; requests already running finish on the one they started with.
+    With a result cache, repeated queries are answered from it and the cache
+    is invalidated on every swap.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, index, access_log=False, reloader=None, cache=None):
+        super().__init__(address, VerificationHandler)
+        self.index = index
+        self.access_log = access_log
+        self.reloader = reloader
+        self.cache = cache
+        if reloader is not None:
+            reloader.on_swap = self.swap_index
+
+    def verify(self, index, kind, value):
+        if self.cache is None:
+            return index.verify(kind, value)
+        return self.cache.verify(index, kind, value)
+
+    def swap_index(self, index):
+        if self.cache is not None:
+            self.cache.invalidate(index)
+        self.index = index
+
+    def metrics(self):
+        metrics = self.reloader.metrics() if self.reloader is not None else {}
+        if self.cache is not None:
+            metrics['cache'] = self.cache.metrics()
+        return metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve contact verification over HTTP/JSON')
+    parser.add_argument('--host', default=HOST, help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=PORT, help='Port to listen on')
+    parser.add_argument('--master', default=MASTER_FILE, help='Sorted contacts master CSV')
+    parser.add_argument('--threats', default=THREAT_FILE, help='Threat contacts CSV')
+    parser.add_argument('--access-log', action='store_true', help='Log every request to stderr')
+    parser.add_argument('--reload-interval', type=float, default=RELOAD_INTERVAL,
+                        help='Seconds between checks for new pipeline outputs (0 disables reloading)')
+    parser.add_argument('--cache-size', type=int, default=CACHE_SIZE,
+                        help='Verification results kept for repeated queries (0 disables the cache)')
+    args = parser.parse_args()
+
+    load = lambda: VerificationIndex.from_files(args.master, args.threats)
+    reloader = IndexReloader([args.master, args.threats], load, interval=args.reload_interval)
+    reloader.reload()
+    stats = reloader.index.stats()
+    print(f"Indexed {stats['contacts']} contacts in {reloader.reload_seconds:.2f} s: "
+          + ', '.join(f"{count} {kind} keys" for kind, count in stats['keys'].items()))
+
+    cache = ResultCache(reloader.index, args.cache_size) if args.cache_size > 0 else None
+    server = VerificationServer((args.host, args.port), reloader.index, args.access_log, reloader, cache)
+    if args.reload_interval > 0:
+        reloader.start()
+        print(f"🔄 Reloading when {args.master} or {args.threats} change (checked every {args.reload_interval:g} s)")
+    print(f"🔎 Verification API on http://{args.host}:{args.port}/verify/<phone|email|website>?value=...")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down")
+    finally:
+        reloader.stop()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Website Checker - Concurrent website liveness and redirect verification
+Checks every URL with HEAD/GET requests under a concurrency limit and a time
+budget, recording status, final redirect target, TLS validity and latency,
+and keeps results in a TTL cache so each URL is re-checked at most once per interval
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+
+CACHE_FILE = 'data/reports/website_liveness_cache.json'
+CACHE_TTL = 24 * 3600          # seconds before a URL is checked again
+CONCURRENCY = 32               # requests in flight
+REQUEST_TIMEOUT = 10           # seconds per connect/read
+TIME_BUDGET = 120              # seconds for the whole stage
+MAX_REDIRECTS = 10
+
+HEADERS = {'User-Agent': 'Mozilla/5.0 (compatible; GovHack2025-CriticAgent/1.0)'}
+
+# Servers that refuse HEAD answer one of these; the check falls back to GET
+HEAD_UNSUPPORTED = {400, 403, 405, 501}
+
+_local = threading.local()
+
+
+def _session():
+    """One pooled session per worker thread"""
+    if not hasattr(_local, 'session'):
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        session.max_redirects = MAX_REDIRECTS
+        _local.session = session
+    return _local.session
+
+
+def site_host(url):
+    """Host of a URL without 'www.' (for comparing redirect targets)"""
+    host = (urlsplit(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def _time_left(timeout, deadline):
+    """Timeout for the next request: the per-request one, capped by the time left before deadline"""
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise requests.exceptions.Timeout("Time budget exhausted")
+    return min(timeout, remaining)
+
+
+def _request(url, timeout, deadline=None, verify=True):
+    session = _session()
+    try:
+        response = session.head(url, allow_redirects=True, timeout=_time_left(timeout, deadline), verify=verify)
+        if response.status_code not in HEAD_UNSUPPORTED:
+            return response
+    except (requests.exceptions.SSLError, requests.exceptions.Timeout):
+        raise                       # GET would fail the same way
+    except requests.exceptions.RequestException:
+        pass                        # e.g. connection reset by a server that rejects HEAD
+    response = session.get(url, allow_redirects=True, timeout=_time_left(timeout, deadline), verify=verify,
+                           stream=True)
+    response.close()
+    return response
+
+
+def check_url(url, timeout=REQUEST_TIMEOUT, deadline=None):
+    """Check one URL (blocking): status, final URL, TLS validity and latency
+
+    tls_valid is None when the final page is plain HTTP. A certificate error
+    is recorded and the URL re-checked without verification to get its status.
+    With a deadline (a time.monotonic() value) every request, including the
+    GET and unverified fallbacks, gets only the time left; a check that fails
+    once the deadline has passed returns None, as it may have been cut short.
+    """
+    result = {
+        'url': url, 'status': None, 'final_url': None, 'redirected': False, 'redirect_offsite': False,
+        'tls_valid': None, 'latency_ms': None, 'alive': False, 'error': None, 'checked_at': time.time()
+    }
+    started = time.perf_counter()
+    try:
+        try:
+            response = _request(url, timeout, deadline)
+            tls_valid = True
+        except requests.exceptions.SSLError as e:
+            result['error'] = f"TLS: {e.__class__.__name__}"
+            response = _request(url, timeout, deadline, verify=False)
+            tls_valid = False
+    except requests.exceptions.RequestException as e:
+        if deadline is not None and time.monotonic() >= deadline:
+            return None
+        result['error'] = result['error'] or e.__class__.__name__
+        result['latency_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+    result['latency_ms'] = round((time.perf_counter() - started) * 1000, 1)
+    result['status'] = response.status_code
+    result['final_url'] = response.url
+    result['redirected'] = bool(response.history)
+    result['redirect_offsite'] = site_host(response.url) != site_host(url)
+    result['tls_valid'] = tls_valid if response.url.startswith('https://') else None
+    result['alive'] = response.status_code < 400
+    return result
+
+
+class LivenessCache:
+    """URL check results with a time-to-live, persisted as JSON"""
+
+    def __init__(self, cache_file=CACHE_FILE, ttl=CACHE_TTL):
+        self.cache_file = Path(cache_file)
+        self.ttl = ttl
+        self.entries = {}
+        if self.cache_file.exists():
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def get(self, url, now=None):
+        """Cached result if it is still fresh"""
+        entry = self.entries.get(url)
+        now = time.time() if now is None else now
+        if entry and now - entry['checked_at'] < self.ttl:
+            return entry
+        return None
+
+    def put(self, result):
+        self.entries[result['url']] = result
+
+    def save(self):
+        """Write the cache, dropping expired entries"""
+        now = time.time()
+        self.entries = {url: entry for url, entry in self.entries.items() if now - entry['checked_at'] < self.ttl}
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_file.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f)
+        os.replace(tmp_path, self.cache_file)
+
+
+class WebsiteChecker:
+    """Concurrent website verification with a TTL cache and a time budget
+
+    Requests run on a thread pool driven by asyncio, at most `concurrency` at
+    a time, and share one deadline: each request gets only the time left. URLs
+    still waiting or being checked when the budget runs out are reported as
+    unchecked (and not cached) without waiting for them, so the next run
+    picks them up.
+    """
+
+    def __init__(self, cache_file=CACHE_FILE, ttl=CACHE_TTL, concurrency=CONCURRENCY,
+                 timeout=REQUEST_TIMEOUT, budget=TIME_BUDGET):
+        self.cache = LivenessCache(cache_file, ttl)
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.budget = budget
+
+    async def _check_all(self, urls):
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + self.budget
+        semaphore = asyncio.Semaphore(self.concurrency)
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+
+        async def check(url):
+            async with semaphore:
+                if time.monotonic() >= deadline:
+                    return None
+                return await loop.run_in_executor(executor, check_url, url, self.timeout, deadline)
+
+        tasks = [asyncio.ensure_future(check(url)) for url in urls]
+        try:
+            if tasks:
+                await asyncio.wait(tasks, timeout=max(0, deadline - time.monotonic()))
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Queued checks are dropped; running ones are abandoned, their requests end by the deadline
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        results = {}
+        for url, task in zip(urls, tasks):
+            if task.done() and not task.cancelled() and task.exception() is None and task.result() is not None:
+                results[url] = task.result()
+        return results
+
+    def check(self, urls):
+        """Results for every distinct URL: cached when fresh, checked otherwise
+
+        Returns (results by URL, stats) where stats counts cached, checked and
+        unchecked URLs and the elapsed time.
+        """
+        started = time.perf_counter()
+        urls = list(dict.fromkeys(urls))
+        now = time.time()
+        results = {}
+        pending = []
+        for url in urls:
+            cached = self.cache.get(url, now)
+            if cached:
+                results[url] = cached
+            else:
+                pending.append(url)
+
+        checked = asyncio.run(self._check_all(pending)) if pending else {}
+        for result in checked.values():
+            self.cache.put(result)
+        results.update(checked)
+        self.cache.save()
+
+        stats = {
+            'urls': len(urls),
+            'cached': len(urls) - len(pending),
+            'checked': len(checked),
+            'unchecked': len(pending) - len(checked),
+            'elapsed_seconds': round(time.perf_counter() - started, 2)
+        }
+        return results, stats